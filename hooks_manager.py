@@ -7,13 +7,21 @@ Supports both global (~/.claude/settings.json) and project (./.claude/settings.j
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
 import shutil
 import sys
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 __version__ = "1.0.0"
 
@@ -28,6 +36,9 @@ EVENT_TYPES = [
     "SessionStart",
     "SessionEnd",
 ]
+EVENT_TYPES_SET = frozenset(EVENT_TYPES)
+# Lowercased event name -> canonical spelling
+EVENT_TYPES_CI = {e.lower(): e for e in EVENT_TYPES}
 
 # Event type descriptions for help
 EVENT_INFO = {
@@ -52,7 +63,37 @@ class Colors:
     RESET = "\033[0m"
 
 
-@dataclass
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any, compact: bool = False) -> bytes:
+    """Serialize data as UTF-8 JSON, using orjson when it is installed.
+
+    Output is indented by two spaces unless compact is set.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=1024)
+def _norm(name: str) -> str:
+    """Casefold a hook or event name; names repeat heavily, so results are cached."""
+    return name.casefold()
+
+
+# slots=True requires Python 3.10+; older interpreters fall back to __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class HookInfo:
     """Represents a single hook with metadata."""
     name: str
@@ -61,6 +102,9 @@ class HookInfo:
     matcher: str
     commands: List[dict] = field(default_factory=list)
     raw: dict = field(default_factory=dict)
+    norm_name: str = ''
+    norm_event: str = ''
+    index: int = -1
 
 
 @dataclass
@@ -88,11 +132,33 @@ class ExtensionsData:
     hooks: List[HookInfo] = field(default_factory=list)
 
 
+@lru_cache(maxsize=None)
+def _home_claude_dir() -> Path:
+    """Return ~/.claude, resolving the home directory once per process."""
+    return Path.home() / ".claude"
+
+
+@lru_cache(maxsize=None)
+def _skill_patterns() -> Tuple[re.Pattern, re.Pattern, re.Pattern]:
+    """Compile the SKILL.md name, description and triggers patterns on first use.
+
+    Each field is found by one C-level scan instead of a per-line Python loop.
+    Lines are matched as if stripped: the first "# " header is the name, the first
+    non-blank line not starting with "#" (or Triggers:) is the description, and
+    the last Triggers: line wins.
+    """
+    return (
+        re.compile(r"^[^\S\n]*# [^\S\n]*(\S[^\n]*)", re.MULTILINE),
+        re.compile(r"^[^\S\n]*(?![Tt]riggers:)([^#\s][^\n]*)", re.MULTILINE),
+        re.compile(r"^[^\S\n]*[Tt]riggers:([^\n]*)", re.MULTILINE),
+    )
+
+
 class ExtensionScanner:
     """Scans for Claude Code extensions (skills, commands, hooks)."""
 
     def __init__(self, settings_path: Optional[Path] = None):
-        self.claude_dir = Path.home() / ".claude"
+        self.claude_dir = _home_claude_dir()
         self.settings_path = settings_path or self.claude_dir / "settings.json"
 
     def scan_skills(self) -> List[SkillInfo]:
@@ -100,20 +166,22 @@ class ExtensionScanner:
         skills = []
         skills_dir = self.claude_dir / "skills"
 
-        if not skills_dir.exists():
+        # DirEntry.is_dir() answers from the directory listing's d_type, so only
+        # symlinked entries cost a stat (and are still followed, like Path.is_dir)
+        try:
+            with os.scandir(skills_dir) as entries:
+                skill_dirs = [entry for entry in entries if entry.is_dir()]
+        except OSError:
             return skills
 
-        for skill_path in skills_dir.iterdir():
-            if not skill_path.is_dir():
-                continue
-
-            skill_file = skill_path / "SKILL.md"
+        for entry in skill_dirs:
+            skill_file = Path(entry.path, "SKILL.md")
             if not skill_file.exists():
                 continue
 
             name, description, triggers = self._parse_skill_file(skill_file)
             skills.append(SkillInfo(
-                name=name or skill_path.name,
+                name=name or entry.name,
                 description=description,
                 triggers=triggers,
                 path=skill_file
@@ -129,17 +197,17 @@ class ExtensionScanner:
 
         try:
             content = skill_file.read_text(encoding='utf-8')
-            lines = content.split('\n')
-
-            for line in lines:
-                line = line.strip()
-                if line.startswith('# ') and not name:
-                    name = line[2:].strip()
-                elif line.startswith('Triggers:') or line.startswith('triggers:'):
-                    trigger_text = line.split(':', 1)[1].strip()
-                    triggers = [t.strip() for t in trigger_text.split(',') if t.strip()]
-                elif not description and line and not line.startswith('#'):
-                    description = line
+            name_re, desc_re, triggers_re = _skill_patterns()
+
+            match = name_re.search(content)
+            if match:
+                name = match[1].rstrip()
+            match = desc_re.search(content)
+            if match:
+                description = match[1].rstrip()
+            trigger_lines = triggers_re.findall(content)
+            if trigger_lines:
+                triggers = [t.strip() for t in trigger_lines[-1].split(',') if t.strip()]
 
         except Exception:
             pass
@@ -151,10 +219,18 @@ class ExtensionScanner:
         commands = []
         commands_dir = self.claude_dir / "commands"
 
-        if not commands_dir.exists():
+        # One listing, a plain suffix check and d_type for is_file(); Path objects
+        # are only built for the entries that survive
+        try:
+            with os.scandir(commands_dir) as entries:
+                cmd_paths = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                ]
+        except OSError:
             return commands
 
-        for cmd_path in commands_dir.glob("*.md"):
+        for cmd_path in cmd_paths:
             name, description = self._parse_command_file(cmd_path)
             commands.append(CommandInfo(
                 name=name or cmd_path.stem,
@@ -190,13 +266,11 @@ class ExtensionScanner:
         """Scan settings.json for hook definitions."""
         hooks = []
 
-        if not self.settings_path.exists():
-            return hooks
-
+        # A missing file is just another OSError; orjson's decode error subclasses
+        # json.JSONDecodeError, so one except covers both parsers
         try:
-            with open(self.settings_path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-        except (json.JSONDecodeError, IOError):
+            settings = _json_loads(self.settings_path.read_bytes())
+        except (json.JSONDecodeError, OSError):
             return hooks
 
         # Enabled hooks
@@ -210,7 +284,7 @@ class ExtensionScanner:
                     event=event,
                     enabled=True,
                     matcher=hook.get("matcher", "*"),
-                    commands=hook.get("hooks", []),
+                    commands=hook.get("hooks") or [],
                     raw=hook
                 ))
 
@@ -225,7 +299,7 @@ class ExtensionScanner:
                     event=event,
                     enabled=False,
                     matcher=hook.get("matcher", "*"),
-                    commands=hook.get("hooks", []),
+                    commands=hook.get("hooks") or [],
                     raw=hook
                 ))
 
@@ -245,76 +319,184 @@ class HooksManager:
 
     def __init__(self, args: argparse.Namespace):
         self.args = args
+        # Resolve common flags once rather than on every access
+        self.dry_run = getattr(args, 'dry_run', False)
+        self.quiet = getattr(args, 'quiet', False)
+        self.json_out = getattr(args, 'json', False)
+        self.force = getattr(args, 'force', False)
+        self.no_color = getattr(args, 'no_color', False)
+        self.no_backup = getattr(args, 'no_backup', False)
+        self.is_stdin_tty = sys.stdin.isatty()
+        self.is_stdout_tty = sys.stdout.isatty()
+        # Set to "project" when _resolve_settings_path picks ./.claude
+        self.scope = "global"
+        self._all_hooks_cache: Optional[List[HookInfo]] = None
+        self._by_name: Optional[Dict[str, List[HookInfo]]] = None
+        self._by_event_name: Optional[Dict[Tuple[str, str], List[HookInfo]]] = None
+        # (path, blake2b digest) of the settings bytes last read or written
+        self._settings_digest: Optional[Tuple[Path, bytes]] = None
         self.use_color = self._should_use_color()
-        self.settings_path = self._resolve_settings_path()
-        self.settings = self._load_settings()
+
+    @cached_property
+    def settings_path(self) -> Path:
+        """Path of the settings.json in use, resolved on first access."""
+        return self._resolve_settings_path()
+
+    @cached_property
+    def settings(self) -> dict:
+        """Parsed settings, loaded on first access."""
+        return self._load_settings()
 
     def _should_use_color(self) -> bool:
         """Determine if color output should be used."""
-        if getattr(self.args, 'no_color', False):
+        if self.no_color:
             return False
         # Auto-detect: color if stdout is a TTY
-        return sys.stdout.isatty()
-
-    def _color(self, text: str, color: str) -> str:
-        """Apply color to text if colors are enabled."""
-        if self.use_color:
-            return f"{color}{text}{Colors.RESET}"
+        return self.is_stdout_tty
+
+    @property
+    def use_color(self) -> bool:
+        """Whether output is colorized."""
+        return self._use_color
+
+    @use_color.setter
+    def use_color(self, value: bool) -> None:
+        # Bind _color once so callers never re-check the flag
+        self._use_color = value
+        self._color = self._color_on if value else self._color_off
+
+    @staticmethod
+    def _color_on(text: str, color: str) -> str:
+        """Wrap text in the given color code."""
+        return f"{color}{text}{Colors.RESET}"
+
+    @staticmethod
+    def _color_off(text: str, color: str) -> str:
+        """Return text unchanged when colors are disabled."""
         return text
 
     def _resolve_settings_path(self) -> Path:
         """Determine which settings.json to use."""
-        global_path = Path.home() / ".claude" / "settings.json"
+        global_path = _home_claude_dir() / "settings.json"
         project_path = Path.cwd() / ".claude" / "settings.json"
 
         if getattr(self.args, 'global_scope', False):
-            return global_path
+            chosen = global_path
         elif getattr(self.args, 'project_scope', False):
-            return project_path
-        else:
+            chosen = project_path
+        elif project_path.exists():
             # Auto-detect: project if exists, else global
-            if project_path.exists():
-                return project_path
-            return global_path
+            chosen = project_path
+        else:
+            chosen = global_path
+
+        self.scope = "project" if chosen == project_path else "global"
+        return chosen
 
     def _load_settings(self) -> dict:
         """Load settings.json, return empty dict structure if missing."""
-        if not self.settings_path.exists():
+        try:
+            data = self.settings_path.read_bytes()
+        except FileNotFoundError:
             return {"hooks": {}, "_disabled_hooks": {}}
 
         try:
-            with open(self.settings_path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-                # Ensure required keys exist
-                if "hooks" not in settings:
-                    settings["hooks"] = {}
-                if "_disabled_hooks" not in settings:
-                    settings["_disabled_hooks"] = {}
-                return settings
+            settings = _json_loads(data)
+            self._settings_digest = (self.settings_path, hashlib.blake2b(data).digest())
+            # Ensure required keys exist
+            if "hooks" not in settings:
+                settings["hooks"] = {}
+            if "_disabled_hooks" not in settings:
+                settings["_disabled_hooks"] = {}
+            return settings
         except json.JSONDecodeError as e:
             self._error(f"Invalid JSON in {self.settings_path}: {e}")
             sys.exit(1)
 
     def _save_settings(self) -> None:
         """Save settings.json with pretty formatting."""
-        if getattr(self.args, 'dry_run', False):
-            return
+        self._invalidate_hooks()
 
-        # Create backup unless disabled
-        if not getattr(self.args, 'no_backup', False) and self.settings_path.exists():
-            backup_path = self.settings_path.with_suffix('.json.bak')
-            shutil.copy2(self.settings_path, backup_path)
-
-        # Ensure parent directory exists
-        self.settings_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.dry_run:
+            return
 
         # Clean up empty _disabled_hooks
         if not self.settings.get("_disabled_hooks"):
             self.settings.pop("_disabled_hooks", None)
 
-        with open(self.settings_path, 'w', encoding='utf-8') as f:
-            json.dump(self.settings, f, indent=2, ensure_ascii=False)
-            f.write('\n')
+        data = _json_dumps(self.settings) + b'\n'
+        digest = (self.settings_path, hashlib.blake2b(data).digest())
+        if digest == self._settings_digest:
+            # Nothing changed on disk; skip the write and the backup
+            return
+
+        # Write through a symlinked settings.json to the file it points at
+        target = self.settings_path.resolve()
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file first so a crash never leaves a truncated settings.json
+        tmp_path = target.with_name(target.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            if target.exists():
+                shutil.copymode(target, tmp_path)
+                if not self.no_backup:
+                    self._backup_settings(target)
+
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+        self._settings_digest = digest
+
+    def _backup_settings(self, target: Path) -> None:
+        """Keep the current contents of target as settings.json.bak."""
+        backup_path = self.settings_path.with_suffix('.json.bak')
+        try:
+            backup_path.unlink()
+        except FileNotFoundError:
+            pass
+        # A hard link keeps the old inode alive once target is replaced;
+        # fall back to a copy across filesystems or where links are refused
+        try:
+            os.link(target, backup_path)
+        except OSError:
+            shutil.copy2(target, backup_path)
+
+    def _pop_hook(self, hooks_dict: dict, hook: HookInfo) -> None:
+        """Remove a hook from hooks_dict[hook.event], dropping the event if empty."""
+        event_hooks = hooks_dict.get(hook.event)
+        if not event_hooks:
+            return
+
+        if 0 <= hook.index < len(event_hooks) and event_hooks[hook.index] is hook.raw:
+            event_hooks.pop(hook.index)
+        else:
+            # Stale index: fall back to matching by name
+            for i, h in enumerate(event_hooks):
+                if self._get_hook_name(h, hook.event, i) == hook.name:
+                    event_hooks.pop(i)
+                    break
+
+        if not event_hooks:
+            del hooks_dict[hook.event]
+
+    @staticmethod
+    def _merge_hook_lists(target: dict, new: dict) -> None:
+        """Append each event's hooks in new to target[event]."""
+        if not target:
+            # Nothing to merge with: copy the lists across in one step
+            target.update((event, list(event_hooks)) for event, event_hooks in new.items())
+            return
+        for event, event_hooks in new.items():
+            target.setdefault(event, []).extend(event_hooks)
 
     def _get_hook_name(self, hook: dict, event: str, index: int) -> str:
         """Get or generate a hook name."""
@@ -325,63 +507,76 @@ class HooksManager:
 
     def _normalize_name(self, name: str) -> str:
         """Normalize hook name for case-insensitive comparison."""
-        return name.lower()
+        return _norm(name)
+
+    def _invalidate_hooks(self) -> None:
+        """Drop the cached hook list and name index after settings are modified."""
+        self._all_hooks_cache = None
+        self._by_name = None
+        self._by_event_name = None
 
     def _find_all_hooks(self) -> List[HookInfo]:
-        """Find all hooks (enabled and disabled)."""
-        hooks = []
+        """Find all hooks (enabled and disabled).
+
+        The result is cached until the settings are modified.
+        """
+        if self._all_hooks_cache is not None:
+            return self._all_hooks_cache
+
+        hooks: List[HookInfo] = []
+        # Local aliases keep attribute lookups out of the inner loop
+        append = hooks.append
+        get_name = self._get_hook_name
+        sections = (
+            (True, self.settings.get("hooks", {})),
+            (False, self.settings.get("_disabled_hooks", {})),
+        )
 
-        # Enabled hooks
-        for event, event_hooks in self.settings.get("hooks", {}).items():
-            if not isinstance(event_hooks, list):
-                continue
-            for idx, hook in enumerate(event_hooks):
-                name = self._get_hook_name(hook, event, idx)
-                matcher = hook.get("matcher", "*")
-                commands = hook.get("hooks", [])
-                hooks.append(HookInfo(
-                    name=name,
-                    event=event,
-                    enabled=True,
-                    matcher=matcher,
-                    commands=commands,
-                    raw=hook
-                ))
+        for enabled, section in sections:
+            for event, event_hooks in section.items():
+                if not isinstance(event_hooks, list):
+                    continue
+                norm_event = _norm(event)
+                for idx, hook in enumerate(event_hooks):
+                    name = get_name(hook, event, idx)
+                    append(HookInfo(
+                        name=name,
+                        event=event,
+                        enabled=enabled,
+                        matcher=hook.get("matcher", "*"),
+                        commands=hook.get("hooks") or [],
+                        raw=hook,
+                        norm_name=_norm(name),
+                        norm_event=norm_event,
+                        index=idx
+                    ))
+
+        self._all_hooks_cache = hooks
+        return hooks
 
-        # Disabled hooks
-        for event, event_hooks in self.settings.get("_disabled_hooks", {}).items():
-            if not isinstance(event_hooks, list):
-                continue
-            for idx, hook in enumerate(event_hooks):
-                name = self._get_hook_name(hook, event, idx)
-                matcher = hook.get("matcher", "*")
-                commands = hook.get("hooks", [])
-                hooks.append(HookInfo(
-                    name=name,
-                    event=event,
-                    enabled=False,
-                    matcher=matcher,
-                    commands=commands,
-                    raw=hook
-                ))
+    def _build_hook_index(self) -> None:
+        """Index all hooks by normalized name and by (event, name)."""
+        by_name: Dict[str, List[HookInfo]] = {}
+        by_event_name: Dict[Tuple[str, str], List[HookInfo]] = {}
 
-        return hooks
+        for h in self._find_all_hooks():
+            by_name.setdefault(h.norm_name, []).append(h)
+            by_event_name.setdefault((h.norm_event, h.norm_name), []).append(h)
+
+        self._by_name = by_name
+        self._by_event_name = by_event_name
 
     def _find_hooks_by_name(self, name: str) -> List[HookInfo]:
         """Find hooks matching the given name (case-insensitive)."""
-        all_hooks = self._find_all_hooks()
-        normalized = self._normalize_name(name)
+        if self._by_name is None or self._by_event_name is None:
+            self._build_hook_index()
 
         # Check if name includes event prefix (e.g., "PostToolUse:lint")
-        if ":" in name:
-            event_part, name_part = name.split(":", 1)
-            normalized_event = self._normalize_name(event_part)
-            normalized_name = self._normalize_name(name_part)
-            return [h for h in all_hooks
-                    if self._normalize_name(h.name) == normalized_name
-                    and self._normalize_name(h.event) == normalized_event]
+        event_part, sep, name_part = name.partition(":")
+        if sep:
+            return self._by_event_name.get((_norm(event_part), _norm(name_part)), [])
 
-        return [h for h in all_hooks if self._normalize_name(h.name) == normalized]
+        return self._by_name.get(_norm(name), [])
 
     def _resolve_hook(self, name: str) -> Optional[HookInfo]:
         """Resolve a hook name to a single hook, handling disambiguation."""
@@ -396,7 +591,7 @@ class HooksManager:
             return matches[0]
 
         # Multiple matches - need disambiguation
-        if getattr(self.args, 'force', False) or not sys.stdin.isatty():
+        if self.force or not self.is_stdin_tty:
             # Non-interactive: error with list
             self._error(f"Multiple hooks named '{name}' found. Specify event type:")
             for h in matches:
@@ -436,19 +631,19 @@ class HooksManager:
 
     def _success(self, message: str) -> None:
         """Print success message."""
-        if not getattr(self.args, 'quiet', False):
+        if not self.quiet:
             print(self._color(message, Colors.GREEN))
 
     def _info(self, message: str) -> None:
         """Print info message."""
-        if not getattr(self.args, 'quiet', False):
+        if not self.quiet:
             print(message)
 
     def _confirm(self, message: str) -> bool:
         """Ask for user confirmation."""
-        if getattr(self.args, 'force', False):
+        if self.force:
             return True
-        if not sys.stdin.isatty():
+        if not self.is_stdin_tty:
             self._error("Confirmation required. Use --force to skip.")
             return False
 
@@ -460,7 +655,16 @@ class HooksManager:
 
     def _output_json(self, data: Any) -> None:
         """Output data as JSON."""
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        payload = _json_dumps(data) + b'\n'
+        buffer = getattr(sys.stdout, 'buffer', None)
+        encoding = (getattr(sys.stdout, 'encoding', None) or '').lower().replace('-', '')
+        if buffer is not None and encoding == 'utf8':
+            # Write the serialized bytes as-is instead of decoding them for print()
+            sys.stdout.flush()
+            buffer.write(payload)
+            buffer.flush()
+        else:
+            sys.stdout.write(payload.decode('utf-8'))
 
     # ==================== Commands ====================
 
@@ -468,9 +672,9 @@ class HooksManager:
         """List all hooks with their status."""
         hooks = self._find_all_hooks()
 
-        if getattr(self.args, 'json', False):
+        if self.json_out:
             data = {
-                "scope": "project" if "./.claude" in str(self.settings_path) else "global",
+                "scope": self.scope,
                 "path": str(self.settings_path),
                 "hooks": [
                     {
@@ -486,34 +690,37 @@ class HooksManager:
             self._output_json(data)
             return 0
 
-        if getattr(self.args, 'quiet', False):
-            for h in hooks:
-                print(f"{h.event}:{h.name}")
+        if self.quiet:
+            # Scripts read this on large hook sets, so write it in one call
+            sys.stdout.write("".join(f"{h.event}:{h.name}\n" for h in hooks))
             return 0
 
         # Human-readable output
-        scope = "Project" if "./.claude" in str(self.settings_path) else "Global"
-        print(f"{self._color(scope + ' hooks', Colors.BOLD)} ({self.settings_path}):\n")
+        scope = "Project" if self.scope == "project" else "Global"
+        lines = [f"{self._color(scope + ' hooks', Colors.BOLD)} ({self.settings_path}):", ""]
 
         if not hooks:
-            print("  (no hooks configured)")
+            lines.append("  (no hooks configured)")
+            sys.stdout.write("\n".join(lines) + "\n")
             return 0
 
         enabled = [h for h in hooks if h.enabled]
         disabled = [h for h in hooks if not h.enabled]
 
+        # Build the whole listing and write it once instead of a print per hook
         if enabled:
-            print(f"  {self._color('ENABLED:', Colors.GREEN)}")
+            lines.append(f"  {self._color('ENABLED:', Colors.GREEN)}")
             for h in enabled:
-                print(f"    [{h.event}] {self._color(h.name, Colors.BOLD)} (matcher: {h.matcher})")
+                lines.append(f"    [{h.event}] {self._color(h.name, Colors.BOLD)} (matcher: {h.matcher})")
 
         if disabled:
             if enabled:
-                print()
-            print(f"  {self._color('DISABLED:', Colors.YELLOW)}")
+                lines.append("")
+            lines.append(f"  {self._color('DISABLED:', Colors.YELLOW)}")
             for h in disabled:
-                print(f"    [{h.event}] {self._color(h.name, Colors.BOLD)} (matcher: {h.matcher})")
+                lines.append(f"    [{h.event}] {self._color(h.name, Colors.BOLD)} (matcher: {h.matcher})")
 
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0
 
     def cmd_show(self) -> int:
@@ -522,7 +729,7 @@ class HooksManager:
         if not hook:
             return 1
 
-        if getattr(self.args, 'json', False):
+        if self.json_out:
             self._output_json({
                 "name": hook.name,
                 "event": hook.event,
@@ -553,7 +760,7 @@ class HooksManager:
 
     def cmd_events(self) -> int:
         """List available hook event types."""
-        if getattr(self.args, 'json', False):
+        if self.json_out:
             data = [
                 {"event": event, "description": desc, "supports": supports}
                 for event, (desc, supports) in EVENT_INFO.items()
@@ -573,19 +780,21 @@ class HooksManager:
         hooks = self._find_all_hooks()
         issues = []
         warnings = []
+        enabled = 0
 
-        # Check for common issues
+        # Count and check for common issues in a single pass
         for h in hooks:
+            enabled += h.enabled
             if not h.matcher:
                 warnings.append(f"Hook '{h.name}' has no matcher (will match nothing)")
             if not h.commands:
                 warnings.append(f"Hook '{h.name}' has no commands (no-op hook)")
-            if h.event not in EVENT_TYPES:
+            if h.event not in EVENT_TYPES_SET:
                 issues.append(f"Hook '{h.name}' has unknown event type: {h.event}")
 
-        if getattr(self.args, 'json', False):
-            enabled = len([h for h in hooks if h.enabled])
-            disabled = len(hooks) - enabled
+        disabled = len(hooks) - enabled
+
+        if self.json_out:
             self._output_json({
                 "valid": len(issues) == 0,
                 "path": str(self.settings_path),
@@ -598,20 +807,20 @@ class HooksManager:
             return 0 if not issues else 1
 
         # Human-readable output
+        lines = []
         if not issues:
-            print(self._color(f"✓ {self.settings_path} is valid", Colors.GREEN))
+            lines.append(self._color(f"✓ {self.settings_path} is valid", Colors.GREEN))
         else:
-            print(self._color(f"✗ {self.settings_path} has issues:", Colors.RED))
+            lines.append(self._color(f"✗ {self.settings_path} has issues:", Colors.RED))
             for issue in issues:
-                print(f"  {self._color('ERROR:', Colors.RED)} {issue}")
+                lines.append(f"  {self._color('ERROR:', Colors.RED)} {issue}")
 
-        enabled = len([h for h in hooks if h.enabled])
-        disabled = len(hooks) - enabled
-        print(f"✓ {len(hooks)} hooks found ({enabled} enabled, {disabled} disabled)")
+        lines.append(f"✓ {len(hooks)} hooks found ({enabled} enabled, {disabled} disabled)")
 
         for warning in warnings:
-            print(f"  {self._color('⚠ Warning:', Colors.YELLOW)} {warning}")
+            lines.append(f"  {self._color('⚠ Warning:', Colors.YELLOW)} {warning}")
 
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0 if not issues else 1
 
     def cmd_enable(self) -> int:
@@ -625,15 +834,7 @@ class HooksManager:
             return 0
 
         # Move from _disabled_hooks to hooks
-        disabled = self.settings.get("_disabled_hooks", {})
-        if hook.event in disabled:
-            # Find and remove from disabled
-            for i, h in enumerate(disabled[hook.event]):
-                if self._get_hook_name(h, hook.event, i) == hook.name:
-                    disabled[hook.event].pop(i)
-                    if not disabled[hook.event]:
-                        del disabled[hook.event]
-                    break
+        self._pop_hook(self.settings.get("_disabled_hooks", {}), hook)
 
         # Add to enabled hooks
         if "hooks" not in self.settings:
@@ -641,8 +842,9 @@ class HooksManager:
         if hook.event not in self.settings["hooks"]:
             self.settings["hooks"][hook.event] = []
         self.settings["hooks"][hook.event].append(hook.raw)
+        self._invalidate_hooks()
 
-        if getattr(self.args, 'dry_run', False):
+        if self.dry_run:
             self._info(f"Would enable hook '{hook.name}' in {self.settings_path}")
             print("No changes made (dry-run mode)")
             return 0
@@ -662,14 +864,7 @@ class HooksManager:
             return 0
 
         # Move from hooks to _disabled_hooks
-        hooks = self.settings.get("hooks", {})
-        if hook.event in hooks:
-            for i, h in enumerate(hooks[hook.event]):
-                if self._get_hook_name(h, hook.event, i) == hook.name:
-                    hooks[hook.event].pop(i)
-                    if not hooks[hook.event]:
-                        del hooks[hook.event]
-                    break
+        self._pop_hook(self.settings.get("hooks", {}), hook)
 
         # Add to disabled hooks
         if "_disabled_hooks" not in self.settings:
@@ -677,8 +872,9 @@ class HooksManager:
         if hook.event not in self.settings["_disabled_hooks"]:
             self.settings["_disabled_hooks"][hook.event] = []
         self.settings["_disabled_hooks"][hook.event].append(hook.raw)
+        self._invalidate_hooks()
 
-        if getattr(self.args, 'dry_run', False):
+        if self.dry_run:
             self._info(f"Would disable hook '{hook.name}' in {self.settings_path}")
             print("No changes made (dry-run mode)")
             return 0
@@ -696,7 +892,7 @@ class HooksManager:
             self._info("No disabled hooks to enable")
             return 0
 
-        if getattr(self.args, 'dry_run', False):
+        if self.dry_run:
             self._info(f"Would enable {len(disabled_hooks)} hooks:")
             for h in disabled_hooks:
                 print(f"  - {h.event}:{h.name}")
@@ -705,12 +901,7 @@ class HooksManager:
 
         # Move all from _disabled_hooks to hooks
         disabled = self.settings.get("_disabled_hooks", {})
-        for event, event_hooks in list(disabled.items()):
-            if "hooks" not in self.settings:
-                self.settings["hooks"] = {}
-            if event not in self.settings["hooks"]:
-                self.settings["hooks"][event] = []
-            self.settings["hooks"][event].extend(event_hooks)
+        self._merge_hook_lists(self.settings.setdefault("hooks", {}), disabled)
 
         self.settings["_disabled_hooks"] = {}
         self._save_settings()
@@ -730,7 +921,7 @@ class HooksManager:
             print("Cancelled")
             return 0
 
-        if getattr(self.args, 'dry_run', False):
+        if self.dry_run:
             self._info(f"Would disable {len(enabled_hooks)} hooks:")
             for h in enabled_hooks:
                 print(f"  - {h.event}:{h.name}")
@@ -739,12 +930,7 @@ class HooksManager:
 
         # Move all from hooks to _disabled_hooks
         hooks = self.settings.get("hooks", {})
-        for event, event_hooks in list(hooks.items()):
-            if "_disabled_hooks" not in self.settings:
-                self.settings["_disabled_hooks"] = {}
-            if event not in self.settings["_disabled_hooks"]:
-                self.settings["_disabled_hooks"][event] = []
-            self.settings["_disabled_hooks"][event].extend(event_hooks)
+        self._merge_hook_lists(self.settings.setdefault("_disabled_hooks", {}), hooks)
 
         self.settings["hooks"] = {}
         self._save_settings()
@@ -761,22 +947,14 @@ class HooksManager:
             print("Cancelled")
             return 0
 
-        if getattr(self.args, 'dry_run', False):
+        if self.dry_run:
             self._info(f"Would remove hook '{hook.name}' from {self.settings_path}")
             print("No changes made (dry-run mode)")
             return 0
 
         # Find and remove from appropriate location
         source = "hooks" if hook.enabled else "_disabled_hooks"
-        hooks_dict = self.settings.get(source, {})
-
-        if hook.event in hooks_dict:
-            for i, h in enumerate(hooks_dict[hook.event]):
-                if self._get_hook_name(h, hook.event, i) == hook.name:
-                    hooks_dict[hook.event].pop(i)
-                    if not hooks_dict[hook.event]:
-                        del hooks_dict[hook.event]
-                    break
+        self._pop_hook(self.settings.get(source, {}), hook)
 
         self._save_settings()
         self._success(f"Removed hook '{hook.name}' from {self.settings_path}")
@@ -794,7 +972,7 @@ class HooksManager:
             print("Cancelled")
             return 0
 
-        if getattr(self.args, 'dry_run', False):
+        if self.dry_run:
             self._info(f"Would remove {len(all_hooks)} hooks:")
             for h in all_hooks:
                 status = "enabled" if h.enabled else "disabled"
@@ -827,7 +1005,7 @@ class HooksManager:
 
         if not has_params:
             # Interactive mode required
-            if not sys.stdin.isatty():
+            if not self.is_stdin_tty:
                 self._error("Interactive mode requires a terminal. Use --name, --event, --command flags.")
                 return 1
             return self._add_interactive()
@@ -855,11 +1033,7 @@ class HooksManager:
                     return 1
             else:
                 # Match by name (case-insensitive)
-                event = None
-                for e in EVENT_TYPES:
-                    if e.lower() == choice.lower():
-                        event = e
-                        break
+                event = EVENT_TYPES_CI.get(choice.lower())
                 if not event:
                     self._error(f"Unknown event type: {choice}")
                     return 1
@@ -899,12 +1073,7 @@ class HooksManager:
         timeout = getattr(self.args, 'timeout', 60) or 60
 
         # Validate event type (case-insensitive)
-        valid_event = None
-        for e in EVENT_TYPES:
-            if e.lower() == event.lower():
-                valid_event = e
-                break
-
+        valid_event = EVENT_TYPES_CI.get(event.lower())
         if not valid_event:
             self._error(f"Unknown event type: {event}")
             print("Valid event types:")
@@ -934,7 +1103,7 @@ class HooksManager:
             ]
         }
 
-        if getattr(self.args, 'dry_run', False):
+        if self.dry_run:
             self._info(f"Would add hook '{name}' to {self.settings_path}:")
             print(json.dumps(hook_obj, indent=2))
             print("No changes made (dry-run mode)")
@@ -965,18 +1134,16 @@ class HooksManager:
 
         if output_file:
             output_path = Path(output_file)
-            if getattr(self.args, 'dry_run', False):
+            if self.dry_run:
                 self._info(f"Would export {len(hooks)} hooks to {output_path}")
                 print("No changes made (dry-run mode)")
                 return 0
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-                f.write('\n')
+            output_path.write_bytes(_json_dumps(export_data) + b'\n')
             self._success(f"Exported {len(hooks)} hooks to {output_path}")
         else:
             # Output to stdout
-            print(json.dumps(export_data, indent=2, ensure_ascii=False))
+            self._output_json(export_data)
 
         return 0
 
@@ -989,8 +1156,7 @@ class HooksManager:
             return 1
 
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            import_data = _json_loads(import_path.read_bytes())
         except json.JSONDecodeError as e:
             self._error(f"Invalid JSON in {import_path}: {e}")
             return 1
@@ -1015,34 +1181,27 @@ class HooksManager:
             print("Cancelled")
             return 0
 
-        if getattr(self.args, 'dry_run', False):
+        if self.dry_run:
             self._info(f"Would import {count} hooks to {self.settings_path}")
             print("No changes made (dry-run mode)")
             return 0
 
         # Merge hooks
-        for event, event_hooks in new_hooks.items():
-            if "hooks" not in self.settings:
-                self.settings["hooks"] = {}
-            if event not in self.settings["hooks"]:
-                self.settings["hooks"][event] = []
-            self.settings["hooks"][event].extend(event_hooks)
-
-        for event, event_hooks in new_disabled.items():
-            if "_disabled_hooks" not in self.settings:
-                self.settings["_disabled_hooks"] = {}
-            if event not in self.settings["_disabled_hooks"]:
-                self.settings["_disabled_hooks"][event] = []
-            self.settings["_disabled_hooks"][event].extend(event_hooks)
+        self._merge_hook_lists(self.settings.setdefault("hooks", {}), new_hooks)
+        self._merge_hook_lists(self.settings.setdefault("_disabled_hooks", {}), new_disabled)
 
+        # settings.json is hand-edited, so imports keep the indented layout too
         self._save_settings()
         self._success(f"Imported {count} hooks to {self.settings_path}")
         return 0
 
     def cmd_visualize(self) -> int:
         """Visualize all Claude Code extensions."""
-        from renderers import TerminalRenderer, HTMLRenderer, MarkdownRenderer, TUIRenderer
+        import renderers
 
+        # The scanner skips unreadable settings; load them here so a corrupt
+        # settings.json is reported and exits 1 like every other command
+        self.settings
         scanner = ExtensionScanner(self.settings_path)
         data = scanner.scan_all()
 
@@ -1055,40 +1214,131 @@ class HooksManager:
             if output_file:
                 self._error("TUI format does not support file output")
                 return 1
-            renderer = TUIRenderer()
+            renderer = renderers.TUIRenderer()
             renderer.render(data)  # TUI renders directly, doesn't return string
             return 0
         elif output_format == 'html':
-            renderer = HTMLRenderer()
+            renderer = renderers.HTMLRenderer()
             default_output = 'claude-extensions.html'
         elif output_format == 'markdown':
-            renderer = MarkdownRenderer()
+            renderer = renderers.MarkdownRenderer()
             default_output = None
         else:  # terminal
             use_color = self.use_color and not output_file  # No colors when writing to file
-            renderer = TerminalRenderer(use_color=use_color)
+            renderer = renderers.TerminalRenderer(use_color=use_color)
             default_output = None
 
-        output = renderer.render(data)
-
         # Write to file or stdout
         if output_file:
             output_path = Path(output_file)
-            output_path.write_text(output, encoding='utf-8')
+            renderer.render_to_file(data, output_path)
             self._success(f"Visualization written to {output_path}")
         elif output_format == 'html' and default_output:
             # HTML defaults to file output
             output_path = Path(default_output)
-            output_path.write_text(output, encoding='utf-8')
+            renderer.render_to_file(data, output_path)
             self._success(f"HTML report written to {output_path}")
         else:
-            print(output)
+            print(renderer.render(data))
 
         return 0
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser."""
+def _add_name_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('name', help='Hook name (or Event:name)')
+
+
+def _add_add_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--name', dest='hook_name', help='Hook name')
+    parser.add_argument('--event', '-e', help='Event type (e.g., PostToolUse)')
+    parser.add_argument('--matcher', '-m', default='*', help='Matcher pattern (default: *)')
+    parser.add_argument('--command', '-c', dest='hook_command', help='Command to execute')
+    parser.add_argument('--timeout', '-t', type=int, default=60, help='Timeout in seconds (default: 60)')
+
+
+def _add_export_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('file', nargs='?', help='Output file (stdout if not specified)')
+
+
+def _add_import_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('file', help='Input JSON file')
+
+
+def _add_visualize_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--format', '-f', choices=['terminal', 'html', 'markdown', 'tui'],
+                        default='terminal', help='Output format (default: terminal)')
+    parser.add_argument('--output', '-o', dest='output_file',
+                        help='Output file (stdout if not specified)')
+
+
+# Subcommand name -> (help, aliases, function adding its arguments)
+SUBCOMMANDS = {
+    'list': ('List all hooks with status', (), None),
+    'show': ('Show details of a specific hook', (), _add_name_arg),
+    'events': ('List available hook event types', (), None),
+    'validate': ('Validate settings.json syntax', (), None),
+    'enable': ('Enable a disabled hook', (), _add_name_arg),
+    'disable': ('Disable an enabled hook', (), _add_name_arg),
+    'enable-all': ('Enable all disabled hooks', (), None),
+    'disable-all': ('Disable all enabled hooks (requires confirmation)', (), None),
+    'remove': ('Remove a hook permanently', (), _add_name_arg),
+    'remove-all': ('Remove ALL hooks permanently (requires confirmation)', (), None),
+    'add': ('Create a new hook (interactive or with flags)', ('create',), _add_add_args),
+    'export': ('Export hooks to JSON file', (), _add_export_args),
+    'import': ('Import hooks from JSON file', (), _add_import_args),
+    'visualize': ('Visualize all Claude Code extensions', (), _add_visualize_args),
+}
+
+
+# Subcommand name (including aliases) -> HooksManager method that handles it
+COMMAND_METHODS = {
+    'list': 'cmd_list',
+    'show': 'cmd_show',
+    'events': 'cmd_events',
+    'validate': 'cmd_validate',
+    'enable': 'cmd_enable',
+    'disable': 'cmd_disable',
+    'enable-all': 'cmd_enable_all',
+    'disable-all': 'cmd_disable_all',
+    'remove': 'cmd_remove',
+    'remove-all': 'cmd_remove_all',
+    'add': 'cmd_add',
+    'create': 'cmd_add',  # alias for add
+    'export': 'cmd_export',
+    'import': 'cmd_import',
+    'visualize': 'cmd_visualize',
+}
+
+
+def _active_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv, or None if it cannot be determined."""
+    for token in argv:
+        # Global flags are all store_true, so the first positional is the command
+        if token.startswith('-'):
+            continue
+        for name, (_, aliases, _) in SUBCOMMANDS.items():
+            if token == name or token in aliases:
+                return name
+        return None
+    return None
+
+
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Create argument parser.
+
+    When argv is given, only the subcommand it names has its arguments
+    configured; otherwise every subcommand is fully built.
+    """
+    return _build_parser(_active_command(argv) if argv is not None else None)
+
+
+def get_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Like create_parser, but reuse the parser built for the same subcommand."""
+    return _cached_parser(_active_command(argv) if argv is not None else None)
+
+
+def _build_parser(active: Optional[str]) -> argparse.ArgumentParser:
+    """Build the parser, configuring only the active subcommand (all if None)."""
     parser = argparse.ArgumentParser(
         prog="hooks_manager",
         description="Manage Claude Code hooks - enable, disable, list, and more.",
@@ -1128,70 +1378,24 @@ Examples:
 
     subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
 
-    # list
-    subparsers.add_parser('list', help='List all hooks with status')
-
-    # show
-    show_parser = subparsers.add_parser('show', help='Show details of a specific hook')
-    show_parser.add_argument('name', help='Hook name (or Event:name)')
-
-    # events
-    subparsers.add_parser('events', help='List available hook event types')
-
-    # validate
-    subparsers.add_parser('validate', help='Validate settings.json syntax')
-
-    # enable
-    enable_parser = subparsers.add_parser('enable', help='Enable a disabled hook')
-    enable_parser.add_argument('name', help='Hook name (or Event:name)')
-
-    # disable
-    disable_parser = subparsers.add_parser('disable', help='Disable an enabled hook')
-    disable_parser.add_argument('name', help='Hook name (or Event:name)')
+    # Every subcommand is registered so help and choices stay complete, but only
+    # the one named in argv gets its arguments configured
+    for name, (help_text, aliases, add_args) in SUBCOMMANDS.items():
+        sub_parser = subparsers.add_parser(name, aliases=list(aliases), help=help_text)
+        if add_args is not None and active in (None, name):
+            add_args(sub_parser)
 
-    # enable-all
-    subparsers.add_parser('enable-all', help='Enable all disabled hooks')
-
-    # disable-all
-    subparsers.add_parser('disable-all', help='Disable all enabled hooks (requires confirmation)')
-
-    # remove
-    remove_parser = subparsers.add_parser('remove', help='Remove a hook permanently')
-    remove_parser.add_argument('name', help='Hook name (or Event:name)')
-
-    # remove-all
-    subparsers.add_parser('remove-all', help='Remove ALL hooks permanently (requires confirmation)')
-
-    # add / create (aliases)
-    add_parser = subparsers.add_parser('add', aliases=['create'], help='Create a new hook (interactive or with flags)')
-    add_parser.add_argument('--name', dest='hook_name', help='Hook name')
-    add_parser.add_argument('--event', '-e', help='Event type (e.g., PostToolUse)')
-    add_parser.add_argument('--matcher', '-m', default='*', help='Matcher pattern (default: *)')
-    add_parser.add_argument('--command', '-c', dest='hook_command', help='Command to execute')
-    add_parser.add_argument('--timeout', '-t', type=int, default=60, help='Timeout in seconds (default: 60)')
-
-    # export
-    export_parser = subparsers.add_parser('export', help='Export hooks to JSON file')
-    export_parser.add_argument('file', nargs='?', help='Output file (stdout if not specified)')
-
-    # import
-    import_parser = subparsers.add_parser('import', help='Import hooks from JSON file')
-    import_parser.add_argument('file', help='Input JSON file')
+    return parser
 
-    # visualize
-    viz_parser = subparsers.add_parser('visualize', help='Visualize all Claude Code extensions')
-    viz_parser.add_argument('--format', '-f', choices=['terminal', 'html', 'markdown', 'tui'],
-                           default='terminal', help='Output format (default: terminal)')
-    viz_parser.add_argument('--output', '-o', dest='output_file',
-                           help='Output file (stdout if not specified)')
 
-    return parser
+_cached_parser = lru_cache(maxsize=None)(_build_parser)
 
 
 def main() -> int:
     """Main entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    parser = get_parser(argv)
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -1200,30 +1404,11 @@ def main() -> int:
     manager = HooksManager(args)
 
     # Route to command handler
-    commands = {
-        'list': manager.cmd_list,
-        'show': manager.cmd_show,
-        'events': manager.cmd_events,
-        'validate': manager.cmd_validate,
-        'enable': manager.cmd_enable,
-        'disable': manager.cmd_disable,
-        'enable-all': manager.cmd_enable_all,
-        'disable-all': manager.cmd_disable_all,
-        'remove': manager.cmd_remove,
-        'remove-all': manager.cmd_remove_all,
-        'add': manager.cmd_add,
-        'create': manager.cmd_add,  # alias for add
-        'export': manager.cmd_export,
-        'import': manager.cmd_import,
-        'visualize': manager.cmd_visualize,
-    }
-
-    handler = commands.get(args.command)
-    if handler:
-        return handler()
-    else:
+    method = COMMAND_METHODS.get(args.command)
+    if method is None:
         parser.print_help()
         return 1
+    return getattr(manager, method)()
 
 
 if __name__ == '__main__':
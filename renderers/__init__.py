@@ -1,9 +1,27 @@
 """Renderers for visualizing Claude Code extensions."""
 
-from .base import BaseRenderer
-from .terminal import TerminalRenderer
-from .html import HTMLRenderer
-from .markdown import MarkdownRenderer
-from .tui import TUIRenderer
+from importlib import import_module
 
-__all__ = ["BaseRenderer", "TerminalRenderer", "HTMLRenderer", "MarkdownRenderer", "TUIRenderer"]
+# Renderer class -> submodule defining it; submodules are imported on first access
+_LAZY = {
+    "BaseRenderer": ".base",
+    "TerminalRenderer": ".terminal",
+    "HTMLRenderer": ".html",
+    "MarkdownRenderer": ".markdown",
+    "TUIRenderer": ".tui",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(import_module(module, __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
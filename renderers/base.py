@@ -2,10 +2,8 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from hooks_manager import ExtensionsData
 
 
@@ -27,6 +25,20 @@ class BaseRenderer(ABC):
         """
         pass
 
+    def render_stream(self, data: ExtensionsData) -> Iterator[str]:
+        """Render extensions data as a sequence of string chunks.
+
+        Subclasses can override this to avoid building the whole output in
+        memory; the default yields the result of render().
+
+        Args:
+            data: ExtensionsData containing skills, commands, and hooks.
+
+        Yields:
+            Consecutive pieces of the rendered output.
+        """
+        yield self.render(data)
+
     def render_to_file(self, data: ExtensionsData, output_path: Path) -> None:
         """Render extensions data to a file.
 
@@ -34,5 +46,5 @@ class BaseRenderer(ABC):
             data: ExtensionsData containing skills, commands, and hooks.
             output_path: Path to write the output.
         """
-        content = self.render(data)
-        output_path.write_text(content, encoding='utf-8')
+        with output_path.open('w', encoding='utf-8', buffering=64 * 1024) as f:
+            f.writelines(self.render_stream(data))
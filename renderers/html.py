@@ -1,194 +1,12 @@
 """HTML renderer for standalone visualization with embedded CSS."""
 
-from pathlib import Path
-from typing import List
-import html
+from typing import Iterator
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from hooks_manager import ExtensionsData, SkillInfo, CommandInfo, HookInfo
 from .base import BaseRenderer
 
 
-class HTMLRenderer(BaseRenderer):
-    """Renders extensions as a standalone HTML document with embedded CSS."""
-
-    def __init__(self, use_color: bool = True):
-        super().__init__(use_color)
-
-    def render(self, data: ExtensionsData) -> str:
-        """Render extensions data as an HTML document."""
-        skills_html = self._render_skills_section(data.skills)
-        commands_html = self._render_commands_section(data.commands)
-        hooks_html = self._render_hooks_section(data.hooks)
-
-        return self._generate_document(skills_html, commands_html, hooks_html, data)
-
-    def _escape(self, text: str) -> str:
-        """Escape HTML special characters."""
-        return html.escape(str(text))
-
-    def _render_skills_section(self, skills: List[SkillInfo]) -> str:
-        """Render the skills section."""
-        if not skills:
-            return '<p class="empty">No skills configured</p>'
-
-        items = []
-        for skill in skills:
-            triggers_html = ""
-            if skill.triggers:
-                triggers = ", ".join(self._escape(t) for t in skill.triggers)
-                triggers_html = f'<div class="item-meta"><span class="label">Triggers:</span> {triggers}</div>'
-
-            desc_html = ""
-            if skill.description:
-                desc_html = f'<div class="item-desc">{self._escape(skill.description)}</div>'
-
-            items.append(f'''
-            <div class="item">
-                <div class="item-header">
-                    <span class="item-name">{self._escape(skill.name)}</span>
-                </div>
-                {desc_html}
-                {triggers_html}
-                <div class="item-meta"><span class="label">Path:</span> <code>{self._escape(str(skill.path))}</code></div>
-            </div>
-            ''')
-
-        return "\n".join(items)
-
-    def _render_commands_section(self, commands: List[CommandInfo]) -> str:
-        """Render the commands section."""
-        if not commands:
-            return '<p class="empty">No commands configured</p>'
-
-        items = []
-        for cmd in commands:
-            desc_html = ""
-            if cmd.description:
-                desc_html = f'<div class="item-desc">{self._escape(cmd.description)}</div>'
-
-            items.append(f'''
-            <div class="item">
-                <div class="item-header">
-                    <span class="item-name command-name">/{self._escape(cmd.name)}</span>
-                </div>
-                {desc_html}
-                <div class="item-meta"><span class="label">Path:</span> <code>{self._escape(str(cmd.path))}</code></div>
-            </div>
-            ''')
-
-        return "\n".join(items)
-
-    def _render_hooks_section(self, hooks: List[HookInfo]) -> str:
-        """Render the hooks section."""
-        if not hooks:
-            return '<p class="empty">No hooks configured</p>'
-
-        items = []
-        for hook in hooks:
-            status_class = "status-enabled" if hook.enabled else "status-disabled"
-            status_text = "enabled" if hook.enabled else "disabled"
-
-            cmd_count = len(hook.commands) if hook.commands else 0
-            cmd_text = f"{cmd_count} command{'s' if cmd_count != 1 else ''}"
-
-            items.append(f'''
-            <div class="item hook-item">
-                <div class="item-header">
-                    <span class="item-name">{self._escape(hook.name)}</span>
-                    <span class="status-badge {status_class}">{status_text}</span>
-                </div>
-                <div class="item-meta"><span class="label">Event:</span> <span class="event-type">{self._escape(hook.event)}</span></div>
-                <div class="item-meta"><span class="label">Matcher:</span> <code>{self._escape(hook.matcher)}</code></div>
-                <div class="item-meta"><span class="label">Commands:</span> {cmd_text}</div>
-            </div>
-            ''')
-
-        return "\n".join(items)
-
-    def _generate_document(self, skills_html: str, commands_html: str,
-                          hooks_html: str, data: ExtensionsData) -> str:
-        """Generate the complete HTML document."""
-        skills_count = len(data.skills)
-        commands_count = len(data.commands)
-        hooks_count = len(data.hooks)
-
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Claude Code Extensions</title>
-    <style>
-{self._get_css()}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>Claude Code Extensions</h1>
-            <p class="subtitle">Skills, Commands, and Hooks Overview</p>
-        </header>
-
-        <main>
-            <section class="collapsible">
-                <button class="section-header" onclick="toggleSection(this)" aria-expanded="true">
-                    <span class="section-icon">▼</span>
-                    <span class="section-title">Skills</span>
-                    <span class="section-count">{skills_count}</span>
-                </button>
-                <div class="section-content">
-                    {skills_html}
-                </div>
-            </section>
-
-            <section class="collapsible">
-                <button class="section-header" onclick="toggleSection(this)" aria-expanded="true">
-                    <span class="section-icon">▼</span>
-                    <span class="section-title">Commands</span>
-                    <span class="section-count">{commands_count}</span>
-                </button>
-                <div class="section-content">
-                    {commands_html}
-                </div>
-            </section>
-
-            <section class="collapsible">
-                <button class="section-header" onclick="toggleSection(this)" aria-expanded="true">
-                    <span class="section-icon">▼</span>
-                    <span class="section-title">Hooks</span>
-                    <span class="section-count">{hooks_count}</span>
-                </button>
-                <div class="section-content">
-                    {hooks_html}
-                </div>
-            </section>
-        </main>
-
-        <footer>
-            <p>Generated by Claude Code Hooks Manager</p>
-        </footer>
-    </div>
-
-    <script>
-        function toggleSection(button) {{
-            const section = button.parentElement;
-            const content = section.querySelector('.section-content');
-            const icon = button.querySelector('.section-icon');
-            const isExpanded = button.getAttribute('aria-expanded') === 'true';
-
-            button.setAttribute('aria-expanded', !isExpanded);
-            content.style.display = isExpanded ? 'none' : 'block';
-            icon.textContent = isExpanded ? '▶' : '▼';
-        }}
-    </script>
-</body>
-</html>'''
-
-    def _get_css(self) -> str:
-        """Return the embedded CSS styles."""
-        return '''
+_EMBEDDED_CSS = '''
         :root {
             --bg-primary: #1a1b26;
             --bg-secondary: #24283b;
@@ -437,3 +255,195 @@ class HTMLRenderer(BaseRenderer):
             }
         }
 '''
+
+# Static parts of the document around the three sections
+_HTML_PRELUDE_TMPL = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Claude Code Extensions</title>
+    <style>
+{css}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>Claude Code Extensions</h1>
+            <p class="subtitle">Skills, Commands, and Hooks Overview</p>
+        </header>
+
+        <main>
+'''
+_HTML_PRELUDE = _HTML_PRELUDE_TMPL.format(css=_EMBEDDED_CSS)
+
+_HTML_POSTLUDE = '''        </main>
+
+        <footer>
+            <p>Generated by Claude Code Hooks Manager</p>
+        </footer>
+    </div>
+
+    <script>
+        function toggleSection(button) {
+            const section = button.parentElement;
+            const content = section.querySelector('.section-content');
+            const icon = button.querySelector('.section-icon');
+            const isExpanded = button.getAttribute('aria-expanded') === 'true';
+
+            button.setAttribute('aria-expanded', !isExpanded);
+            content.style.display = isExpanded ? 'none' : 'block';
+            icon.textContent = isExpanded ? '▶' : '▼';
+        }
+    </script>
+</body>
+</html>'''
+
+
+# Single-pass equivalent of html.escape(text, quote=True)
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+# Per-item markup, formatted once per skill/command/hook
+_DESC_TMPL = '<div class="item-desc">{desc}</div>'
+_TRIGGERS_TMPL = '<div class="item-meta"><span class="label">Triggers:</span> {triggers}</div>'
+
+_SKILL_TMPL = '''
+            <div class="item">
+                <div class="item-header">
+                    <span class="item-name">{name}</span>
+                </div>
+                {desc}
+                {triggers}
+                <div class="item-meta"><span class="label">Path:</span> <code>{path}</code></div>
+            </div>
+            '''
+
+_COMMAND_TMPL = '''
+            <div class="item">
+                <div class="item-header">
+                    <span class="item-name command-name">/{name}</span>
+                </div>
+                {desc}
+                <div class="item-meta"><span class="label">Path:</span> <code>{path}</code></div>
+            </div>
+            '''
+
+_HOOK_TMPL = '''
+            <div class="item hook-item">
+                <div class="item-header">
+                    <span class="item-name">{name}</span>
+                    <span class="status-badge {status_class}">{status_text}</span>
+                </div>
+                <div class="item-meta"><span class="label">Event:</span> <span class="event-type">{event}</span></div>
+                <div class="item-meta"><span class="label">Matcher:</span> <code>{matcher}</code></div>
+                <div class="item-meta"><span class="label">Commands:</span> {cmd_text}</div>
+            </div>
+            '''
+
+
+class HTMLRenderer(BaseRenderer):
+    """Renders extensions as a standalone HTML document with embedded CSS."""
+
+    def __init__(self, use_color: bool = True):
+        super().__init__(use_color)
+
+    def render(self, data: ExtensionsData) -> str:
+        """Render extensions data as an HTML document."""
+        return "".join(self.render_stream(data))
+
+    def render_stream(self, data: ExtensionsData) -> Iterator[str]:
+        """Yield the HTML document in chunks, one per item."""
+        sections = [
+            ("Skills", data.skills, self._render_skill, "No skills configured"),
+            ("Commands", data.commands, self._render_command, "No commands configured"),
+            ("Hooks", data.hooks, self._render_hook, "No hooks configured"),
+        ]
+
+        yield self._document_head()
+
+        for i, (title, items, render_item, empty_text) in enumerate(sections):
+            if i:
+                yield "\n"
+            yield f'''            <section class="collapsible">
+                <button class="section-header" onclick="toggleSection(this)" aria-expanded="true">
+                    <span class="section-icon">▼</span>
+                    <span class="section-title">{title}</span>
+                    <span class="section-count">{len(items)}</span>
+                </button>
+                <div class="section-content">
+                    '''
+            if not items:
+                yield f'<p class="empty">{empty_text}</p>'
+            for j, item in enumerate(items):
+                if j:
+                    yield "\n"
+                yield render_item(item)
+            yield '''
+                </div>
+            </section>
+'''
+
+        yield self._document_tail()
+
+    def _escape(self, text: str) -> str:
+        """Escape HTML special characters (same output as html.escape)."""
+        return str(text).translate(_HTML_ESCAPE)
+
+    def _render_skill(self, skill: SkillInfo) -> str:
+        """Render a single skill item."""
+        esc = self._escape
+        triggers_html = ""
+        if skill.triggers:
+            triggers_html = _TRIGGERS_TMPL.format(triggers=", ".join(map(esc, skill.triggers)))
+
+        desc_html = ""
+        if skill.description:
+            desc_html = _DESC_TMPL.format(desc=esc(skill.description))
+
+        return _SKILL_TMPL.format(
+            name=esc(skill.name), desc=desc_html, triggers=triggers_html, path=esc(skill.path)
+        )
+
+    def _render_command(self, cmd: CommandInfo) -> str:
+        """Render a single command item."""
+        esc = self._escape
+        desc_html = ""
+        if cmd.description:
+            desc_html = _DESC_TMPL.format(desc=esc(cmd.description))
+
+        return _COMMAND_TMPL.format(name=esc(cmd.name), desc=desc_html, path=esc(cmd.path))
+
+    def _render_hook(self, hook: HookInfo) -> str:
+        """Render a single hook item."""
+        esc = self._escape
+        cmd_count = len(hook.commands)
+
+        return _HOOK_TMPL.format(
+            name=esc(hook.name),
+            status_class="status-enabled" if hook.enabled else "status-disabled",
+            status_text="enabled" if hook.enabled else "disabled",
+            event=esc(hook.event),
+            matcher=esc(hook.matcher),
+            cmd_text=f"{cmd_count} command{'s' if cmd_count != 1 else ''}",
+        )
+
+    def _document_head(self) -> str:
+        """Return the document up to the first section."""
+        if type(self)._get_css is HTMLRenderer._get_css:
+            return _HTML_PRELUDE
+        return _HTML_PRELUDE_TMPL.format(css=self._get_css())
+
+    def _document_tail(self) -> str:
+        """Return the document after the last section."""
+        return _HTML_POSTLUDE
+
+    def _get_css(self) -> str:
+        """Return the embedded CSS styles."""
+        return _EMBEDDED_CSS
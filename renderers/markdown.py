@@ -1,14 +1,15 @@
 """Markdown renderer for documentation-style visualization."""
 
-from pathlib import Path
-from typing import List
+from typing import Iterator
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from hooks_manager import ExtensionsData, SkillInfo, CommandInfo, HookInfo
 from .base import BaseRenderer
 
 
+# Escape pipes (which break tables) and flatten newlines in one pass
+_MD_ESCAPE = str.maketrans({"|": "\\|", "\n": " "})
+
+
 class MarkdownRenderer(BaseRenderer):
     """Renders extensions as clean markdown with tables."""
 
@@ -18,114 +19,84 @@ class MarkdownRenderer(BaseRenderer):
 
     def render(self, data: ExtensionsData) -> str:
         """Render extensions data as markdown documentation."""
-        lines: List[str] = []
-
+        return "\n".join(self._iter_lines(data))
+
+    def render_stream(self, data: ExtensionsData) -> Iterator[str]:
+        """Yield the markdown document line by line."""
+        lines = self._iter_lines(data)
+        yield next(lines)
+        for line in lines:
+            yield "\n"
+            yield line
+
+    def _iter_lines(self, data: ExtensionsData) -> Iterator[str]:
+        """Yield every line of the document, without newlines."""
         # Main header
-        lines.append("# Claude Code Extensions")
-        lines.append("")
+        yield "# Claude Code Extensions"
+        yield ""
 
         # Summary
         total = len(data.skills) + len(data.commands) + len(data.hooks)
-        lines.append(f"**Total Extensions:** {total}")
-        lines.append("")
-
-        # Render each section
-        lines.extend(self._render_skills_section(data.skills))
-        lines.extend(self._render_commands_section(data.commands))
-        lines.extend(self._render_hooks_section(data.hooks))
-
-        return "\n".join(lines)
+        yield f"**Total Extensions:** {total}"
+        yield ""
+
+        sections = [
+            ("Skills", data.skills, "No skills found",
+             "| Name | Description | Triggers | Path |",
+             "|------|-------------|----------|------|", self._skill_row),
+            ("Commands", data.commands, "No commands found",
+             "| Command | Description | Path |",
+             "|---------|-------------|------|", self._command_row),
+            ("Hooks", data.hooks, "No hooks found",
+             "| Name | Event | Status | Matcher | Commands |",
+             "|------|-------|--------|---------|----------|", self._hook_row),
+        ]
+
+        # Walk all three sections in one pass
+        for title, items, empty_text, header, separator, render_row in sections:
+            yield f"## {title}"
+            yield ""
+
+            if not items:
+                yield f"*{empty_text}.*"
+                yield ""
+                continue
+
+            yield header
+            yield separator
+            for item in items:
+                yield render_row(item)
+            yield ""
 
     def _escape_markdown(self, text: str) -> str:
         """Escape special markdown characters in table cells."""
         if not text:
             return ""
-        # Escape pipe characters which break tables
-        text = text.replace("|", "\\|")
-        # Escape newlines
-        text = text.replace("\n", " ")
-        return text
-
-    def _render_skills_section(self, skills: List[SkillInfo]) -> List[str]:
-        """Render the skills section as a markdown table."""
-        lines: List[str] = []
-
-        lines.append("## Skills")
-        lines.append("")
-
-        if not skills:
-            lines.append("*No skills found.*")
-            lines.append("")
-            return lines
-
-        # Table header
-        lines.append("| Name | Description | Triggers | Path |")
-        lines.append("|------|-------------|----------|------|")
-
-        # Table rows
-        for skill in skills:
-            name = self._escape_markdown(skill.name)
-            desc = self._escape_markdown(skill.description or "-")
-            triggers = self._escape_markdown(", ".join(skill.triggers) if skill.triggers else "-")
-            path = self._escape_markdown(str(skill.path))
-
-            lines.append(f"| {name} | {desc} | {triggers} | `{path}` |")
-
-        lines.append("")
-        return lines
-
-    def _render_commands_section(self, commands: List[CommandInfo]) -> List[str]:
-        """Render the commands section as a markdown table."""
-        lines: List[str] = []
-
-        lines.append("## Commands")
-        lines.append("")
-
-        if not commands:
-            lines.append("*No commands found.*")
-            lines.append("")
-            return lines
-
-        # Table header
-        lines.append("| Command | Description | Path |")
-        lines.append("|---------|-------------|------|")
-
-        # Table rows
-        for cmd in commands:
-            name = f"`/{self._escape_markdown(cmd.name)}`"
-            desc = self._escape_markdown(cmd.description or "-")
-            path = self._escape_markdown(str(cmd.path))
-
-            lines.append(f"| {name} | {desc} | `{path}` |")
-
-        lines.append("")
-        return lines
-
-    def _render_hooks_section(self, hooks: List[HookInfo]) -> List[str]:
-        """Render the hooks section as a markdown table."""
-        lines: List[str] = []
-
-        lines.append("## Hooks")
-        lines.append("")
-
-        if not hooks:
-            lines.append("*No hooks found.*")
-            lines.append("")
-            return lines
-
-        # Table header
-        lines.append("| Name | Event | Status | Matcher | Commands |")
-        lines.append("|------|-------|--------|---------|----------|")
-
-        # Table rows
-        for hook in hooks:
-            name = self._escape_markdown(hook.name)
-            event = self._escape_markdown(hook.event)
-            status = "✅ Enabled" if hook.enabled else "⚠️ Disabled"
-            matcher = self._escape_markdown(hook.matcher or "*")
-            cmd_count = len(hook.commands) if hook.commands else 0
-
-            lines.append(f"| {name} | `{event}` | {status} | `{matcher}` | {cmd_count} |")
-
-        lines.append("")
-        return lines
+        return text.translate(_MD_ESCAPE)
+
+    def _skill_row(self, skill: SkillInfo) -> str:
+        """Render a skill as a table row."""
+        name = self._escape_markdown(skill.name)
+        desc = self._escape_markdown(skill.description or "-")
+        triggers = self._escape_markdown(", ".join(skill.triggers) if skill.triggers else "-")
+        path = self._escape_markdown(str(skill.path))
+
+        return f"| {name} | {desc} | {triggers} | `{path}` |"
+
+    def _command_row(self, cmd: CommandInfo) -> str:
+        """Render a command as a table row."""
+        name = f"`/{self._escape_markdown(cmd.name)}`"
+        desc = self._escape_markdown(cmd.description or "-")
+        path = self._escape_markdown(str(cmd.path))
+
+        return f"| {name} | {desc} | `{path}` |"
+
+    def _hook_row(self, hook: HookInfo) -> str:
+        """Render a hook as a table row."""
+        name = self._escape_markdown(hook.name)
+        event = self._escape_markdown(hook.event)
+        status = "✅ Enabled" if hook.enabled else "⚠️ Disabled"
+        matcher = self._escape_markdown(hook.matcher or "*")
+        cmd_count = len(hook.commands)
+
+        return f"| {name} | `{event}` | {status} | `{matcher}` | {cmd_count} |"
@@ -1,14 +1,18 @@
 """Terminal renderer for tree-style visualization."""
 
-from pathlib import Path
+from functools import lru_cache
 from typing import List
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from hooks_manager import Colors, ExtensionsData, SkillInfo, CommandInfo, HookInfo
 from .base import BaseRenderer
 
 
+@lru_cache(maxsize=256)
+def _wrap(text: str, color: str) -> str:
+    """Wrap text in a color code; labels and headers repeat, so results are cached."""
+    return f"{color}{text}{Colors.RESET}"
+
+
 class TerminalRenderer(BaseRenderer):
     """Renders extensions as a tree structure for terminal output."""
 
@@ -18,13 +22,37 @@ class TerminalRenderer(BaseRenderer):
     VERTICAL = "│   "
     SPACE = "    "
 
-    def __init__(self, use_color: bool = True):
-        super().__init__(use_color)
-
-    def _color(self, text: str, color: str) -> str:
-        """Apply color to text if colors are enabled."""
-        if self.use_color:
-            return f"{color}{text}{Colors.RESET}"
+    @property
+    def use_color(self) -> bool:
+        """Whether output is colorized."""
+        return self._use_color
+
+    @use_color.setter
+    def use_color(self, value: bool) -> None:
+        # Bind _color once so the no-color path is a bare passthrough
+        self._use_color = value
+        self._color = self._color_on if value else self._color_off
+        # Labels are identical for every item, so color them once
+        self._labels = {
+            name: self._color(text, Colors.DIM)
+            for name, text in (
+                ('desc', 'Description:'),
+                ('triggers', 'Triggers:'),
+                ('path', 'Path:'),
+                ('event', 'Event:'),
+                ('matcher', 'Matcher:'),
+                ('commands', 'Commands:'),
+            )
+        }
+
+    @staticmethod
+    def _color_on(text: str, color: str) -> str:
+        """Wrap text in the given color code."""
+        return _wrap(text, color)
+
+    @staticmethod
+    def _color_off(text: str, color: str) -> str:
+        """Return text unchanged when colors are disabled."""
         return text
 
     def render(self, data: ExtensionsData) -> str:
@@ -40,8 +68,9 @@ class TerminalRenderer(BaseRenderer):
             ("Hooks", data.hooks, self._render_hook),
         ]
 
+        last_section = len(sections) - 1
         for i, (title, items, renderer) in enumerate(sections):
-            is_last_section = i == len(sections) - 1
+            is_last_section = i == last_section
             branch = self.LAST_BRANCH if is_last_section else self.BRANCH
             prefix = self.SPACE if is_last_section else self.VERTICAL
 
@@ -53,63 +82,55 @@ class TerminalRenderer(BaseRenderer):
             if not items:
                 lines.append(f"{prefix}{self.LAST_BRANCH}{self._color('(none)', Colors.DIM)}")
             else:
-                for j, item in enumerate(items):
-                    is_last_item = j == len(items) - 1
-                    item_branch = self.LAST_BRANCH if is_last_item else self.BRANCH
-                    item_prefix = self.SPACE if is_last_item else self.VERTICAL
-
-                    item_lines = renderer(item)
-                    lines.append(f"{prefix}{item_branch}{item_lines[0]}")
-
-                    for detail in item_lines[1:]:
-                        lines.append(f"{prefix}{item_prefix}{detail}")
+                # The tree is only two levels deep, so every item's prefixes
+                # are one of two fixed pairs; build them once per section
+                head, indent = prefix + self.BRANCH, prefix + self.VERTICAL
+                for item in items[:-1]:
+                    renderer(item, lines, head, indent)
+                renderer(items[-1], lines, prefix + self.LAST_BRANCH, prefix + self.SPACE)
 
             if not is_last_section:
-                lines.append(f"{self.VERTICAL}")
+                lines.append(self.VERTICAL)
 
         return "\n".join(lines)
 
-    def _render_skill(self, skill: SkillInfo) -> List[str]:
+    # Each _render_* appends an item's lines to out: the first line after
+    # head, detail lines after indent (both already include the tree prefix).
+
+    def _render_skill(self, skill: SkillInfo, out: List[str], head: str, indent: str) -> None:
         """Render a single skill entry."""
-        lines = [self._color(skill.name, Colors.GREEN)]
+        labels = self._labels
+        out.append(f"{head}{self._color(skill.name, Colors.GREEN)}")
 
         if skill.description:
-            lines.append(f"{self.BRANCH}{self._color('Description:', Colors.DIM)} {skill.description}")
+            out.append(f"{indent}{self.BRANCH}{labels['desc']} {skill.description}")
 
         if skill.triggers:
-            triggers_str = ", ".join(skill.triggers)
-            lines.append(f"{self.BRANCH}{self._color('Triggers:', Colors.DIM)} {triggers_str}")
-
-        lines.append(f"{self.LAST_BRANCH}{self._color('Path:', Colors.DIM)} {skill.path}")
+            out.append(f"{indent}{self.BRANCH}{labels['triggers']} {', '.join(skill.triggers)}")
 
-        return lines
+        out.append(f"{indent}{self.LAST_BRANCH}{labels['path']} {skill.path}")
 
-    def _render_command(self, cmd: CommandInfo) -> List[str]:
+    def _render_command(self, cmd: CommandInfo, out: List[str], head: str, indent: str) -> None:
         """Render a single command entry."""
-        lines = [self._color(f"/{cmd.name}", Colors.GREEN)]
+        labels = self._labels
+        out.append(f"{head}{self._color(f'/{cmd.name}', Colors.GREEN)}")
 
         if cmd.description:
-            lines.append(f"{self.BRANCH}{self._color('Description:', Colors.DIM)} {cmd.description}")
-
-        lines.append(f"{self.LAST_BRANCH}{self._color('Path:', Colors.DIM)} {cmd.path}")
+            out.append(f"{indent}{self.BRANCH}{labels['desc']} {cmd.description}")
 
-        return lines
+        out.append(f"{indent}{self.LAST_BRANCH}{labels['path']} {cmd.path}")
 
-    def _render_hook(self, hook: HookInfo) -> List[str]:
+    def _render_hook(self, hook: HookInfo, out: List[str], head: str, indent: str) -> None:
         """Render a single hook entry."""
+        labels = self._labels
         status_color = Colors.GREEN if hook.enabled else Colors.YELLOW
         status_text = "enabled" if hook.enabled else "disabled"
 
-        name_display = f"{hook.name} [{self._color(status_text, status_color)}]"
-        lines = [name_display]
-
-        lines.append(f"{self.BRANCH}{self._color('Event:', Colors.DIM)} {hook.event}")
-        lines.append(f"{self.BRANCH}{self._color('Matcher:', Colors.DIM)} {hook.matcher}")
+        out.append(f"{head}{hook.name} [{self._color(status_text, status_color)}]")
+        out.append(f"{indent}{self.BRANCH}{labels['event']} {hook.event}")
+        out.append(f"{indent}{self.BRANCH}{labels['matcher']} {hook.matcher}")
 
         if hook.commands:
-            cmd_count = len(hook.commands)
-            lines.append(f"{self.LAST_BRANCH}{self._color('Commands:', Colors.DIM)} {cmd_count}")
+            out.append(f"{indent}{self.LAST_BRANCH}{labels['commands']} {len(hook.commands)}")
         else:
-            lines.append(f"{self.LAST_BRANCH}{self._color('Commands:', Colors.DIM)} (none)")
-
-        return lines
+            out.append(f"{indent}{self.LAST_BRANCH}{labels['commands']} (none)")
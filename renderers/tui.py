@@ -1,11 +1,8 @@
 """TUI renderer using curses for interactive visualization."""
 
 import curses
-from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from hooks_manager import Colors, ExtensionsData, SkillInfo, CommandInfo, HookInfo
 from .base import BaseRenderer
 
@@ -32,6 +29,35 @@ class TUIRenderer(BaseRenderer):
         self.show_detail = False
         self.show_help = False
 
+        # Section list, rebuilt only when self.data is replaced
+        self._sections: List[Tuple[str, List[Union[SkillInfo, CommandInfo, HookInfo]]]] = []
+        self._sections_data: Optional[ExtensionsData] = None
+
+        # View state at the last draw, used to skip or narrow repaints
+        self._last_state: Optional[tuple] = None
+
+        # Width-fitted list text and color pair per (id(item), width); items don't
+        # change while the TUI runs, so entries stay valid until a resize or new data
+        self._item_line_cache: Dict[Tuple[int, int], Tuple[str, int]] = {}
+        # Detail view lines per id(item), cleared with the list cache
+        self._detail_cache: Dict[int, List[str]] = {}
+        # Centered header/footer bars per text at the current width
+        self._bar_cache: Dict[str, str] = {}
+        # Row formatter per item type, looked up by type() instead of an isinstance chain
+        self._row_by_type = {
+            SkillInfo: self._skill_row,
+            CommandInfo: self._command_row,
+            HookInfo: self._hook_row,
+        }
+        self._cached_width = 0
+
+        # Off-screen pad holding every row of the current section; scrolling
+        # only changes which part of it is copied to the screen
+        self._list_pad: Optional[curses.window] = None
+        self._pad_key: Optional[Tuple[int, int]] = None
+        self._pad_selected = 0
+        self._list_view: Optional[Tuple[int, int, int, int]] = None
+
         # Color pairs
         self.COLOR_HEADER = 1
         self.COLOR_SELECTED = 2
@@ -47,12 +73,29 @@ class TUIRenderer(BaseRenderer):
         Returns empty string since output is interactive.
         """
         self.data = data
+        self._reset_view()
         try:
             curses.wrapper(self._run)
         except curses.error:
             return "Error: Terminal too small or curses not supported"
         return ""
 
+    def _reset_view(self) -> None:
+        """Forget the previous session's frame and keep the cursor inside the data."""
+        # A new curses session starts with a blank screen, so the first frame
+        # must be drawn in full even if the view state is unchanged
+        self._last_state = None
+        self._list_view = None
+        self._list_pad = None
+        self._pad_key = None
+
+        sections = self._get_sections()
+        if not 0 <= self.current_section < len(sections):
+            self.current_section = 0
+        items = sections[self.current_section][1] if sections else []
+        self.current_item = min(self.current_item, max(len(items) - 1, 0))
+        self.scroll_offset = min(self.scroll_offset, self.current_item)
+
     def _run(self, stdscr: curses.window) -> None:
         """Main curses loop."""
         self.stdscr = stdscr
@@ -76,7 +119,6 @@ class TUIRenderer(BaseRenderer):
     def _init_curses(self) -> None:
         """Initialize curses settings and colors."""
         curses.curs_set(0)  # Hide cursor
-        self.stdscr.timeout(100)  # Non-blocking input
 
         if curses.has_colors():
             curses.start_color()
@@ -149,32 +191,76 @@ class TUIRenderer(BaseRenderer):
 
     def _get_sections(self) -> List[Tuple[str, List[Union[SkillInfo, CommandInfo, HookInfo]]]]:
         """Get section data as list of (title, items) tuples."""
-        if not self.data:
-            return []
-        return [
-            ("Skills", self.data.skills),
-            ("Commands", self.data.commands),
-            ("Hooks", self.data.hooks),
-        ]
+        if self.data is not self._sections_data:
+            self._sections_data = self.data
+            # Both caches are keyed by id(item); drop them before ids of the
+            # replaced items can be reused by new ones
+            self._item_line_cache.clear()
+            self._detail_cache.clear()
+            self._sections = [
+                ("Skills", self.data.skills),
+                ("Commands", self.data.commands),
+                ("Hooks", self.data.hooks),
+            ] if self.data else []
+        return self._sections
 
     def _draw(self) -> None:
-        """Draw the main TUI interface."""
-        self.stdscr.clear()
+        """Draw the TUI interface, repainting only what changed since the last draw."""
         max_height, max_width = self.stdscr.getmaxyx()
+        state = (self.current_section, self.current_item, self.scroll_offset,
+                 self.show_detail, self.show_help, (max_height, max_width))
+        last = self._last_state
+        if state == last:
+            return
+        self._last_state = state
+
+        if max_width != self._cached_width:
+            self._item_line_cache.clear()
+            self._detail_cache.clear()
+            self._bar_cache.clear()
+            self._cached_width = max_width
 
         if max_height < 10 or max_width < 40:
-            self.stdscr.addstr(0, 0, "Terminal too small")
-            self.stdscr.refresh()
+            self._list_view = None
+            self.stdscr.erase()
+            try:
+                self.stdscr.addstr(0, 0, "Terminal too small")
+            except curses.error:
+                pass
+        elif (self._list_view is not None and not self.show_help and not self.show_detail
+              and last[0] == state[0] and last[3:] == state[3:]):
+            # Selection moved or list scrolled: only the list pad changed, so
+            # stdscr's header, tabs and footer are left out of the update
+            self._update_pad_selection()
+            self._list_pad.noutrefresh(self.scroll_offset, 0, *self._list_view)
+            curses.doupdate()
             return
-
-        if self.show_help:
-            self._draw_help()
-        elif self.show_detail:
-            self._draw_detail()
         else:
-            self._draw_main()
+            self._list_view = None
+            self.stdscr.erase()
+            if self.show_help:
+                self._draw_help()
+            elif self.show_detail:
+                self._draw_detail()
+            else:
+                self._draw_main()
 
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+        if self._list_view is not None:
+            self._list_pad.noutrefresh(self.scroll_offset, 0, *self._list_view)
+        curses.doupdate()
+
+    def _update_pad_selection(self) -> None:
+        """Repaint the previously and newly selected rows in the list pad."""
+        previous = self._pad_selected
+        if self._list_pad is None or previous == self.current_item:
+            return
+        _, items = self._get_sections()[self.current_section]
+        width = self._pad_key[1]
+
+        self._draw_item(self._list_pad, items[previous], previous, width, False)
+        self._draw_item(self._list_pad, items[self.current_item], self.current_item, width, True)
+        self._pad_selected = self.current_item
 
     def _draw_main(self) -> None:
         """Draw the main list view."""
@@ -198,31 +284,34 @@ class TUIRenderer(BaseRenderer):
 
     def _draw_header(self, text: str, width: int) -> None:
         """Draw the header bar."""
-        header = text.center(width - 1)
         try:
             self.stdscr.attron(curses.color_pair(self.COLOR_HEADER) | curses.A_BOLD)
-            self.stdscr.addstr(0, 0, header[:width-1])
+            self.stdscr.addstr(0, 0, self._fit_bar(text, width))
             self.stdscr.attroff(curses.color_pair(self.COLOR_HEADER) | curses.A_BOLD)
         except curses.error:
             pass
 
+    def _fit_bar(self, text: str, width: int) -> str:
+        """Return header/footer text centered and clipped to the screen width."""
+        bar = self._bar_cache.get(text)
+        if bar is None:
+            bar = self._bar_cache[text] = text.center(width - 1)[:width-1]
+        return bar
+
     def _draw_section_tabs(self, sections: List, width: int) -> None:
         """Draw section navigation tabs."""
         y = 1
         x = 0
+        selected_attr = curses.color_pair(self.COLOR_SELECTED) | curses.A_BOLD
+        section_attr = curses.color_pair(self.COLOR_SECTION)
 
         for i, (title, items) in enumerate(sections):
             tab_text = f" [{i+1}] {title} ({len(items)}) "
 
             try:
-                if i == self.current_section:
-                    self.stdscr.attron(curses.color_pair(self.COLOR_SELECTED) | curses.A_BOLD)
-                    self.stdscr.addstr(y, x, tab_text)
-                    self.stdscr.attroff(curses.color_pair(self.COLOR_SELECTED) | curses.A_BOLD)
-                else:
-                    self.stdscr.attron(curses.color_pair(self.COLOR_SECTION))
-                    self.stdscr.addstr(y, x, tab_text)
-                    self.stdscr.attroff(curses.color_pair(self.COLOR_SECTION))
+                # Pass the attribute to addstr rather than toggling window state
+                attr = selected_attr if i == self.current_section else section_attr
+                self.stdscr.addstr(y, x, tab_text, attr)
             except curses.error:
                 pass
 
@@ -238,68 +327,81 @@ class TUIRenderer(BaseRenderer):
         """Draw list of items in current section."""
         if not items:
             try:
-                self.stdscr.attron(curses.color_pair(self.COLOR_DIM))
-                self.stdscr.addstr(start_y, 2, "(no items)")
-                self.stdscr.attroff(curses.color_pair(self.COLOR_DIM))
+                self.stdscr.addstr(start_y, 2, "(no items)", curses.color_pair(self.COLOR_DIM))
             except curses.error:
                 pass
             return
 
-        visible_height = end_y - start_y - 2
-
-        for idx, item in enumerate(items):
-            if idx < self.scroll_offset:
-                continue
-
-            display_idx = idx - self.scroll_offset
-            if display_idx >= visible_height:
-                break
+        # Every row goes into the pad once per section and width; _draw copies
+        # the visible window of it to the screen at the current scroll offset
+        key = (self.current_section, width)
+        if self._pad_key != key:
+            pad = curses.newpad(len(items) + 1, width)
+            for idx, item in enumerate(items):
+                self._draw_item(pad, item, idx, width, idx == self.current_item)
+            self._list_pad, self._pad_key, self._pad_selected = pad, key, self.current_item
+        else:
+            self._update_pad_selection()
 
-            y = start_y + display_idx
-            self._draw_item(item, y, width, idx == self.current_item)
+        visible_height = end_y - start_y - 2
+        self._list_view = (start_y, 0, start_y + visible_height - 1, width - 1)
 
-    def _draw_item(self, item: Union[SkillInfo, CommandInfo, HookInfo],
+    def _draw_item(self, win: curses.window, item: Union[SkillInfo, CommandInfo, HookInfo],
                    y: int, width: int, selected: bool) -> None:
         """Draw a single item line."""
         try:
-            if isinstance(item, SkillInfo):
-                text = f"  {item.name}"
-                if item.description:
-                    text += f" - {item.description[:width-len(text)-5]}"
-            elif isinstance(item, CommandInfo):
-                text = f"  /{item.name}"
-                if item.description:
-                    text += f" - {item.description[:width-len(text)-5]}"
-            elif isinstance(item, HookInfo):
-                status = "[ON] " if item.enabled else "[OFF]"
-                text = f"  {status} {item.name} ({item.event})"
-            else:
-                text = f"  {item}"
-
-            # Truncate to width
-            text = text[:width-2].ljust(width-2)
-
+            text, color = self._item_line(item, width)
             if selected:
-                self.stdscr.attron(curses.color_pair(self.COLOR_SELECTED))
-                self.stdscr.addstr(y, 0, text)
-                self.stdscr.attroff(curses.color_pair(self.COLOR_SELECTED))
-            else:
-                if isinstance(item, HookInfo):
-                    color = self.COLOR_ENABLED if item.enabled else self.COLOR_DISABLED
-                    self.stdscr.attron(curses.color_pair(color))
-                    self.stdscr.addstr(y, 0, text)
-                    self.stdscr.attroff(curses.color_pair(color))
-                else:
-                    self.stdscr.addstr(y, 0, text)
+                color = self.COLOR_SELECTED
+            win.addstr(y, 0, text, curses.color_pair(color))
         except curses.error:
             pass
 
+    def _item_line(self, item: Union[SkillInfo, CommandInfo, HookInfo],
+                   width: int) -> Tuple[str, int]:
+        """Return the item's list line fitted to width, and its color pair."""
+        key = (id(item), width)
+        line = self._item_line_cache.get(key)
+        if line is not None:
+            return line
+
+        format_row = self._row_by_type.get(type(item), self._generic_row)
+        text, color = format_row(item, width)
+
+        # Truncate to width
+        line = self._item_line_cache[key] = (text[:width-2].ljust(width-2), color)
+        return line
+
+    def _skill_row(self, skill: SkillInfo, width: int) -> Tuple[str, int]:
+        """Format a skill's list row before fitting."""
+        text = f"  {skill.name}"
+        if skill.description:
+            text += f" - {skill.description[:width-len(text)-5]}"
+        return text, 0  # Pair 0 is the terminal's default colors
+
+    def _command_row(self, cmd: CommandInfo, width: int) -> Tuple[str, int]:
+        """Format a command's list row before fitting."""
+        text = f"  /{cmd.name}"
+        if cmd.description:
+            text += f" - {cmd.description[:width-len(text)-5]}"
+        return text, 0
+
+    def _hook_row(self, hook: HookInfo, width: int) -> Tuple[str, int]:
+        """Format a hook's list row before fitting."""
+        status = "[ON] " if hook.enabled else "[OFF]"
+        color = self.COLOR_ENABLED if hook.enabled else self.COLOR_DISABLED
+        return f"  {status} {hook.name} ({hook.event})", color
+
+    def _generic_row(self, item: object, width: int) -> Tuple[str, int]:
+        """Format any other item's list row before fitting."""
+        return f"  {item}", 0
+
     def _draw_footer(self, height: int, width: int) -> None:
         """Draw the footer with key hints."""
         footer = " q:Quit  ?:Help  Enter:Details  Tab:Next Section  Arrows:Navigate "
         try:
             self.stdscr.attron(curses.color_pair(self.COLOR_HEADER))
-            self.stdscr.addstr(height - 1, 0, footer.center(width - 1)[:width-1])
+            self.stdscr.addstr(height - 1, 0, self._fit_bar(footer, width))
             self.stdscr.attroff(curses.color_pair(self.COLOR_HEADER))
         except curses.error:
             pass
@@ -324,14 +426,17 @@ class TUIRenderer(BaseRenderer):
         # Content
         y = 2
 
-        if isinstance(item, SkillInfo):
-            lines = self._format_skill_detail(item, max_width)
-        elif isinstance(item, CommandInfo):
-            lines = self._format_command_detail(item, max_width)
-        elif isinstance(item, HookInfo):
-            lines = self._format_hook_detail(item, max_width)
-        else:
-            lines = [str(item)]
+        lines = self._detail_cache.get(id(item))
+        if lines is None:
+            if isinstance(item, SkillInfo):
+                lines = self._format_skill_detail(item, max_width)
+            elif isinstance(item, CommandInfo):
+                lines = self._format_command_detail(item, max_width)
+            elif isinstance(item, HookInfo):
+                lines = self._format_hook_detail(item, max_width)
+            else:
+                lines = [str(item)]
+            self._detail_cache[id(item)] = lines
 
         for line in lines:
             if y >= max_height - 1:
@@ -346,7 +451,7 @@ class TUIRenderer(BaseRenderer):
         footer = " b/Left/ESC:Back  q:Quit "
         try:
             self.stdscr.attron(curses.color_pair(self.COLOR_HEADER))
-            self.stdscr.addstr(max_height - 1, 0, footer.center(max_width - 1)[:max_width-1])
+            self.stdscr.addstr(max_height - 1, 0, self._fit_bar(footer, max_width))
             self.stdscr.attroff(curses.color_pair(self.COLOR_HEADER))
         except curses.error:
             pass
@@ -356,21 +461,20 @@ class TUIRenderer(BaseRenderer):
         lines = [
             f"Name: {skill.name}",
             "",
-            f"Description:",
+            "Description:",
             f"  {skill.description or '(none)'}",
             "",
-            f"Triggers:",
+            "Triggers:",
         ]
 
         if skill.triggers:
-            for trigger in skill.triggers:
-                lines.append(f"  - {trigger}")
+            lines.extend([f"  - {trigger}" for trigger in skill.triggers])
         else:
             lines.append("  (none)")
 
         lines.extend([
             "",
-            f"Path:",
+            "Path:",
             f"  {skill.path}",
         ])
 
@@ -381,10 +485,10 @@ class TUIRenderer(BaseRenderer):
         lines = [
             f"Command: /{cmd.name}",
             "",
-            f"Description:",
+            "Description:",
             f"  {cmd.description or '(none)'}",
             "",
-            f"Path:",
+            "Path:",
             f"  {cmd.path}",
         ]
 
@@ -410,8 +514,7 @@ class TUIRenderer(BaseRenderer):
                 if cmd_type == "command":
                     command = cmd.get("command", "(none)")
                     timeout = cmd.get("timeout", 60)
-                    lines.append(f"  {i+1}. {command}")
-                    lines.append(f"     Timeout: {timeout}s")
+                    lines += (f"  {i+1}. {command}", f"     Timeout: {timeout}s")
                 elif cmd_type == "prompt":
                     prompt = cmd.get("prompt", "(none)")
                     # Truncate long prompts
@@ -453,17 +556,15 @@ class TUIRenderer(BaseRenderer):
         start_x = (max_width - box_width) // 2
         start_y = (max_height - box_height) // 2
 
-        # Draw box
+        # Draw box, one blank row per addstr call
+        attr = curses.color_pair(self.COLOR_HEADER)
+        blank = " " * box_width
         try:
             for y in range(box_height):
-                for x in range(box_width):
-                    char = " "
-                    self.stdscr.addch(start_y + y, start_x + x, ord(char),
-                                      curses.color_pair(self.COLOR_HEADER))
+                self.stdscr.addstr(start_y + y, start_x, blank, attr)
 
             # Draw content
             for i, line in enumerate(help_lines):
-                self.stdscr.addstr(start_y + 2 + i, start_x + 3, line,
-                                   curses.color_pair(self.COLOR_HEADER))
+                self.stdscr.addstr(start_y + 2 + i, start_x + 3, line, attr)
         except curses.error:
             pass
@@ -1,11 +1,12 @@
 """Pytest configuration and fixtures for hooks_manager tests."""
 
-import json
+import copy
 import os
+import shutil
 import sys
 from pathlib import Path
-from typing import Any, Dict
-from unittest.mock import patch
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -19,14 +20,46 @@ from hooks_manager import (
     SkillInfo,
     CommandInfo,
     ExtensionsData,
+    _json_dumps,
     create_parser,
 )
+from renderers import TerminalRenderer, HTMLRenderer, MarkdownRenderer
 
 
-@pytest.fixture
-def sample_settings() -> Dict[str, Any]:
-    """Return sample settings.json content with hooks."""
-    return {
+def pytest_configure(config):
+    """Register custom markers."""
+    # .pytest_cache is left to pytest; to skip writing it for a one-off run,
+    # opt out with `pytest -p no:cacheprovider` (this also disables --lf/--ff)
+    config.addinivalue_line("markers", "slow: spawns a subprocess or is otherwise slow")
+    config.addinivalue_line("markers", "serial: keep on a single worker under pytest-xdist")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin serial tests to one xdist worker when running with -n."""
+    # Every other test works in its own tmp_path, and Path.cwd patches are
+    # per-process, so the suite parallelizes with `pytest -n auto --dist loadgroup`.
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+
+@pytest.fixture(scope="session")
+def py_cmd():
+    """Return the command prefix that runs hooks_manager.py in a fresh interpreter.
+
+    -S skips site initialization; the script is stdlib-only (orjson is optional).
+    -I is not used because it also drops the script's directory from sys.path,
+    which the lazily imported renderers package relies on.
+    """
+    return [sys.executable, "-S", str(Path(__file__).parent.parent / "hooks_manager.py")]
+
+
+@pytest.fixture(scope="session")
+def sample_settings() -> Iterator[Dict[str, Any]]:
+    """Return sample settings.json content with hooks (shared; copy before mutating)."""
+    settings = {
         "hooks": {
             "PostToolUse": [
                 {
@@ -82,21 +115,31 @@ def sample_settings() -> Dict[str, Any]:
             ]
         }
     }
+    snapshot = copy.deepcopy(settings)
+    yield settings
+    # Every test, and every xdist worker, relies on this dict being pristine
+    assert settings == snapshot, "a test mutated the session-scoped sample_settings"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def serialized_sample(sample_settings) -> bytes:
+    """Return sample_settings serialized once as compact JSON bytes."""
+    return _json_dumps(sample_settings, compact=True)
+
+
+@pytest.fixture(scope="session")
 def empty_settings() -> Dict[str, Any]:
-    """Return empty settings.json content."""
+    """Return empty settings.json content (shared; copy before mutating)."""
     return {"hooks": {}, "_disabled_hooks": {}}
 
 
 @pytest.fixture
-def temp_settings_file(tmp_path, sample_settings):
+def temp_settings_file(tmp_path, serialized_sample):
     """Create a temporary settings.json file."""
     settings_dir = tmp_path / ".claude"
     settings_dir.mkdir(parents=True)
     settings_file = settings_dir / "settings.json"
-    settings_file.write_text(json.dumps(sample_settings, indent=2))
+    settings_file.write_bytes(serialized_sample)
     return settings_file
 
 
@@ -106,15 +149,45 @@ def temp_empty_settings_file(tmp_path, empty_settings):
     settings_dir = tmp_path / ".claude"
     settings_dir.mkdir(parents=True)
     settings_file = settings_dir / "settings.json"
-    settings_file.write_text(json.dumps(empty_settings, indent=2))
+    settings_file.write_bytes(_json_dumps(empty_settings, compact=True))
     return settings_file
 
 
+@pytest.fixture(scope="session")
+def settings_template(tmp_path_factory, serialized_sample):
+    """Build a project directory with .claude/settings.json once per session."""
+    base = tmp_path_factory.mktemp("tpl")
+    settings_dir = base / ".claude"
+    settings_dir.mkdir()
+    (settings_dir / "settings.json").write_bytes(serialized_sample)
+    return base
+
+
+@pytest.fixture(scope="session")
+def sample_settings_path(settings_template) -> Path:
+    """Return the session's sample settings.json (read-only; never write to it)."""
+    return settings_template / ".claude" / "settings.json"
+
+
 @pytest.fixture
-def temp_claude_dir(tmp_path):
-    """Create a temporary .claude directory structure."""
-    claude_dir = tmp_path / ".claude"
-    claude_dir.mkdir(parents=True)
+def project_dir(tmp_path, settings_template):
+    """Return tmp_path populated with a copy of the sample project settings."""
+    shutil.copytree(settings_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
+@pytest.fixture
+def cwd_in_tmp(tmp_path, monkeypatch):
+    """Make Path.cwd() return tmp_path for the duration of the test."""
+    monkeypatch.setattr(Path, "cwd", classmethod(lambda cls: tmp_path))
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _claude_dir_template(tmp_path_factory):
+    """Build the sample .claude directory tree once per session."""
+    claude_dir = tmp_path_factory.mktemp("claude_template") / ".claude"
+    claude_dir.mkdir()
 
     # Create commands directory with sample command
     commands_dir = claude_dir / "commands"
@@ -141,55 +214,105 @@ Triggers: test, sample, example
     return claude_dir
 
 
+@pytest.fixture
+def temp_claude_dir(tmp_path, _claude_dir_template):
+    """Create a temporary .claude directory structure."""
+    claude_dir = tmp_path / ".claude"
+    shutil.copytree(_claude_dir_template, claude_dir)
+    return claude_dir
+
+
+@pytest.fixture
+def scanner_for(tmp_path):
+    """Return a factory that builds tmp_path/.claude from a spec and scans it.
+
+    The spec maps paths relative to .claude to file bytes, or to None for an
+    empty directory. Each directory is created once, however many files share it.
+    """
+    claude_dir = tmp_path / ".claude"
+
+    def build(tree: Dict[str, Optional[bytes]], settings_path: Optional[Path] = None) -> ExtensionScanner:
+        made = {claude_dir}
+        claude_dir.mkdir(exist_ok=True)
+        for rel, content in tree.items():
+            path = claude_dir / rel
+            parent = path if content is None else path.parent
+            if parent not in made:
+                parent.mkdir(parents=True, exist_ok=True)
+                made.update(parent.parents)
+                made.add(parent)
+            if content is not None:
+                path.write_bytes(content)
+
+        scanner = ExtensionScanner(settings_path=settings_path)
+        scanner.claude_dir = claude_dir
+        return scanner
+
+    return build
+
+
+class MockArgs:
+    """Stand-in for the argparse Namespace HooksManager receives."""
+
+    def __init__(self):
+        self.global_scope = False
+        self.project_scope = False
+        self.json = False
+        self.quiet = False
+        self.dry_run = False
+        self.no_color = True
+        self.no_backup = True
+        self.force = True
+        self.command = None
+        self.name = None
+        self.file = None
+        self.format = 'terminal'
+        self.output_file = None
+        self.hook_name = None
+        self.event = None
+        self.hook_command = None
+        self.matcher = '*'
+        self.timeout = 60
+
+
 @pytest.fixture
 def mock_args():
     """Create mock argparse Namespace for HooksManager."""
-    class MockArgs:
-        def __init__(self):
-            self.global_scope = False
-            self.project_scope = False
-            self.json = False
-            self.quiet = False
-            self.dry_run = False
-            self.no_color = True
-            self.no_backup = True
-            self.force = True
-            self.command = None
-            self.name = None
-            self.file = None
-            self.format = 'terminal'
-            self.output_file = None
-            self.hook_name = None
-            self.event = None
-            self.hook_command = None
-            self.matcher = '*'
-            self.timeout = 60
-
     return MockArgs()
 
 
 @pytest.fixture
-def hooks_manager(tmp_path, sample_settings, mock_args):
+def hooks_manager(tmp_path, sample_settings, serialized_sample, mock_args):
     """Create a HooksManager instance with temporary settings file."""
     settings_dir = tmp_path / ".claude"
     settings_dir.mkdir(parents=True)
     settings_file = settings_dir / "settings.json"
-    settings_file.write_text(json.dumps(sample_settings, indent=2))
+    settings_file.write_bytes(serialized_sample)
 
-    # Patch the settings path resolution
     mock_args.project_scope = True
 
-    with patch.object(Path, 'cwd', return_value=tmp_path):
-        manager = HooksManager(mock_args)
-        manager.settings_path = settings_file
-        manager.settings = sample_settings.copy()
+    # Constructing a manager is cheaper than deep-copying a shared one, and
+    # assigning settings_path up front means Path.cwd() is never consulted
+    manager = HooksManager(mock_args)
+    manager.settings_path = settings_file
+    # Commands mutate nested hook lists, so never hand out the shared dict
+    manager.settings = copy.deepcopy(sample_settings)
 
     return manager
 
 
 @pytest.fixture
+def json_payloads(hooks_manager) -> List[Any]:
+    """Collect the data hooks_manager passes to _output_json instead of printing it."""
+    payloads: List[Any] = []
+    # An instance attribute shadows the method; no serialization or capture needed
+    hooks_manager._output_json = payloads.append
+    return payloads
+
+
+@pytest.fixture(scope="session")
 def sample_hook_info() -> HookInfo:
-    """Return a sample HookInfo instance."""
+    """Return a sample HookInfo instance (shared; do not mutate)."""
     return HookInfo(
         name="test-hook",
         event="PostToolUse",
@@ -200,40 +323,123 @@ def sample_hook_info() -> HookInfo:
     )
 
 
-@pytest.fixture
-def sample_skill_info(tmp_path) -> SkillInfo:
-    """Return a sample SkillInfo instance."""
+@pytest.fixture(scope="session")
+def scratch_dir(tmp_path_factory) -> Path:
+    """Return a session directory for paths that are built but never written."""
+    return tmp_path_factory.mktemp("scratch")
+
+
+@pytest.fixture(scope="session")
+def sample_skill_info(scratch_dir) -> SkillInfo:
+    """Return a sample SkillInfo instance (shared; do not mutate)."""
     return SkillInfo(
         name="Test Skill",
         description="A test skill for unit testing",
         triggers=["test", "sample"],
-        path=tmp_path / "SKILL.md"
+        path=scratch_dir / "SKILL.md"
     )
 
 
-@pytest.fixture
-def sample_command_info(tmp_path) -> CommandInfo:
-    """Return a sample CommandInfo instance."""
+@pytest.fixture(scope="session")
+def sample_command_info(scratch_dir) -> CommandInfo:
+    """Return a sample CommandInfo instance (shared; do not mutate)."""
     return CommandInfo(
         name="test-cmd",
         description="A test command for unit testing",
-        path=tmp_path / "test-cmd.md"
+        path=scratch_dir / "test-cmd.md"
     )
 
 
-@pytest.fixture
-def sample_extensions_data(sample_skill_info, sample_command_info, sample_hook_info) -> ExtensionsData:
-    """Return a sample ExtensionsData instance."""
-    return ExtensionsData(
+@pytest.fixture(scope="session")
+def sample_extensions_data(sample_skill_info, sample_command_info, sample_hook_info) -> Iterator[ExtensionsData]:
+    """Return a sample ExtensionsData instance (shared; build a new one to mutate)."""
+    data = ExtensionsData(
         skills=[sample_skill_info],
         commands=[sample_command_info],
         hooks=[sample_hook_info]
     )
+    snapshot = copy.deepcopy(data)
+    yield data
+    assert data == snapshot, "a test mutated the session-scoped sample_extensions_data"
+
+
+@pytest.fixture(scope="module")
+def large_extensions_data(scratch_dir) -> ExtensionsData:
+    """Return 50 each of skills, commands and hooks, built once per module (do not mutate)."""
+    return ExtensionsData(
+        skills=[
+            SkillInfo(name=f"skill-{i}", description=f"Description {i}",
+                      triggers=[f"trigger-{i}"], path=scratch_dir / f"skill-{i}.md")
+            for i in range(50)
+        ],
+        commands=[
+            CommandInfo(name=f"cmd-{i}", description=f"Command {i}",
+                        path=scratch_dir / f"cmd-{i}.md")
+            for i in range(50)
+        ],
+        hooks=[
+            HookInfo(name=f"hook-{i}", event="PostToolUse", enabled=i % 2 == 0,
+                     matcher="*", commands=[], raw={})
+            for i in range(50)
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def terminal_renderer_nocolor() -> TerminalRenderer:
+    """Return a colorless TerminalRenderer (shared; render() keeps no state)."""
+    return TerminalRenderer(use_color=False)
+
+
+@pytest.fixture(scope="session")
+def html_renderer() -> HTMLRenderer:
+    """Return an HTMLRenderer (shared; render() keeps no state)."""
+    return HTMLRenderer()
+
+
+@pytest.fixture(scope="session")
+def markdown_renderer() -> MarkdownRenderer:
+    """Return a MarkdownRenderer (shared; render() keeps no state)."""
+    return MarkdownRenderer()
+
+
+@pytest.fixture(scope="session")
+def rendered_terminal(terminal_renderer_nocolor, sample_extensions_data) -> str:
+    """Return sample_extensions_data rendered once as colorless terminal output."""
+    return terminal_renderer_nocolor.render(sample_extensions_data)
+
+
+@pytest.fixture(scope="session")
+def rendered_html(html_renderer, sample_extensions_data) -> str:
+    """Return sample_extensions_data rendered once as HTML."""
+    return html_renderer.render(sample_extensions_data)
+
+
+@pytest.fixture(scope="session")
+def rendered_markdown(markdown_renderer, sample_extensions_data) -> str:
+    """Return sample_extensions_data rendered once as markdown."""
+    return markdown_renderer.render(sample_extensions_data)
 
 
 @pytest.fixture
+def curses_wrapper_error() -> Iterator[MagicMock]:
+    """Make curses.wrapper raise curses.error, as it does without a usable terminal."""
+    # Imported here so collecting the suite never requires curses
+    import curses
+
+    with patch("renderers.tui.curses.wrapper", side_effect=curses.error("curses error")) as wrapper:
+        yield wrapper
+
+
+@pytest.fixture(scope="module")
+def scanner() -> ExtensionScanner:
+    """Return an ExtensionScanner for parse-only tests (it is not mutated)."""
+    return ExtensionScanner()
+
+
+@pytest.fixture(scope="session")
 def parser():
-    """Return the argument parser."""
+    """Return the argument parser (shared; parse_args does not mutate it)."""
     return create_parser()
 
 
@@ -1,6 +1,7 @@
 """CLI integration tests for hooks_manager."""
 
 import json
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -8,9 +9,21 @@ from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# hooks_manager is importable via the sys.path entry tests/conftest.py adds
 
-from hooks_manager import create_parser, main, EVENT_TYPES
+from hooks_manager import (
+    create_parser, get_parser, main, EVENT_TYPES, EVENT_TYPES_SET, COMMAND_METHODS, SUBCOMMANDS, HooksManager
+)
+
+
+# One pass over command output finds every event name it mentions
+EVENT_RE = re.compile("|".join(map(re.escape, EVENT_TYPES)))
+
+
+def run_main(*argv):
+    """Call main() as if invoked with the given command-line arguments."""
+    with patch('sys.argv', ['hooks_manager', *argv]):
+        return main()
 
 
 class TestArgumentParser:
@@ -21,110 +34,78 @@ class TestArgumentParser:
         assert parser is not None
         assert parser.prog == "hooks_manager"
 
-    def test_global_flag(self, parser):
-        """Test --global flag is recognized."""
-        args = parser.parse_args(["--global", "list"])
-        assert args.global_scope is True
-        assert args.project_scope is False
-
-    def test_project_flag(self, parser):
-        """Test --project flag is recognized."""
-        args = parser.parse_args(["--project", "list"])
-        assert args.project_scope is True
-        assert args.global_scope is False
-
     def test_global_project_mutually_exclusive(self, parser):
         """Test --global and --project are mutually exclusive."""
         with pytest.raises(SystemExit):
             parser.parse_args(["--global", "--project", "list"])
 
-    def test_json_flag(self, parser):
-        """Test --json flag is recognized."""
-        args = parser.parse_args(["--json", "list"])
-        assert args.json is True
-
-    def test_quiet_flag(self, parser):
-        """Test --quiet flag is recognized."""
-        args = parser.parse_args(["--quiet", "list"])
-        assert args.quiet is True
-
-    def test_dry_run_flag(self, parser):
-        """Test --dry-run flag is recognized."""
-        args = parser.parse_args(["--dry-run", "list"])
-        assert args.dry_run is True
-
-    def test_no_color_flag(self, parser):
-        """Test --no-color flag is recognized."""
-        args = parser.parse_args(["--no-color", "list"])
-        assert args.no_color is True
-
-    def test_no_backup_flag(self, parser):
-        """Test --no-backup flag is recognized."""
-        args = parser.parse_args(["--no-backup", "list"])
-        assert args.no_backup is True
+        # The parser fixture is session-scoped; the error path must leave it usable
+        assert parser.parse_args(["--global", "list"]).global_scope is True
+
+    @pytest.mark.parametrize("flag,attr", [
+        ("--global", "global_scope"),
+        ("--project", "project_scope"),
+        ("--json", "json"),
+        ("--quiet", "quiet"),
+        ("--dry-run", "dry_run"),
+        ("--no-color", "no_color"),
+        ("--no-backup", "no_backup"),
+        ("--force", "force"),
+    ])
+    def test_global_flag_recognized(self, parser, flag, attr):
+        """Test each global flag sets its attribute and leaves the scopes alone."""
+        args = parser.parse_args([flag, "list"])
+        assert getattr(args, attr) is True
+        assert args.global_scope is (attr == "global_scope")
+        assert args.project_scope is (attr == "project_scope")
+
+    def test_parser_for_argv_builds_active_command(self):
+        """Test create_parser(argv) configures the named subcommand."""
+        parser = create_parser(["--json", "show", "lint"])
+        args = parser.parse_args(["--json", "show", "lint"])
+        assert args.command == "show"
+        assert args.name == "lint"
+
+    def test_parser_for_argv_resolves_alias(self):
+        """Test create_parser(argv) configures add when invoked as create."""
+        argv = ["create", "--name", "x", "--event", "Stop", "--command", "true"]
+        args = create_parser(argv).parse_args(argv)
+        assert args.hook_name == "x"
+        assert args.timeout == 60
+
+    def test_parser_for_argv_skips_other_commands(self):
+        """Test subcommands not named in argv are left unconfigured."""
+        parser = create_parser(["list"])
+        with pytest.raises(SystemExit):
+            parser.parse_args(["show", "lint"])
 
-    def test_force_flag(self, parser):
-        """Test --force flag is recognized."""
-        args = parser.parse_args(["--force", "list"])
-        assert args.force is True
+    def test_get_parser_is_memoized(self):
+        """Test get_parser reuses the parser for the same subcommand."""
+        assert get_parser(["list"]) is get_parser(["--json", "list"])
+        assert get_parser(["list"]) is not get_parser(["show", "x"])
 
 
 class TestSubcommands:
     """Tests for subcommand parsing."""
 
-    def test_list_command(self, parser):
-        """Test list command parsing."""
-        args = parser.parse_args(["list"])
-        assert args.command == "list"
-
-    def test_show_command(self, parser):
-        """Test show command parsing."""
-        args = parser.parse_args(["show", "hook-name"])
-        assert args.command == "show"
-        assert args.name == "hook-name"
-
-    def test_events_command(self, parser):
-        """Test events command parsing."""
-        args = parser.parse_args(["events"])
-        assert args.command == "events"
-
-    def test_validate_command(self, parser):
-        """Test validate command parsing."""
-        args = parser.parse_args(["validate"])
-        assert args.command == "validate"
-
-    def test_enable_command(self, parser):
-        """Test enable command parsing."""
-        args = parser.parse_args(["enable", "hook-name"])
-        assert args.command == "enable"
-        assert args.name == "hook-name"
-
-    def test_disable_command(self, parser):
-        """Test disable command parsing."""
-        args = parser.parse_args(["disable", "hook-name"])
-        assert args.command == "disable"
-        assert args.name == "hook-name"
-
-    def test_enable_all_command(self, parser):
-        """Test enable-all command parsing."""
-        args = parser.parse_args(["enable-all"])
-        assert args.command == "enable-all"
-
-    def test_disable_all_command(self, parser):
-        """Test disable-all command parsing."""
-        args = parser.parse_args(["disable-all"])
-        assert args.command == "disable-all"
-
-    def test_remove_command(self, parser):
-        """Test remove command parsing."""
-        args = parser.parse_args(["remove", "hook-name"])
-        assert args.command == "remove"
-        assert args.name == "hook-name"
-
-    def test_remove_all_command(self, parser):
-        """Test remove-all command parsing."""
-        args = parser.parse_args(["remove-all"])
-        assert args.command == "remove-all"
+    @pytest.mark.parametrize("argv,name", [
+        (["list"], None),
+        (["show", "hook-name"], "hook-name"),
+        (["events"], None),
+        (["validate"], None),
+        (["enable", "hook-name"], "hook-name"),
+        (["disable", "hook-name"], "hook-name"),
+        (["enable-all"], None),
+        (["disable-all"], None),
+        (["remove", "hook-name"], "hook-name"),
+        (["remove-all"], None),
+    ])
+    def test_simple_command(self, parser, argv, name):
+        """Test subcommands that take at most a hook name."""
+        args = parser.parse_args(argv)
+        assert args.command == argv[0]
+        if name is not None:
+            assert args.name == name
 
     def test_add_command(self, parser):
         """Test add command parsing."""
@@ -210,269 +191,209 @@ class TestSubcommands:
 class TestMainFunction:
     """Tests for main() function."""
 
-    def test_no_command_shows_help(self, capsys):
+    def test_no_command_shows_help(self, capfd):
         """Test that no command shows help."""
-        with patch('sys.argv', ['hooks_manager']):
-            result = main()
+        result = run_main()
 
         assert result == 0
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "usage:" in captured.out.lower() or "hooks" in captured.out.lower()
 
-    def test_list_command_execution(self, tmp_path, sample_settings, capsys):
-        """Test list command executes successfully."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
+    @pytest.mark.slow
+    @pytest.mark.serial
+    def test_no_command_does_not_create_manager(self, capsys):
+        """Test the help path never constructs HooksManager or imports renderers."""
+        code = (
+            "import sys; from unittest.mock import patch; import hooks_manager; "
+            "sys.argv = ['hooks_manager']; "
+            "p = patch.object(hooks_manager, 'HooksManager'); m = p.start(); "
+            "hooks_manager.main(); "
+            "print(m.called, 'renderers' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, cwd=Path(__file__).parent.parent
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip().endswith("False False")
 
-        with patch('sys.argv', ['hooks_manager', '--project', 'list']):
-            with patch.object(Path, 'cwd', return_value=tmp_path):
-                result = main()
+    def test_every_subcommand_has_handler(self):
+        """Test each subcommand and alias dispatches to a HooksManager method."""
+        names = set(SUBCOMMANDS)
+        for _, aliases, _ in SUBCOMMANDS.values():
+            names.update(aliases)
+
+        assert set(COMMAND_METHODS) == names
+        for method in COMMAND_METHODS.values():
+            assert callable(getattr(HooksManager, method))
+
+    def test_list_command_execution(self, project_dir, cwd_in_tmp, capsys):
+        """Test list command executes successfully."""
+        result = run_main('--project', 'list')
 
         assert result == 0
 
-    def test_events_command_execution(self, tmp_path, capsys):
+    def test_events_command_execution(self, cwd_in_tmp, capfd):
         """Test events command executes successfully."""
-        settings_dir = tmp_path / ".claude"
+        settings_dir = cwd_in_tmp / ".claude"
         settings_dir.mkdir(parents=True)
 
-        with patch('sys.argv', ['hooks_manager', '--project', 'events']):
-            with patch.object(Path, 'cwd', return_value=tmp_path):
-                result = main()
+        result = run_main('--project', 'events')
 
         assert result == 0
-        captured = capsys.readouterr()
-        for event in EVENT_TYPES:
-            assert event in captured.out
+        captured = capfd.readouterr()
+        assert set(EVENT_RE.findall(captured.out)) == EVENT_TYPES_SET
 
-    def test_validate_command_execution(self, tmp_path, sample_settings, capsys):
+    def test_validate_command_execution(self, project_dir, cwd_in_tmp, capsys):
         """Test validate command executes successfully."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-
-        with patch('sys.argv', ['hooks_manager', '--project', 'validate']):
-            with patch.object(Path, 'cwd', return_value=tmp_path):
-                result = main()
+        result = run_main('--project', 'validate')
 
         assert result == 0
 
-    def test_show_command_execution(self, tmp_path, sample_settings, capsys):
+    def test_show_command_execution(self, project_dir, cwd_in_tmp, capfd):
         """Test show command executes successfully."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-
-        with patch('sys.argv', ['hooks_manager', '--project', 'show', 'lint']):
-            with patch.object(Path, 'cwd', return_value=tmp_path):
-                result = main()
+        result = run_main('--project', 'show', 'lint')
 
         assert result == 0
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "lint" in captured.out
 
 
 class TestCLIEndToEnd:
-    """End-to-end CLI tests using subprocess."""
+    """End-to-end CLI tests running main() in-process from the project directory."""
 
-    @pytest.fixture
-    def script_path(self):
-        """Get path to hooks_manager.py script."""
-        return str(Path(__file__).parent.parent / "hooks_manager.py")
+    def run_cli(self, argv, cwd, monkeypatch):
+        """Run main() with argv as if launched from cwd and return its exit code."""
+        monkeypatch.chdir(cwd)
+        return run_main(*argv)
 
-    def test_script_runs(self, script_path):
+    @pytest.mark.slow
+    @pytest.mark.serial
+    def test_script_runs(self, py_cmd):
         """Test script can be executed."""
         result = subprocess.run(
-            [sys.executable, script_path, "--help"],
+            py_cmd + ["--help"],
             capture_output=True,
             text=True
         )
         assert result.returncode == 0
         assert "usage:" in result.stdout.lower()
 
-    def test_version_flag(self, script_path):
+    def test_version_flag(self, tmp_path, monkeypatch, capsys):
         """Test --version flag."""
-        result = subprocess.run(
-            [sys.executable, script_path, "--version"],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
-        assert "1.0.0" in result.stdout
+        with pytest.raises(SystemExit) as exc_info:
+            self.run_cli(["--version"], tmp_path, monkeypatch)
+
+        assert exc_info.value.code == 0
+        assert "1.0.0" in capsys.readouterr().out
 
-    def test_list_with_nonexistent_settings(self, script_path, tmp_path):
+    def test_list_with_nonexistent_settings(self, tmp_path, monkeypatch):
         """Test list command with non-existent settings."""
-        result = subprocess.run(
-            [sys.executable, script_path, "--project", "list"],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path
-        )
         # Should not crash, just show empty list
-        assert result.returncode == 0
+        assert self.run_cli(["--project", "list"], tmp_path, monkeypatch) == 0
 
-    def test_events_command_output(self, script_path):
+    def test_events_command_output(self, tmp_path, monkeypatch, capsys):
         """Test events command output contains all event types."""
-        result = subprocess.run(
-            [sys.executable, script_path, "events"],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
-        for event in EVENT_TYPES:
-            assert event in result.stdout
+        assert self.run_cli(["events"], tmp_path, monkeypatch) == 0
 
-    def test_json_output_format(self, script_path, tmp_path, sample_settings):
-        """Test --json flag produces valid JSON."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
+        out = capsys.readouterr().out
+        assert set(EVENT_RE.findall(out)) == EVENT_TYPES_SET
 
-        result = subprocess.run(
-            [sys.executable, script_path, "--project", "--json", "list"],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path
-        )
-        assert result.returncode == 0
+    def test_json_output_format(self, project_dir, monkeypatch, capsys):
+        """Test --json flag produces valid JSON."""
+        assert self.run_cli(["--project", "--json", "list"], project_dir, monkeypatch) == 0
 
         # Output should be valid JSON
-        data = json.loads(result.stdout)
+        data = json.loads(capsys.readouterr().out)
         assert "hooks" in data
 
-    def test_export_to_stdout(self, script_path, tmp_path, sample_settings):
+    def test_export_to_stdout(self, project_dir, monkeypatch, capsys):
         """Test export to stdout."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-
-        result = subprocess.run(
-            [sys.executable, script_path, "--project", "export"],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path
-        )
-        assert result.returncode == 0
+        assert self.run_cli(["--project", "export"], project_dir, monkeypatch) == 0
 
         # Output should be valid JSON
-        data = json.loads(result.stdout)
+        data = json.loads(capsys.readouterr().out)
         assert "hooks" in data
         assert "version" in data
 
-    def test_export_to_file(self, script_path, tmp_path, sample_settings):
+    def test_export_to_file(self, project_dir, monkeypatch):
         """Test export to file."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
+        export_file = project_dir / "export.json"
 
-        export_file = tmp_path / "export.json"
-
-        result = subprocess.run(
-            [sys.executable, script_path, "--project", "export", str(export_file)],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path
-        )
-        assert result.returncode == 0
+        assert self.run_cli(["--project", "export", str(export_file)],
+                            project_dir, monkeypatch) == 0
         assert export_file.exists()
 
-        data = json.loads(export_file.read_text())
-        assert "hooks" in data
-
-    def test_visualize_terminal_format(self, script_path, tmp_path, sample_settings):
-        """Test visualize command with terminal format."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-
-        result = subprocess.run(
-            [sys.executable, script_path, "--project", "visualize", "--format", "terminal"],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path
+        # Structure is checked by test_export_to_stdout; only look for the keys here
+        data = export_file.read_bytes()
+        assert b'"hooks"' in data
+        assert b'"version"' in data
+
+    @pytest.mark.slow
+    @pytest.mark.serial
+    def test_visualize_terminal_imports_only_its_renderer(self, project_dir):
+        """Test a terminal visualize run never imports the HTML or TUI backends."""
+        # A fresh interpreter: this process has already imported every renderer
+        code = (
+            "import os, sys; repo, project = sys.argv[1:]; sys.path.insert(0, repo); "
+            "import hooks_manager; os.chdir(project); "
+            "sys.argv = ['hooks_manager', '--project', 'visualize', '--format', 'terminal']; "
+            "rc = hooks_manager.main(); "
+            "names = ('renderers.html', 'renderers.markdown', 'renderers.tui', 'curses'); "
+            "print(rc, [m for m in names if m in sys.modules])"
         )
-        assert result.returncode == 0
-        assert "Claude Code Extensions" in result.stdout
-
-    def test_visualize_markdown_format(self, script_path, tmp_path, sample_settings):
-        """Test visualize command with markdown format."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-
         result = subprocess.run(
-            [sys.executable, script_path, "--project", "visualize", "--format", "markdown"],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path
+            [sys.executable, "-c", code, str(Path(__file__).parent.parent), str(project_dir)],
+            capture_output=True, text=True
         )
-        assert result.returncode == 0
-        assert "# Claude Code Extensions" in result.stdout
 
-    def test_visualize_html_creates_file(self, script_path, tmp_path, sample_settings):
-        """Test visualize command with HTML format creates file."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines()[-1] == "0 []"
 
-        result = subprocess.run(
-            [sys.executable, script_path, "--project", "visualize", "--format", "html"],
-            capture_output=True,
-            text=True,
-            cwd=tmp_path
-        )
-        assert result.returncode == 0
+    @pytest.mark.parametrize("fmt,expected", [
+        ("terminal", "Claude Code Extensions"),
+        ("markdown", "# Claude Code Extensions"),
+        ("html", "<!DOCTYPE html>"),
+    ])
+    def test_visualize_format(self, project_dir, monkeypatch, capsys, fmt, expected):
+        """Test visualize renders each format; HTML defaults to creating a file."""
+        assert self.run_cli(["--project", "visualize", "--format", fmt],
+                            project_dir, monkeypatch) == 0
 
-        # HTML defaults to creating a file
-        html_file = tmp_path / "claude-extensions.html"
-        assert html_file.exists()
+        if fmt == "html":
+            html_file = project_dir / "claude-extensions.html"
+            assert html_file.exists()
+            output = html_file.read_text()
+        else:
+            output = capsys.readouterr().out
+        assert expected in output
 
 
 class TestCLIErrorHandling:
     """Tests for CLI error handling."""
 
-    def test_show_nonexistent_hook(self, tmp_path, sample_settings, capsys):
-        """Test show command with non-existent hook."""
-        settings_file = tmp_path / ".claude" / "settings.json"
+    @pytest.mark.parametrize("argv", [
+        ("show", "nonexistent"),
+        ("enable", "nonexistent"),
+        ("import", "nonexistent.json"),
+    ], ids=["show", "enable", "import"])
+    def test_missing_target_exits_1(self, project_dir, cwd_in_tmp, argv):
+        """Test commands naming a non-existent hook or file return 1."""
+        assert run_main('--project', *argv) == 1
+
+    @pytest.mark.parametrize("argv", [
+        ("list",),
+        ("visualize", "--format", "markdown"),
+    ], ids=["list", "visualize"])
+    def test_invalid_settings_json(self, cwd_in_tmp, capsys, argv):
+        """Test commands reading an invalid settings file report it and exit 1."""
+        settings_file = cwd_in_tmp / ".claude" / "settings.json"
         settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
+        settings_file.write_bytes(b"not valid json")
 
-        with patch('sys.argv', ['hooks_manager', '--project', 'show', 'nonexistent']):
-            with patch.object(Path, 'cwd', return_value=tmp_path):
-                result = main()
-
-        assert result == 1
-
-    def test_enable_nonexistent_hook(self, tmp_path, sample_settings):
-        """Test enable command with non-existent hook."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-
-        with patch('sys.argv', ['hooks_manager', '--project', 'enable', 'nonexistent']):
-            with patch.object(Path, 'cwd', return_value=tmp_path):
-                result = main()
-
-        assert result == 1
-
-    def test_import_nonexistent_file(self, tmp_path):
-        """Test import command with non-existent file."""
-        settings_dir = tmp_path / ".claude"
-        settings_dir.mkdir(parents=True)
-
-        with patch('sys.argv', ['hooks_manager', '--project', 'import', 'nonexistent.json']):
-            with patch.object(Path, 'cwd', return_value=tmp_path):
-                result = main()
-
-        assert result == 1
-
-    def test_invalid_settings_json(self, tmp_path, capsys):
-        """Test with invalid JSON in settings file."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True)
-        settings_file.write_text("not valid json")
+        with pytest.raises(SystemExit) as excinfo:
+            run_main('--project', *argv)
 
-        with patch('sys.argv', ['hooks_manager', '--project', 'list']):
-            with patch.object(Path, 'cwd', return_value=tmp_path):
-                with pytest.raises(SystemExit):
-                    main()
+        assert excinfo.value.code == 1
+        assert "Invalid JSON" in capsys.readouterr().err
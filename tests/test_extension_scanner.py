@@ -1,14 +1,23 @@
 """Tests for ExtensionScanner class."""
 
-import json
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# hooks_manager is importable via the sys.path entry tests/conftest.py adds
+from hooks_manager import (
+    ExtensionScanner, SkillInfo, CommandInfo, HookInfo, ExtensionsData, _json_dumps, _skill_patterns
+)
 
-from hooks_manager import ExtensionScanner, SkillInfo, CommandInfo, HookInfo, ExtensionsData
+# .claude trees for the multi-item scans, built and encoded once at import
+MULTIPLE_SKILLS = {
+    f"skills/{name}/SKILL.md": f"# {name.title()}\nDescription for {name}".encode()
+    for name in ("skill-a", "skill-b", "skill-c")
+}
+MULTIPLE_COMMANDS = {
+    f"commands/{name}.md": f"# {name.title()}\nDescription for {name}".encode()
+    for name in ("cmd-a", "cmd-b", "cmd-c")
+}
 
 
 class TestExtensionScannerInit:
@@ -32,48 +41,55 @@ class TestExtensionScannerInit:
         expected_dir = Path.home() / ".claude"
         assert scanner.claude_dir == expected_dir
 
+    def test_skill_patterns_compiled_on_first_parse(self, tmp_path):
+        """Test SKILL.md patterns are compiled when a skill is parsed, not at init."""
+        _skill_patterns.cache_clear()
+        scanner = ExtensionScanner()
+        assert _skill_patterns.cache_info().currsize == 0
 
-class TestExtensionScannerSkills:
-    """Tests for skill scanning."""
+        scanner._parse_skill_file(tmp_path / "missing.md")
+        assert _skill_patterns.cache_info().currsize == 0
 
-    def test_scan_skills_empty_directory(self, tmp_path):
-        """Test scanning when skills directory is empty."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        skills_dir = claude_dir / "skills"
-        skills_dir.mkdir()
+        (tmp_path / "SKILL.md").write_bytes(b"# Name")
+        scanner._parse_skill_file(tmp_path / "SKILL.md")
+        assert _skill_patterns.cache_info().currsize == 1
 
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
 
-        skills = scanner.scan_skills()
-        assert skills == []
+class TestExtensionScannerEmpty:
+    """Tests for scanning directories that are missing or empty."""
 
-    def test_scan_skills_no_directory(self, tmp_path):
-        """Test scanning when skills directory doesn't exist."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
+    @pytest.mark.parametrize("scan_attr,subdir", [
+        ("scan_skills", "skills"),
+        ("scan_commands", "commands"),
+    ])
+    @pytest.mark.parametrize("create", [False, True], ids=["no-directory", "empty-directory"])
+    def test_scan_returns_empty_list(self, scanner_for, scan_attr, subdir, create):
+        """Test scanning a missing or empty skills/commands directory returns []."""
+        scanner = scanner_for({subdir: None} if create else {})
 
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+        assert getattr(scanner, scan_attr)() == []
 
-        skills = scanner.scan_skills()
-        assert skills == []
+    @pytest.mark.parametrize("content", [None, b'{"hooks": {}}'], ids=["no-settings-file", "empty-settings"])
+    def test_scan_hooks_returns_empty_list(self, tmp_path, content):
+        """Test scanning a missing settings file or one without hooks returns []."""
+        settings_file = tmp_path / "settings.json"
+        if content is not None:
+            settings_file.write_bytes(content)
 
-    def test_scan_skills_with_skill(self, tmp_path):
-        """Test scanning with a valid skill."""
-        claude_dir = tmp_path / ".claude"
-        skills_dir = claude_dir / "skills" / "my-skill"
-        skills_dir.mkdir(parents=True)
+        scanner = ExtensionScanner(settings_path=settings_file)
+
+        assert scanner.scan_hooks() == []
 
-        skill_file = skills_dir / "SKILL.md"
-        skill_file.write_text("""# My Skill
+
+class TestExtensionScannerSkills:
+    """Tests for skill scanning."""
+
+    def test_scan_skills_with_skill(self, scanner_for):
+        """Test scanning with a valid skill."""
+        scanner = scanner_for({"skills/my-skill/SKILL.md": b"""# My Skill
 This is a test skill.
 Triggers: test, demo
-""")
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+"""})
 
         skills = scanner.scan_skills()
 
@@ -82,18 +98,9 @@ Triggers: test, demo
         assert skills[0].description == "This is a test skill."
         assert skills[0].triggers == ["test", "demo"]
 
-    def test_scan_skills_multiple_skills(self, tmp_path):
+    def test_scan_skills_multiple_skills(self, scanner_for):
         """Test scanning multiple skills."""
-        claude_dir = tmp_path / ".claude"
-
-        for name in ["skill-a", "skill-b", "skill-c"]:
-            skill_dir = claude_dir / "skills" / name
-            skill_dir.mkdir(parents=True)
-            skill_file = skill_dir / "SKILL.md"
-            skill_file.write_text(f"# {name.title()}\nDescription for {name}")
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+        scanner = scanner_for(MULTIPLE_SKILLS)
 
         skills = scanner.scan_skills()
 
@@ -101,30 +108,28 @@ Triggers: test, demo
         # Skills should be sorted alphabetically
         assert skills[0].name == "Skill-A"
 
-    def test_scan_skills_no_skill_md(self, tmp_path):
-        """Test scanning skill directory without SKILL.md."""
-        claude_dir = tmp_path / ".claude"
-        skill_dir = claude_dir / "skills" / "incomplete-skill"
-        skill_dir.mkdir(parents=True)
-        # No SKILL.md file
+    def test_scan_skills_ignores_files_and_follows_symlinks(self, tmp_path, scanner_for):
+        """Test plain files under skills/ are skipped and symlinked skill dirs are read."""
+        linked = tmp_path / "elsewhere"
+        linked.mkdir()
+        (linked / "SKILL.md").write_bytes(b"# Linked Skill\nDescription")
+        scanner = scanner_for({"skills/README.md": b"# Not a skill"})
+        (scanner.claude_dir / "skills" / "linked").symlink_to(linked)
 
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+        skills = scanner.scan_skills()
+
+        assert [s.name for s in skills] == ["Linked Skill"]
+
+    def test_scan_skills_no_skill_md(self, scanner_for):
+        """Test scanning skill directory without SKILL.md."""
+        scanner = scanner_for({"skills/incomplete-skill": None})
 
         skills = scanner.scan_skills()
         assert skills == []
 
-    def test_scan_skills_uses_directory_name_as_fallback(self, tmp_path):
+    def test_scan_skills_uses_directory_name_as_fallback(self, scanner_for):
         """Test that directory name is used when no # header found."""
-        claude_dir = tmp_path / ".claude"
-        skill_dir = claude_dir / "skills" / "fallback-skill"
-        skill_dir.mkdir(parents=True)
-
-        skill_file = skill_dir / "SKILL.md"
-        skill_file.write_text("Just a description, no header")
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+        scanner = scanner_for({"skills/fallback-skill/SKILL.md": b"Just a description, no header"})
 
         skills = scanner.scan_skills()
 
@@ -135,42 +140,11 @@ Triggers: test, demo
 class TestExtensionScannerCommands:
     """Tests for command scanning."""
 
-    def test_scan_commands_empty_directory(self, tmp_path):
-        """Test scanning when commands directory is empty."""
-        claude_dir = tmp_path / ".claude"
-        commands_dir = claude_dir / "commands"
-        commands_dir.mkdir(parents=True)
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
-
-        commands = scanner.scan_commands()
-        assert commands == []
-
-    def test_scan_commands_no_directory(self, tmp_path):
-        """Test scanning when commands directory doesn't exist."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
-
-        commands = scanner.scan_commands()
-        assert commands == []
-
-    def test_scan_commands_with_command(self, tmp_path):
+    def test_scan_commands_with_command(self, scanner_for):
         """Test scanning with a valid command."""
-        claude_dir = tmp_path / ".claude"
-        commands_dir = claude_dir / "commands"
-        commands_dir.mkdir(parents=True)
-
-        cmd_file = commands_dir / "my-command.md"
-        cmd_file.write_text("""# My Command
+        scanner = scanner_for({"commands/my-command.md": b"""# My Command
 This is a test command.
-""")
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+"""})
 
         commands = scanner.scan_commands()
 
@@ -178,53 +152,32 @@ This is a test command.
         assert commands[0].name == "My Command"
         assert commands[0].description == "This is a test command."
 
-    def test_scan_commands_multiple_commands(self, tmp_path):
+    def test_scan_commands_multiple_commands(self, scanner_for):
         """Test scanning multiple commands."""
-        claude_dir = tmp_path / ".claude"
-        commands_dir = claude_dir / "commands"
-        commands_dir.mkdir(parents=True)
-
-        for name in ["cmd-a", "cmd-b", "cmd-c"]:
-            cmd_file = commands_dir / f"{name}.md"
-            cmd_file.write_text(f"# {name.title()}\nDescription for {name}")
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+        scanner = scanner_for(MULTIPLE_COMMANDS)
 
         commands = scanner.scan_commands()
 
         assert len(commands) == 3
 
-    def test_scan_commands_uses_filename_as_fallback(self, tmp_path):
+    def test_scan_commands_uses_filename_as_fallback(self, scanner_for):
         """Test that filename is used when no # header found."""
-        claude_dir = tmp_path / ".claude"
-        commands_dir = claude_dir / "commands"
-        commands_dir.mkdir(parents=True)
-
-        cmd_file = commands_dir / "fallback.md"
-        cmd_file.write_text("Just a description, no header")
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+        scanner = scanner_for({"commands/fallback.md": b"Just a description, no header"})
 
         commands = scanner.scan_commands()
 
         assert len(commands) == 1
         assert commands[0].name == "fallback"
 
-    def test_scan_commands_ignores_non_md_files(self, tmp_path):
-        """Test that non-.md files are ignored."""
-        claude_dir = tmp_path / ".claude"
-        commands_dir = claude_dir / "commands"
-        commands_dir.mkdir(parents=True)
-
+    def test_scan_commands_ignores_non_md_files(self, scanner_for):
+        """Test that non-.md files and directories named *.md are ignored."""
         # Create both .md and non-.md files
-        (commands_dir / "valid.md").write_text("# Valid Command")
-        (commands_dir / "invalid.txt").write_text("# Invalid")
-        (commands_dir / "also-invalid.json").write_text("{}")
-
-        scanner = ExtensionScanner()
-        scanner.claude_dir = claude_dir
+        scanner = scanner_for({
+            "commands/valid.md": b"# Valid Command",
+            "commands/invalid.txt": b"# Invalid",
+            "commands/also-invalid.json": b"{}",
+            "commands/drafts.md": None,
+        })
 
         commands = scanner.scan_commands()
 
@@ -235,41 +188,17 @@ This is a test command.
 class TestExtensionScannerHooks:
     """Tests for hook scanning."""
 
-    def test_scan_hooks_no_settings_file(self, tmp_path):
-        """Test scanning when settings.json doesn't exist."""
-        scanner = ExtensionScanner(settings_path=tmp_path / "nonexistent.json")
-
-        hooks = scanner.scan_hooks()
-        assert hooks == []
-
-    def test_scan_hooks_empty_settings(self, tmp_path):
-        """Test scanning with empty settings."""
-        settings_file = tmp_path / "settings.json"
-        settings_file.write_text('{"hooks": {}}')
-
-        scanner = ExtensionScanner(settings_path=settings_file)
-
-        hooks = scanner.scan_hooks()
-        assert hooks == []
-
-    def test_scan_hooks_with_enabled_hooks(self, tmp_path, sample_settings):
+    def test_scan_hooks_with_enabled_hooks(self, sample_settings_path):
         """Test scanning enabled hooks."""
-        settings_file = tmp_path / "settings.json"
-        settings_file.write_text(json.dumps(sample_settings))
-
-        scanner = ExtensionScanner(settings_path=settings_file)
+        scanner = ExtensionScanner(settings_path=sample_settings_path)
 
         hooks = scanner.scan_hooks()
-        enabled_hooks = [h for h in hooks if h.enabled]
 
-        assert len(enabled_hooks) == 3
+        assert sum(h.enabled for h in hooks) == 3
 
-    def test_scan_hooks_with_disabled_hooks(self, tmp_path, sample_settings):
+    def test_scan_hooks_with_disabled_hooks(self, sample_settings_path):
         """Test scanning disabled hooks."""
-        settings_file = tmp_path / "settings.json"
-        settings_file.write_text(json.dumps(sample_settings))
-
-        scanner = ExtensionScanner(settings_path=settings_file)
+        scanner = ExtensionScanner(settings_path=sample_settings_path)
 
         hooks = scanner.scan_hooks()
         disabled_hooks = [h for h in hooks if not h.enabled]
@@ -280,7 +209,7 @@ class TestExtensionScannerHooks:
     def test_scan_hooks_invalid_json(self, tmp_path):
         """Test scanning with invalid JSON in settings."""
         settings_file = tmp_path / "settings.json"
-        settings_file.write_text("not valid json")
+        settings_file.write_bytes(b"not valid json")
 
         scanner = ExtensionScanner(settings_path=settings_file)
 
@@ -297,7 +226,7 @@ class TestExtensionScannerHooks:
             }
         }
         settings_file = tmp_path / "settings.json"
-        settings_file.write_text(json.dumps(settings))
+        settings_file.write_bytes(_json_dumps(settings, compact=True))
 
         scanner = ExtensionScanner(settings_path=settings_file)
 
@@ -310,27 +239,13 @@ class TestExtensionScannerHooks:
 class TestExtensionScannerScanAll:
     """Tests for scan_all method."""
 
-    def test_scan_all_returns_extensions_data(self, tmp_path, sample_settings):
+    def test_scan_all_returns_extensions_data(self, tmp_path, scanner_for, serialized_sample):
         """Test scan_all returns ExtensionsData instance."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-
-        # Create settings file
-        settings_file = claude_dir / "settings.json"
-        settings_file.write_text(json.dumps(sample_settings))
-
-        # Create a skill
-        skill_dir = claude_dir / "skills" / "test-skill"
-        skill_dir.mkdir(parents=True)
-        (skill_dir / "SKILL.md").write_text("# Test Skill\nDescription")
-
-        # Create a command
-        commands_dir = claude_dir / "commands"
-        commands_dir.mkdir()
-        (commands_dir / "test-cmd.md").write_text("# Test Cmd\nDescription")
-
-        scanner = ExtensionScanner(settings_path=settings_file)
-        scanner.claude_dir = claude_dir
+        scanner = scanner_for({
+            "settings.json": serialized_sample,
+            "skills/test-skill/SKILL.md": b"# Test Skill\nDescription",
+            "commands/test-cmd.md": b"# Test Cmd\nDescription",
+        }, settings_path=tmp_path / ".claude" / "settings.json")
 
         data = scanner.scan_all()
 
@@ -339,13 +254,9 @@ class TestExtensionScannerScanAll:
         assert len(data.commands) == 1
         assert len(data.hooks) == 4  # 3 enabled + 1 disabled
 
-    def test_scan_all_empty_environment(self, tmp_path):
+    def test_scan_all_empty_environment(self, tmp_path, scanner_for):
         """Test scan_all with empty environment."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-
-        scanner = ExtensionScanner(settings_path=tmp_path / "nonexistent.json")
-        scanner.claude_dir = claude_dir
+        scanner = scanner_for({}, settings_path=tmp_path / "nonexistent.json")
 
         data = scanner.scan_all()
 
@@ -358,95 +269,50 @@ class TestExtensionScannerScanAll:
 class TestParseSkillFile:
     """Tests for _parse_skill_file method."""
 
-    def test_parse_complete_skill_file(self, tmp_path):
-        """Test parsing a complete SKILL.md file."""
-        skill_file = tmp_path / "SKILL.md"
-        skill_file.write_text("""# Complete Skill
+    @pytest.mark.parametrize("content,expected", [
+        (b"""# Complete Skill
 This skill does everything.
 Triggers: alpha, beta, gamma
 Some more content...
-""")
-
-        scanner = ExtensionScanner()
-        name, description, triggers = scanner._parse_skill_file(skill_file)
-
-        assert name == "Complete Skill"
-        assert description == "This skill does everything."
-        assert triggers == ["alpha", "beta", "gamma"]
-
-    def test_parse_skill_file_no_triggers(self, tmp_path):
-        """Test parsing SKILL.md without triggers."""
-        skill_file = tmp_path / "SKILL.md"
-        skill_file.write_text("""# No Triggers Skill
+""", ("Complete Skill", "This skill does everything.", ["alpha", "beta", "gamma"])),
+        (b"""# No Triggers Skill
 Just a description.
-""")
-
-        scanner = ExtensionScanner()
-        name, description, triggers = scanner._parse_skill_file(skill_file)
-
-        assert name == "No Triggers Skill"
-        assert description == "Just a description."
-        assert triggers == []
-
-    def test_parse_skill_file_empty(self, tmp_path):
-        """Test parsing empty SKILL.md."""
+""", ("No Triggers Skill", "Just a description.", [])),
+        (b"""  Intro comes first
+#Not a header
+# Title
+# Second Title
+Triggers: ignored
+triggers: last,  wins ,
+""", ("Title", "Intro comes first", ["last", "wins"])),
+        (b"", ("", "", [])),
+        (None, ("", "", [])),
+    ], ids=["complete", "no-triggers", "out-of-order", "empty", "nonexistent"])
+    def test_parse_skill_file(self, scanner, tmp_path, content, expected):
+        """Test parsing SKILL.md variants; a missing file yields empty values."""
         skill_file = tmp_path / "SKILL.md"
-        skill_file.write_text("")
-
-        scanner = ExtensionScanner()
-        name, description, triggers = scanner._parse_skill_file(skill_file)
-
-        assert name == ""
-        assert description == ""
-        assert triggers == []
+        if content is not None:
+            skill_file.write_bytes(content)
 
-    def test_parse_skill_file_nonexistent(self, tmp_path):
-        """Test parsing nonexistent file returns empty values."""
-        scanner = ExtensionScanner()
-        name, description, triggers = scanner._parse_skill_file(tmp_path / "nonexistent.md")
-
-        assert name == ""
-        assert description == ""
-        assert triggers == []
+        assert scanner._parse_skill_file(skill_file) == expected
 
 
 class TestParseCommandFile:
     """Tests for _parse_command_file method."""
 
-    def test_parse_complete_command_file(self, tmp_path):
-        """Test parsing a complete command file."""
-        cmd_file = tmp_path / "test-cmd.md"
-        cmd_file.write_text("""# Test Command
+    @pytest.mark.parametrize("filename,content,expected", [
+        ("test-cmd.md", b"""# Test Command
 This command tests things.
 More content here.
-""")
-
-        scanner = ExtensionScanner()
-        name, description = scanner._parse_command_file(cmd_file)
-
-        assert name == "Test Command"
-        assert description == "This command tests things."
-
-    def test_parse_command_file_no_header(self, tmp_path):
-        """Test parsing command file without header."""
-        cmd_file = tmp_path / "no-header.md"
-        cmd_file.write_text("""Just a description without header.
+""", ("Test Command", "This command tests things.")),
+        ("no-header.md", b"""Just a description without header.
 More content.
-""")
-
-        scanner = ExtensionScanner()
-        name, description = scanner._parse_command_file(cmd_file)
-
-        assert name == "no-header"  # Uses filename
-        assert description == "Just a description without header."
-
-    def test_parse_command_file_empty(self, tmp_path):
-        """Test parsing empty command file."""
-        cmd_file = tmp_path / "empty.md"
-        cmd_file.write_text("")
-
-        scanner = ExtensionScanner()
-        name, description = scanner._parse_command_file(cmd_file)
-
-        assert name == "empty"  # Uses filename
-        assert description == ""
+""", ("no-header", "Just a description without header.")),
+        ("empty.md", b"", ("empty", "")),
+    ], ids=["complete", "no-header", "empty"])
+    def test_parse_command_file(self, scanner, tmp_path, filename, content, expected):
+        """Test parsing command files; the filename is the fallback name."""
+        cmd_file = tmp_path / filename
+        cmd_file.write_bytes(content)
+
+        assert scanner._parse_command_file(cmd_file) == expected
@@ -2,56 +2,88 @@
 
 import json
 import sys
+from contextlib import redirect_stdout
 from io import StringIO
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# hooks_manager is importable via the sys.path entry tests/conftest.py adds
+import hooks_manager as hooks_manager_module
+from hooks_manager import HooksManager, HookInfo, EVENT_TYPES, EVENT_TYPES_SET, Colors, _json_dumps, _json_loads
 
-from hooks_manager import HooksManager, HookInfo, EVENT_TYPES, Colors
+
+def assert_json_shape(data, required_keys=frozenset(), **expected):
+    """Assert a JSON object (or its serialized text) has the given keys and values."""
+    if isinstance(data, (str, bytes)):
+        data = _json_loads(data)
+    missing = required_keys - data.keys()
+    assert not missing, missing
+    assert {k: data.get(k) for k in expected} == expected
+    return data
 
 
 class TestHooksManagerInit:
     """Tests for HooksManager initialization."""
 
-    def test_init_creates_manager(self, mock_args, tmp_path, sample_settings):
+    def test_init_creates_manager(self, mock_args, cwd_in_tmp, temp_settings_file):
         """Test that HooksManager initializes correctly."""
-        settings_dir = tmp_path / ".claude"
-        settings_dir.mkdir(parents=True)
-        settings_file = settings_dir / "settings.json"
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-
         mock_args.project_scope = True
 
-        with patch.object(Path, 'cwd', return_value=tmp_path):
-            manager = HooksManager(mock_args)
+        manager = HooksManager(mock_args)
 
         assert manager.args == mock_args
         assert not manager.use_color  # no_color=True in mock_args
 
-    def test_init_with_missing_settings_creates_empty(self, mock_args, tmp_path):
+    def test_init_with_missing_settings_creates_empty(self, mock_args, cwd_in_tmp):
         """Test that missing settings.json creates empty structure."""
         mock_args.project_scope = True
 
-        with patch.object(Path, 'cwd', return_value=tmp_path):
-            manager = HooksManager(mock_args)
-
+        manager = HooksManager(mock_args)
         assert manager.settings == {"hooks": {}, "_disabled_hooks": {}}
 
-    def test_color_disabled_with_no_color_flag(self, mock_args, tmp_path, sample_settings):
-        """Test that --no-color flag disables colors."""
-        settings_dir = tmp_path / ".claude"
+    def test_init_defers_settings_load(self, mock_args, cwd_in_tmp, capsys):
+        """Test that settings are not read until a command needs them."""
+        settings_dir = cwd_in_tmp / ".claude"
         settings_dir.mkdir(parents=True)
-        settings_file = settings_dir / "settings.json"
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
+        (settings_dir / "settings.json").write_bytes(b"{ invalid json }")
+
+        mock_args.project_scope = True
+
+        manager = HooksManager(mock_args)
+        assert manager.cmd_events() == 0
+
+        assert "settings" not in vars(manager)
+        assert "settings_path" not in vars(manager)
+
+    def test_project_scope_reported_in_list(self, mock_args, cwd_in_tmp, capsys):
+        """Test that cmd_list reports project scope for ./.claude/settings.json."""
+        mock_args.project_scope = True
+        mock_args.json = True
+
+        manager = HooksManager(mock_args)
+        manager.cmd_list()
+
+        assert_json_shape(capsys.readouterr().out, scope="project")
+        assert manager.scope == "project"
+
+    def test_events_does_not_load_settings(self, mock_args, cwd_in_tmp):
+        """Test that cmd_events never resolves or reads settings.json."""
+        manager = HooksManager(mock_args)
 
+        with redirect_stdout(StringIO()) as out:
+            assert manager.cmd_events() == 0
+
+        assert "PreToolUse" in out.getvalue()
+        assert "settings" not in vars(manager)
+        assert "settings_path" not in vars(manager)
+
+    def test_color_disabled_with_no_color_flag(self, mock_args, cwd_in_tmp, temp_settings_file):
+        """Test that --no-color flag disables colors."""
         mock_args.no_color = True
         mock_args.project_scope = True
 
-        with patch.object(Path, 'cwd', return_value=tmp_path):
-            manager = HooksManager(mock_args)
+        manager = HooksManager(mock_args)
 
         assert not manager.use_color
 
@@ -72,11 +104,10 @@ class TestHooksManagerFindHooks:
     def test_find_all_hooks_marks_enabled_correctly(self, hooks_manager):
         """Test that enabled hooks are marked as enabled."""
         hooks = hooks_manager._find_all_hooks()
-        enabled_hooks = [h for h in hooks if h.enabled]
-        disabled_hooks = [h for h in hooks if not h.enabled]
+        enabled_count = sum(h.enabled for h in hooks)
 
-        assert len(enabled_hooks) == 3  # lint, format, confirm-dangerous
-        assert len(disabled_hooks) == 1  # slow-tests
+        assert enabled_count == 3  # lint, format, confirm-dangerous
+        assert len(hooks) - enabled_count == 1  # slow-tests
 
     def test_find_hooks_by_name_case_insensitive(self, hooks_manager):
         """Test that finding hooks by name is case-insensitive."""
@@ -100,6 +131,46 @@ class TestHooksManagerFindHooks:
 
         assert hooks == []
 
+    def test_find_all_hooks_null_commands_become_list(self, hooks_manager):
+        """Test a hook with "hooks": null gets an empty commands list."""
+        hooks_manager.settings["hooks"]["Stop"] = [{"_name": "bare", "hooks": None}]
+
+        hook = hooks_manager._find_hooks_by_name("bare")[0]
+        assert hook.commands == []
+
+    def test_find_hooks_by_name_casefold(self, hooks_manager):
+        """Test that name matching uses Unicode case folding."""
+        hooks_manager.settings["hooks"]["PreToolUse"].append({"_name": "straße", "hooks": []})
+
+        hooks = hooks_manager._find_hooks_by_name("STRASSE")
+        assert len(hooks) == 1
+        assert hooks[0].name == "straße"
+
+    def test_find_hooks_by_name_duplicate_across_events(self, hooks_manager):
+        """Test that a name shared by two events returns both hooks."""
+        hooks_manager.settings["hooks"]["PreToolUse"].append({"_name": "lint", "hooks": []})
+
+        assert len(hooks_manager._find_hooks_by_name("lint")) == 2
+        hooks = hooks_manager._find_hooks_by_name("pretooluse:LINT")
+        assert len(hooks) == 1
+        assert hooks[0].event == "PreToolUse"
+
+    def test_find_all_hooks_is_cached(self, hooks_manager):
+        """Test that repeated _find_all_hooks calls reuse the same list."""
+        assert hooks_manager._find_all_hooks() is hooks_manager._find_all_hooks()
+
+    def test_find_all_hooks_cache_invalidated_on_change(self, hooks_manager):
+        """Test that modifying settings refreshes the cached hooks."""
+        hooks_manager.dry_run = True
+        hooks_manager.args.name = "lint"
+        before = hooks_manager._find_all_hooks()
+
+        hooks_manager.cmd_disable()
+
+        after = hooks_manager._find_all_hooks()
+        assert after is not before
+        assert not hooks_manager._find_hooks_by_name("lint")[0].enabled
+
 
 class TestHooksManagerCommands:
     """Tests for HooksManager command methods."""
@@ -109,38 +180,49 @@ class TestHooksManagerCommands:
         result = hooks_manager.cmd_list()
         assert result == 0
 
-    def test_cmd_list_json_output(self, hooks_manager, capsys):
-        """Test that cmd_list with --json outputs valid JSON."""
-        hooks_manager.args.json = True
-        hooks_manager.cmd_list()
-
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
+    def test_cmd_list_human_output(self, hooks_manager):
+        """Test that cmd_list prints enabled and disabled sections."""
+        with redirect_stdout(StringIO()) as buf:
+            hooks_manager.cmd_list()
 
-        assert "hooks" in data
-        assert "path" in data
-        assert isinstance(data["hooks"], list)
+        out = buf.getvalue()
+        assert "ENABLED:" in out
+        assert "DISABLED:" in out
+        assert "[PostToolUse] lint (matcher: Write|Edit)" in out
+        assert out.endswith("\n")
 
-    def test_cmd_list_quiet_output(self, hooks_manager, capsys):
-        """Test that cmd_list with --quiet outputs minimal format."""
-        hooks_manager.args.quiet = True
+    def test_cmd_list_json_output(self, hooks_manager, json_payloads):
+        """Test that cmd_list with --json emits the hook listing."""
+        hooks_manager.json_out = True
         hooks_manager.cmd_list()
 
-        captured = capsys.readouterr()
-        lines = [l for l in captured.out.strip().split('\n') if l]
+        data, = json_payloads
 
-        # Each line should be in event:name format
-        for line in lines:
-            assert ':' in line
+        assert_json_shape(data, {"hooks", "path"})
+        assert isinstance(data["hooks"], list)
 
-    def test_cmd_show_existing_hook(self, hooks_manager, capsys):
+    def test_cmd_list_quiet_output(self, hooks_manager):
+        """Test that cmd_list with --quiet outputs minimal format."""
+        hooks_manager.quiet = True
+        with redirect_stdout(StringIO()) as buf:
+            hooks_manager.cmd_list()
+
+        # One event:name line per hook, enabled and disabled alike
+        assert sorted(buf.getvalue().splitlines()) == [
+            "PostToolUse:format",
+            "PostToolUse:lint",
+            "PostToolUse:slow-tests",
+            "PreToolUse:confirm-dangerous",
+        ]
+
+    def test_cmd_show_existing_hook(self, hooks_manager):
         """Test showing details of an existing hook."""
         hooks_manager.args.name = "lint"
-        result = hooks_manager.cmd_show()
+        with redirect_stdout(StringIO()) as out:
+            result = hooks_manager.cmd_show()
 
         assert result == 0
-        captured = capsys.readouterr()
-        assert "lint" in captured.out
+        assert "lint" in out.getvalue()
 
     def test_cmd_show_nonexistent_hook(self, hooks_manager, capsys):
         """Test showing details of non-existent hook returns error."""
@@ -149,41 +231,33 @@ class TestHooksManagerCommands:
 
         assert result == 1
 
-    def test_cmd_show_json_output(self, hooks_manager, capsys):
-        """Test cmd_show with --json outputs valid JSON."""
+    def test_cmd_show_json_output(self, hooks_manager, json_payloads):
+        """Test cmd_show with --json emits the hook details."""
         hooks_manager.args.name = "lint"
-        hooks_manager.args.json = True
+        hooks_manager.json_out = True
         hooks_manager.cmd_show()
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data, = json_payloads
 
-        assert data["name"] == "lint"
-        assert data["event"] == "PostToolUse"
-        assert data["enabled"] is True
+        assert_json_shape(data, name="lint", event="PostToolUse", enabled=True)
 
-    def test_cmd_events_lists_all_events(self, hooks_manager, capsys):
+    def test_cmd_events_lists_all_events(self, hooks_manager):
         """Test that cmd_events lists all event types."""
-        result = hooks_manager.cmd_events()
+        with redirect_stdout(StringIO()) as out:
+            result = hooks_manager.cmd_events()
 
         assert result == 0
-        captured = capsys.readouterr()
+        assert EVENT_TYPES_SET <= set(out.getvalue().split())
 
-        for event in EVENT_TYPES:
-            assert event in captured.out
-
-    def test_cmd_events_json_output(self, hooks_manager, capsys):
-        """Test cmd_events with --json outputs valid JSON."""
-        hooks_manager.args.json = True
+    def test_cmd_events_json_output(self, hooks_manager, json_payloads):
+        """Test cmd_events with --json emits every event type."""
+        hooks_manager.json_out = True
         hooks_manager.cmd_events()
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data, = json_payloads
 
         assert len(data) == len(EVENT_TYPES)
-        event_names = [e["event"] for e in data]
-        for event in EVENT_TYPES:
-            assert event in event_names
+        assert {e["event"] for e in data} == EVENT_TYPES_SET
 
     def test_cmd_validate_valid_settings(self, hooks_manager, capsys):
         """Test validation of valid settings."""
@@ -191,102 +265,55 @@ class TestHooksManagerCommands:
 
         assert result == 0
 
-    def test_cmd_validate_json_output(self, hooks_manager, capsys):
-        """Test cmd_validate with --json outputs valid JSON."""
-        hooks_manager.args.json = True
+    def test_cmd_validate_json_output(self, hooks_manager, json_payloads):
+        """Test cmd_validate with --json emits the validation summary."""
+        hooks_manager.json_out = True
         hooks_manager.cmd_validate()
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data, = json_payloads
 
-        assert "valid" in data
-        assert "hooks_count" in data
-        assert data["valid"] is True
+        assert_json_shape(data, {"hooks_count"}, valid=True, enabled_count=3)
+        assert data["disabled_count"] == data["hooks_count"] - 3
 
 
 class TestHooksManagerEnableDisable:
     """Tests for enable/disable operations."""
 
-    def test_cmd_enable_disabled_hook(self, hooks_manager, tmp_path, sample_settings):
-        """Test enabling a disabled hook."""
-        # Setup settings file for saving
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-        hooks_manager.settings_path = settings_file
-
-        hooks_manager.args.name = "slow-tests"
-        result = hooks_manager.cmd_enable()
-
-        assert result == 0
-
-        # Verify hook moved to enabled
-        assert "slow-tests" in str(hooks_manager.settings.get("hooks", {}))
-
-    def test_cmd_enable_already_enabled(self, hooks_manager, capsys):
-        """Test enabling an already enabled hook."""
-        hooks_manager.args.name = "lint"
-        result = hooks_manager.cmd_enable()
-
-        assert result == 0
-        captured = capsys.readouterr()
-        assert "already enabled" in captured.out
-
-    def test_cmd_disable_enabled_hook(self, hooks_manager, tmp_path, sample_settings):
-        """Test disabling an enabled hook."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-        hooks_manager.settings_path = settings_file
-
-        hooks_manager.args.name = "lint"
-        result = hooks_manager.cmd_disable()
-
-        assert result == 0
-
-    def test_cmd_disable_already_disabled(self, hooks_manager, capsys):
-        """Test disabling an already disabled hook."""
-        hooks_manager.args.name = "slow-tests"
-        result = hooks_manager.cmd_disable()
-
-        assert result == 0
-        captured = capsys.readouterr()
-        assert "already disabled" in captured.out
-
-    def test_cmd_enable_nonexistent(self, hooks_manager):
-        """Test enabling non-existent hook returns error."""
-        hooks_manager.args.name = "nonexistent"
-        result = hooks_manager.cmd_enable()
-
-        assert result == 1
-
-    def test_cmd_disable_nonexistent(self, hooks_manager):
-        """Test disabling non-existent hook returns error."""
-        hooks_manager.args.name = "nonexistent"
-        result = hooks_manager.cmd_disable()
-
-        assert result == 1
-
-    def test_cmd_enable_all(self, hooks_manager, tmp_path, sample_settings):
+    @pytest.mark.parametrize("method,name,expected_rc,expected_out", [
+        ("cmd_enable", "slow-tests", 0, None),
+        ("cmd_enable", "lint", 0, "already enabled"),
+        ("cmd_enable", "nonexistent", 1, None),
+        ("cmd_disable", "lint", 0, None),
+        ("cmd_disable", "slow-tests", 0, "already disabled"),
+        ("cmd_disable", "nonexistent", 1, None),
+    ], ids=[
+        "enable-disabled", "enable-already-enabled", "enable-nonexistent",
+        "disable-enabled", "disable-already-disabled", "disable-nonexistent",
+    ])
+    def test_cmd_enable_disable(self, hooks_manager, method, name, expected_rc, expected_out):
+        """Test enable/disable move the named hook, report no-ops and reject unknown names."""
+        hooks_manager.args.name = name
+        with redirect_stdout(StringIO()) as out:
+            result = getattr(hooks_manager, method)()
+
+        assert result == expected_rc
+        if expected_out:
+            assert expected_out in out.getvalue()
+        if expected_rc == 0:
+            # Verify the hook ended up in the requested state
+            hooks = hooks_manager._find_hooks_by_name(name)
+            assert [h.enabled for h in hooks] == [method == "cmd_enable"]
+
+    def test_cmd_enable_all(self, hooks_manager):
         """Test enabling all disabled hooks."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-        hooks_manager.settings_path = settings_file
-
         result = hooks_manager.cmd_enable_all()
 
         assert result == 0
         # Verify no disabled hooks remain
         assert hooks_manager.settings.get("_disabled_hooks", {}) == {}
 
-    def test_cmd_disable_all(self, hooks_manager, tmp_path, sample_settings):
+    def test_cmd_disable_all(self, hooks_manager):
         """Test disabling all enabled hooks."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-        hooks_manager.settings_path = settings_file
-
         result = hooks_manager.cmd_disable_all()
 
         assert result == 0
@@ -297,13 +324,8 @@ class TestHooksManagerEnableDisable:
 class TestHooksManagerAddRemove:
     """Tests for add/remove operations."""
 
-    def test_cmd_add_with_all_params(self, hooks_manager, tmp_path, sample_settings):
+    def test_cmd_add_with_all_params(self, hooks_manager):
         """Test adding a hook with all required parameters."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-        hooks_manager.settings_path = settings_file
-
         hooks_manager.args.hook_name = "new-hook"
         hooks_manager.args.event = "PostToolUse"
         hooks_manager.args.hook_command = "echo hello"
@@ -318,33 +340,31 @@ class TestHooksManagerAddRemove:
         hooks = hooks_manager._find_hooks_by_name("new-hook")
         assert len(hooks) == 1
 
-    def test_cmd_add_duplicate_name_fails(self, hooks_manager):
-        """Test adding a hook with duplicate name fails."""
-        hooks_manager.args.hook_name = "lint"  # Already exists
-        hooks_manager.args.event = "PostToolUse"
-        hooks_manager.args.hook_command = "echo test"
+    def test_cmd_add_event_case_insensitive(self, hooks_manager):
+        """Test the event type is canonicalized regardless of case."""
+        hooks_manager.args.hook_name = "new-hook"
+        hooks_manager.args.event = "posttooluse"
+        hooks_manager.args.hook_command = "echo hello"
 
-        result = hooks_manager.cmd_add()
+        assert hooks_manager.cmd_add() == 0
 
-        assert result == 1
+        hooks = hooks_manager._find_hooks_by_name("new-hook")
+        assert hooks[0].event == "PostToolUse"
 
-    def test_cmd_add_invalid_event_fails(self, hooks_manager):
-        """Test adding a hook with invalid event type fails."""
-        hooks_manager.args.hook_name = "new-hook"
-        hooks_manager.args.event = "InvalidEvent"
+    @pytest.mark.parametrize("hook_name,event", [
+        ("lint", "PostToolUse"),
+        ("new-hook", "InvalidEvent"),
+    ], ids=["duplicate-name", "invalid-event"])
+    def test_cmd_add_rejects(self, hooks_manager, hook_name, event):
+        """Test adding a hook with a duplicate name or invalid event type fails."""
+        hooks_manager.args.hook_name = hook_name
+        hooks_manager.args.event = event
         hooks_manager.args.hook_command = "echo test"
 
-        result = hooks_manager.cmd_add()
-
-        assert result == 1
+        assert hooks_manager.cmd_add() == 1
 
-    def test_cmd_remove_existing_hook(self, hooks_manager, tmp_path, sample_settings):
+    def test_cmd_remove_existing_hook(self, hooks_manager):
         """Test removing an existing hook."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-        hooks_manager.settings_path = settings_file
-
         hooks_manager.args.name = "lint"
         result = hooks_manager.cmd_remove()
 
@@ -354,6 +374,27 @@ class TestHooksManagerAddRemove:
         hooks = hooks_manager._find_hooks_by_name("lint")
         assert len(hooks) == 0
 
+    def test_cmd_remove_uses_recorded_index(self, hooks_manager):
+        """Test removing a hook pops the entry at its recorded index."""
+        format_hook = hooks_manager._find_hooks_by_name("format")[0]
+        assert format_hook.index == 1
+
+        hooks_manager.args.name = "format"
+        assert hooks_manager.cmd_remove() == 0
+
+        remaining = hooks_manager.settings["hooks"]["PostToolUse"]
+        assert [h["_name"] for h in remaining] == ["lint"]
+
+    def test_pop_hook_with_stale_index_matches_by_name(self, hooks_manager):
+        """Test _pop_hook falls back to a name match when the index is stale."""
+        lint_hook = hooks_manager._find_hooks_by_name("lint")[0]
+        hooks_manager.settings["hooks"]["PostToolUse"].insert(0, {"_name": "new"})
+
+        hooks_manager._pop_hook(hooks_manager.settings["hooks"], lint_hook)
+
+        remaining = hooks_manager.settings["hooks"]["PostToolUse"]
+        assert [h["_name"] for h in remaining] == ["new", "format"]
+
     def test_cmd_remove_nonexistent(self, hooks_manager):
         """Test removing non-existent hook returns error."""
         hooks_manager.args.name = "nonexistent"
@@ -361,13 +402,8 @@ class TestHooksManagerAddRemove:
 
         assert result == 1
 
-    def test_cmd_remove_all(self, hooks_manager, tmp_path, sample_settings):
+    def test_cmd_remove_all(self, hooks_manager):
         """Test removing all hooks."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        settings_file.write_text(json.dumps(sample_settings, indent=2))
-        hooks_manager.settings_path = settings_file
-
         result = hooks_manager.cmd_remove_all()
 
         assert result == 0
@@ -380,18 +416,26 @@ class TestHooksManagerAddRemove:
 class TestHooksManagerExportImport:
     """Tests for export/import operations."""
 
-    def test_cmd_export_to_stdout(self, hooks_manager, capsys):
+    def test_cmd_export_to_stdout(self, hooks_manager, json_payloads):
         """Test exporting hooks to stdout."""
         hooks_manager.args.file = None
         result = hooks_manager.cmd_export()
 
         assert result == 0
 
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
+        data, = json_payloads
+
+        assert_json_shape(data, {"version", "hooks"})
+
+    def test_cmd_export_to_stdout_non_ascii(self, hooks_manager, capsys):
+        """Test exporting to stdout keeps non-ASCII hook names intact."""
+        hooks_manager.settings["hooks"]["Stop"] = [{"_name": "café", "hooks": []}]
+        hooks_manager.args.file = None
 
-        assert "version" in data
-        assert "hooks" in data
+        assert hooks_manager.cmd_export() == 0
+
+        data = _json_loads(capsys.readouterr().out)
+        assert data["hooks"]["Stop"][0]["_name"] == "café"
 
     def test_cmd_export_to_file(self, hooks_manager, tmp_path):
         """Test exporting hooks to a file."""
@@ -403,16 +447,10 @@ class TestHooksManagerExportImport:
         assert result == 0
         assert export_file.exists()
 
-        data = json.loads(export_file.read_text())
-        assert "hooks" in data
+        assert_json_shape(export_file.read_bytes(), {"hooks"})
 
-    def test_cmd_import_valid_file(self, hooks_manager, tmp_path, sample_settings):
+    def test_cmd_import_valid_file(self, hooks_manager, tmp_path):
         """Test importing hooks from a valid file."""
-        # Create settings file
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        settings_file.write_text(json.dumps({"hooks": {}, "_disabled_hooks": {}}, indent=2))
-        hooks_manager.settings_path = settings_file
         hooks_manager.settings = {"hooks": {}, "_disabled_hooks": {}}
 
         # Create import file
@@ -426,13 +464,52 @@ class TestHooksManagerExportImport:
             "_disabled_hooks": {}
         }
         import_file = tmp_path / "import.json"
-        import_file.write_text(json.dumps(import_data, indent=2))
+        import_file.write_bytes(_json_dumps(import_data, compact=True))
 
         hooks_manager.args.file = str(import_file)
         result = hooks_manager.cmd_import()
 
         assert result == 0
 
+    def test_cmd_import_force_without_tty(self, hooks_manager, tmp_path):
+        """Test --force imports and saves even when stdin cannot answer a prompt."""
+        import_file = tmp_path / "import.json"
+        import_file.write_bytes(_json_dumps({"hooks": {"Stop": [{"_name": "s", "hooks": []}]}}, compact=True))
+        hooks_manager.args.file = str(import_file)
+        hooks_manager.is_stdin_tty = False
+
+        assert hooks_manager.cmd_import() == 0
+
+        assert len(hooks_manager._find_hooks_by_name("Stop:s")) == 1
+        assert "Stop" in _json_loads(hooks_manager.settings_path.read_bytes())["hooks"]
+
+    def test_cmd_import_large_keeps_indented_settings(self, hooks_manager, tmp_path):
+        """Test a large import still writes settings.json in the indented layout."""
+        import_file = tmp_path / "import.json"
+        stop_hooks = [{"_name": f"s{i}", "hooks": []} for i in range(1000)]
+        import_file.write_bytes(_json_dumps({"hooks": {"Stop": stop_hooks}}, compact=True))
+        hooks_manager.args.file = str(import_file)
+
+        assert hooks_manager.cmd_import() == 0
+
+        content = hooks_manager.settings_path.read_bytes()
+        assert content.startswith(b'{\n  "hooks": {')
+        assert len(_json_loads(content)["hooks"]["Stop"]) == 1000
+
+    def test_merge_hook_lists(self):
+        """Test _merge_hook_lists appends per event and copies into empty targets."""
+        new = {"Stop": [{"_name": "a"}], "PreToolUse": [{"_name": "b"}]}
+
+        empty = {}
+        HooksManager._merge_hook_lists(empty, new)
+        assert empty == new
+        assert empty["Stop"] is not new["Stop"]
+
+        target = {"Stop": [{"_name": "x"}]}
+        HooksManager._merge_hook_lists(target, new)
+        assert [h["_name"] for h in target["Stop"]] == ["x", "a"]
+        assert target["PreToolUse"] == [{"_name": "b"}]
+
     def test_cmd_import_nonexistent_file(self, hooks_manager, tmp_path):
         """Test importing from non-existent file fails."""
         hooks_manager.args.file = str(tmp_path / "nonexistent.json")
@@ -443,7 +520,7 @@ class TestHooksManagerExportImport:
     def test_cmd_import_invalid_json(self, hooks_manager, tmp_path):
         """Test importing invalid JSON fails."""
         import_file = tmp_path / "invalid.json"
-        import_file.write_text("not valid json")
+        import_file.write_bytes(b"not valid json")
 
         hooks_manager.args.file = str(import_file)
         result = hooks_manager.cmd_import()
@@ -454,35 +531,27 @@ class TestHooksManagerExportImport:
 class TestHooksManagerDryRun:
     """Tests for dry-run mode."""
 
-    def test_enable_dry_run_no_changes(self, hooks_manager, tmp_path, sample_settings):
+    def test_enable_dry_run_no_changes(self, hooks_manager, serialized_sample):
         """Test that dry-run mode doesn't modify settings."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        original_content = json.dumps(sample_settings, indent=2)
-        settings_file.write_text(original_content)
-        hooks_manager.settings_path = settings_file
+        settings_file = hooks_manager.settings_path
 
-        hooks_manager.args.dry_run = True
+        hooks_manager.dry_run = True
         hooks_manager.args.name = "slow-tests"
         hooks_manager.cmd_enable()
 
         # File should be unchanged
-        assert settings_file.read_text() == original_content
+        assert settings_file.read_bytes() == serialized_sample
 
-    def test_disable_dry_run_no_changes(self, hooks_manager, tmp_path, sample_settings):
+    def test_disable_dry_run_no_changes(self, hooks_manager, serialized_sample):
         """Test that dry-run mode doesn't modify settings."""
-        settings_file = tmp_path / ".claude" / "settings.json"
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-        original_content = json.dumps(sample_settings, indent=2)
-        settings_file.write_text(original_content)
-        hooks_manager.settings_path = settings_file
+        settings_file = hooks_manager.settings_path
 
-        hooks_manager.args.dry_run = True
+        hooks_manager.dry_run = True
         hooks_manager.args.name = "lint"
         hooks_manager.cmd_disable()
 
         # File should be unchanged
-        assert settings_file.read_text() == original_content
+        assert settings_file.read_bytes() == serialized_sample
 
 
 class TestHooksManagerUtilities:
@@ -494,6 +563,13 @@ class TestHooksManagerUtilities:
         assert hooks_manager._normalize_name("TeSt") == "test"
         assert hooks_manager._normalize_name("test") == "test"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_hook_info_uses_slots(self, sample_hook_info):
+        """Test that HookInfo instances have no per-instance __dict__."""
+        assert not hasattr(sample_hook_info, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_hook_info.extra = True
+
     def test_get_hook_name_with_name(self, hooks_manager):
         """Test _get_hook_name with explicit name."""
         hook = {"_name": "my-hook"}
@@ -519,3 +595,113 @@ class TestHooksManagerUtilities:
         result = hooks_manager._color("test", Colors.GREEN)
         assert result == "test"
         assert Colors.GREEN not in result
+
+    def test_save_settings_round_trip(self, hooks_manager):
+        """Test _save_settings writes JSON that _load_settings reads back."""
+        hooks_manager._save_settings()
+
+        content = hooks_manager.settings_path.read_bytes()
+        assert content.endswith(b"}\n")
+        assert hooks_manager._load_settings() == hooks_manager.settings
+
+    def test_save_settings_keeps_previous_as_backup(self, hooks_manager):
+        """Test _save_settings keeps the old contents in .bak and leaves no temp file."""
+        settings_file = hooks_manager.settings_path
+        original = settings_file.read_bytes()
+        hooks_manager.no_backup = False
+
+        hooks_manager.settings["hooks"]["Stop"] = []
+        hooks_manager._save_settings()
+
+        assert settings_file.with_suffix(".json.bak").read_bytes() == original
+        assert not settings_file.with_suffix(".json.tmp").exists()
+        assert "Stop" in _json_loads(settings_file.read_bytes())["hooks"]
+
+    def test_save_settings_writes_through_symlink(self, hooks_manager, tmp_path):
+        """Test a symlinked settings.json stays a link and its target is updated in place."""
+        link = hooks_manager.settings_path
+        target = tmp_path / "dotfiles" / "settings.json"
+        target.parent.mkdir()
+        original = link.read_bytes()
+        target.write_bytes(original)
+        target.chmod(0o600)
+        link.unlink()
+        link.symlink_to(target)
+        hooks_manager.no_backup = False
+
+        hooks_manager.settings["hooks"]["Stop"] = []
+        hooks_manager._save_settings()
+
+        backup = link.with_suffix(".json.bak")
+        assert link.is_symlink() and link.resolve() == target
+        assert "Stop" in _json_loads(target.read_bytes())["hooks"]
+        assert target.stat().st_mode & 0o777 == 0o600
+        assert not backup.is_symlink()
+        assert backup.read_bytes() == original
+        assert not target.with_name("settings.json.tmp").exists()
+
+    def test_save_settings_removes_temp_file_on_failure(self, hooks_manager, monkeypatch):
+        """Test a failed save leaves settings.json untouched and no temp file behind."""
+        settings_file = hooks_manager.settings_path
+        original = settings_file.read_bytes()
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(hooks_manager_module.os, "replace", fail)
+        hooks_manager.settings["hooks"]["Stop"] = []
+        with pytest.raises(OSError):
+            hooks_manager._save_settings()
+
+        assert settings_file.read_bytes() == original
+        assert not settings_file.with_suffix(".json.tmp").exists()
+
+    def test_save_settings_skips_unchanged(self, hooks_manager):
+        """Test a second save with identical content does not touch the file."""
+        settings_file = hooks_manager.settings_path
+        hooks_manager.no_backup = False
+
+        hooks_manager._save_settings()
+        backup = settings_file.with_suffix(".json.bak")
+        backup.unlink()
+        mtime = settings_file.stat().st_mtime_ns
+
+        hooks_manager._save_settings()
+
+        assert not backup.exists()
+        assert settings_file.stat().st_mtime_ns == mtime
+
+
+class TestJsonHelpers:
+    """Tests for the JSON load/dump helpers."""
+
+    def test_dumps_matches_stdlib_format(self, sample_settings):
+        """Test serialized output matches json.dumps(indent=2)."""
+        expected = json.dumps(sample_settings, indent=2, ensure_ascii=False)
+        assert _json_dumps(sample_settings).decode('utf-8') == expected
+
+    def test_dumps_keeps_non_ascii(self):
+        """Test non-ASCII characters are written as UTF-8, not escaped."""
+        assert _json_dumps({"name": "café"}) == '{\n  "name": "café"\n}'.encode('utf-8')
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps_compact(self, monkeypatch, use_orjson):
+        """Test compact output has no whitespace with either backend."""
+        if not use_orjson:
+            monkeypatch.setattr(hooks_manager_module, 'orjson', None)
+        elif hooks_manager_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        assert _json_dumps({"a": [1, 2], "b": "é"}, compact=True) == '{"a":[1,2],"b":"é"}'.encode('utf-8')
+
+    def test_stdlib_fallback(self, monkeypatch, sample_settings):
+        """Test helpers work when orjson is not installed."""
+        monkeypatch.setattr(hooks_manager_module, 'orjson', None)
+
+        data = _json_dumps(sample_settings)
+        assert _json_loads(data) == sample_settings
+
+    def test_loads_invalid_json_raises_decode_error(self):
+        """Test invalid JSON raises json.JSONDecodeError with either backend."""
+        with pytest.raises(json.JSONDecodeError):
+            _json_loads(b"not valid json")
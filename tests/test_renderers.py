@@ -1,18 +1,33 @@
 """Tests for renderer classes."""
 
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# hooks_manager and renderers are importable via the sys.path entry tests/conftest.py adds
 
-from hooks_manager import ExtensionsData, SkillInfo, CommandInfo, HookInfo, Colors
+from hooks_manager import ExtensionsData, SkillInfo, HookInfo, Colors
 from renderers import TerminalRenderer, HTMLRenderer, MarkdownRenderer
 from renderers.base import BaseRenderer
 
 
+def assert_all_in(text, needles):
+    """Assert every needle occurs in text, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing: {missing}"
+
+
+# Session renderer fixtures from conftest, one cell per output format
+RENDERERS = [
+    pytest.param("terminal_renderer_nocolor", id="terminal"),
+    pytest.param("html_renderer", id="html"),
+    pytest.param("markdown_renderer", id="markdown"),
+]
+
+
 class TestBaseRenderer:
     """Tests for BaseRenderer abstract class."""
 
@@ -21,19 +36,44 @@ class TestBaseRenderer:
         with pytest.raises(TypeError):
             BaseRenderer()
 
-    def test_render_to_file(self, tmp_path, sample_extensions_data):
+    def test_render_to_file(self, terminal_renderer_nocolor, tmp_path, sample_extensions_data):
         """Test render_to_file writes content to file."""
         # Use a concrete implementation
-        renderer = TerminalRenderer(use_color=False)
         output_file = tmp_path / "output.txt"
 
-        renderer.render_to_file(sample_extensions_data, output_file)
+        terminal_renderer_nocolor.render_to_file(sample_extensions_data, output_file)
 
         assert output_file.exists()
         content = output_file.read_text()
         assert "Claude Code Extensions" in content
 
 
+class TestRenderersPackage:
+    """Tests for the renderers package namespace."""
+
+    def test_renderers_are_imported_lazily(self):
+        """Test importing one renderer does not import the others."""
+        code = (
+            "import sys, renderers; "
+            "from renderers import TerminalRenderer; "
+            "print(sorted(m for m in sys.modules if m.startswith('renderers.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, cwd=Path(__file__).parent.parent
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "['renderers.base', 'renderers.terminal']"
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names raise AttributeError."""
+        import renderers
+
+        with pytest.raises(AttributeError):
+            renderers.PDFRenderer
+
+
 class TestTerminalRenderer:
     """Tests for TerminalRenderer class."""
 
@@ -47,66 +87,44 @@ class TestTerminalRenderer:
         renderer = TerminalRenderer(use_color=False)
         assert renderer.use_color is False
 
-    def test_render_returns_string(self, sample_extensions_data):
+    def test_render_returns_string(self, rendered_terminal):
         """Test render returns a string."""
-        renderer = TerminalRenderer(use_color=False)
-        result = renderer.render(sample_extensions_data)
+        assert isinstance(rendered_terminal, str)
+        assert len(rendered_terminal) > 0
 
-        assert isinstance(result, str)
-        assert len(result) > 0
-
-    def test_render_includes_header(self, sample_extensions_data):
+    def test_render_includes_header(self, rendered_terminal):
         """Test render includes header."""
-        renderer = TerminalRenderer(use_color=False)
-        result = renderer.render(sample_extensions_data)
-
-        assert "Claude Code Extensions" in result
-
-    def test_render_includes_sections(self, sample_extensions_data):
-        """Test render includes all sections."""
-        renderer = TerminalRenderer(use_color=False)
-        result = renderer.render(sample_extensions_data)
-
-        assert "Skills" in result
-        assert "Commands" in result
-        assert "Hooks" in result
+        assert "Claude Code Extensions" in rendered_terminal
 
-    def test_render_empty_data(self):
+    def test_render_empty_data(self, terminal_renderer_nocolor):
         """Test render with empty data."""
-        renderer = TerminalRenderer(use_color=False)
         empty_data = ExtensionsData(skills=[], commands=[], hooks=[])
-        result = renderer.render(empty_data)
+        result = terminal_renderer_nocolor.render(empty_data)
 
         assert "(none)" in result
 
-    def test_render_skill_info(self, sample_skill_info):
+    def test_render_skill_info(self, terminal_renderer_nocolor, sample_skill_info):
         """Test rendering skill information."""
-        renderer = TerminalRenderer(use_color=False)
         data = ExtensionsData(skills=[sample_skill_info], commands=[], hooks=[])
-        result = renderer.render(data)
+        result = terminal_renderer_nocolor.render(data)
 
-        assert sample_skill_info.name in result
-        assert sample_skill_info.description in result
+        assert_all_in(result, (sample_skill_info.name, sample_skill_info.description))
 
-    def test_render_command_info(self, sample_command_info):
+    def test_render_command_info(self, terminal_renderer_nocolor, sample_command_info):
         """Test rendering command information."""
-        renderer = TerminalRenderer(use_color=False)
         data = ExtensionsData(skills=[], commands=[sample_command_info], hooks=[])
-        result = renderer.render(data)
+        result = terminal_renderer_nocolor.render(data)
 
         assert f"/{sample_command_info.name}" in result
 
-    def test_render_hook_info(self, sample_hook_info):
+    def test_render_hook_info(self, terminal_renderer_nocolor, sample_hook_info):
         """Test rendering hook information."""
-        renderer = TerminalRenderer(use_color=False)
         data = ExtensionsData(skills=[], commands=[], hooks=[sample_hook_info])
-        result = renderer.render(data)
+        result = terminal_renderer_nocolor.render(data)
 
-        assert sample_hook_info.name in result
-        assert sample_hook_info.event in result
-        assert "enabled" in result
+        assert_all_in(result, (sample_hook_info.name, sample_hook_info.event, "enabled"))
 
-    def test_render_disabled_hook(self, tmp_path):
+    def test_render_disabled_hook(self, terminal_renderer_nocolor):
         """Test rendering disabled hook."""
         disabled_hook = HookInfo(
             name="disabled-hook",
@@ -116,9 +134,8 @@ class TestTerminalRenderer:
             commands=[],
             raw={}
         )
-        renderer = TerminalRenderer(use_color=False)
         data = ExtensionsData(skills=[], commands=[], hooks=[disabled_hook])
-        result = renderer.render(data)
+        result = terminal_renderer_nocolor.render(data)
 
         assert "disabled" in result
 
@@ -130,89 +147,90 @@ class TestTerminalRenderer:
         # Should contain ANSI escape codes
         assert "\033[" in result
 
-    def test_color_not_applied_when_disabled(self, sample_extensions_data):
+    def test_color_not_applied_when_disabled(self, rendered_terminal):
         """Test that ANSI codes are not included when color is disabled."""
-        renderer = TerminalRenderer(use_color=False)
-        result = renderer.render(sample_extensions_data)
-
         # Should not contain ANSI escape codes
-        assert "\033[" not in result
+        assert "\033[" not in rendered_terminal
 
-    def test_tree_characters(self, sample_extensions_data):
-        """Test tree drawing characters are present."""
+    def test_use_color_toggle_after_init(self, sample_extensions_data):
+        """Test changing use_color after construction switches coloring."""
         renderer = TerminalRenderer(use_color=False)
-        result = renderer.render(sample_extensions_data)
+        renderer.use_color = True
+
+        assert "\033[" in renderer.render(sample_extensions_data)
 
+        renderer.use_color = False
+        assert "\033[" not in renderer.render(sample_extensions_data)
+
+    def test_tree_characters(self, rendered_terminal):
+        """Test tree drawing characters are present."""
         # Should contain tree characters
-        assert "├" in result or "└" in result
+        assert "├" in rendered_terminal or "└" in rendered_terminal
 
 
 class TestHTMLRenderer:
     """Tests for HTMLRenderer class."""
 
-    def test_render_returns_html(self, sample_extensions_data):
+    def test_render_returns_html(self, rendered_html):
         """Test render returns valid HTML structure."""
-        renderer = HTMLRenderer()
-        result = renderer.render(sample_extensions_data)
+        assert rendered_html.startswith("<!DOCTYPE html>")
+        assert_all_in(rendered_html, ("<html", "</html>"))
 
-        assert result.startswith("<!DOCTYPE html>")
-        assert "<html" in result
-        assert "</html>" in result
+    def test_escape_matches_html_escape(self, html_renderer):
+        """Test _escape produces the same output as html.escape."""
+        import html
 
-    def test_render_includes_sections(self, sample_extensions_data):
-        """Test render includes all sections."""
-        renderer = HTMLRenderer()
-        result = renderer.render(sample_extensions_data)
+        text = """<a href="x">Tom & Jerry's</a>"""
+        assert html_renderer._escape(text) == html.escape(text)
+        assert html_renderer._escape(42) == "42"
 
-        assert "Skills" in result
-        assert "Commands" in result
-        assert "Hooks" in result
+    def test_get_css_override_is_used(self, sample_extensions_data):
+        """Test subclasses overriding _get_css replace the embedded styles."""
+        class PlainHTMLRenderer(HTMLRenderer):
+            def _get_css(self):
+                return "body { color: red; }"
 
-    def test_render_includes_css(self, sample_extensions_data):
-        """Test render includes embedded CSS."""
-        renderer = HTMLRenderer()
-        result = renderer.render(sample_extensions_data)
+        result = PlainHTMLRenderer().render(sample_extensions_data)
 
-        assert "<style>" in result
-        assert "</style>" in result
+        assert "body { color: red; }" in result
+        assert "--bg-primary" not in result
 
-    def test_render_includes_javascript(self, sample_extensions_data):
-        """Test render includes JavaScript for collapsible sections."""
-        renderer = HTMLRenderer()
-        result = renderer.render(sample_extensions_data)
+    def test_render_includes_css(self, rendered_html):
+        """Test render includes embedded CSS."""
+        assert_all_in(rendered_html, ("<style>", "</style>"))
 
-        assert "<script>" in result
-        assert "toggleSection" in result
+    def test_render_includes_javascript(self, rendered_html):
+        """Test render includes JavaScript for collapsible sections."""
+        assert_all_in(rendered_html, ("<script>", "toggleSection"))
 
-    def test_render_empty_data(self):
+    def test_render_empty_data(self, html_renderer):
         """Test render with empty data."""
-        renderer = HTMLRenderer()
         empty_data = ExtensionsData(skills=[], commands=[], hooks=[])
-        result = renderer.render(empty_data)
+        result = html_renderer.render(empty_data)
 
-        assert "No skills configured" in result
-        assert "No commands configured" in result
-        assert "No hooks configured" in result
+        assert_all_in(result, (
+            "No skills configured",
+            "No commands configured",
+            "No hooks configured",
+        ))
 
-    def test_render_escapes_html(self, tmp_path):
+    def test_render_escapes_html(self, html_renderer, scratch_dir):
         """Test that HTML special characters are escaped."""
         skill = SkillInfo(
             name="<malicious>alert('xss')</malicious>",
             description="Test & <dangerous> \"quotes\"",
             triggers=["<tag>"],
-            path=tmp_path / "skill.md"
+            path=scratch_dir / "skill.md"
         )
-        renderer = HTMLRenderer()
         data = ExtensionsData(skills=[skill], commands=[], hooks=[])
-        result = renderer.render(data)
+        result = html_renderer.render(data)
 
         # Should escape dangerous characters in user content
         # Note: <script> appears in the JS code, so we use <malicious> to test
         assert "<malicious>" not in result  # Should be escaped
-        assert "&lt;malicious&gt;" in result
-        assert "&amp;" in result
+        assert_all_in(result, ("&lt;malicious&gt;", "&amp;"))
 
-    def test_render_hook_status_classes(self, tmp_path):
+    def test_render_hook_status_classes(self, html_renderer):
         """Test enabled/disabled hooks have correct CSS classes."""
         enabled_hook = HookInfo(
             name="enabled", event="PostToolUse", enabled=True,
@@ -222,83 +240,55 @@ class TestHTMLRenderer:
             name="disabled", event="PostToolUse", enabled=False,
             matcher="*", commands=[], raw={}
         )
-        renderer = HTMLRenderer()
         data = ExtensionsData(skills=[], commands=[], hooks=[enabled_hook, disabled_hook])
-        result = renderer.render(data)
+        result = html_renderer.render(data)
 
-        assert "status-enabled" in result
-        assert "status-disabled" in result
+        assert_all_in(result, ("status-enabled", "status-disabled"))
 
-    def test_render_dark_mode_support(self, sample_extensions_data):
+    def test_render_dark_mode_support(self, rendered_html):
         """Test CSS includes dark mode support."""
-        renderer = HTMLRenderer()
-        result = renderer.render(sample_extensions_data)
+        assert "prefers-color-scheme" in rendered_html
 
-        assert "prefers-color-scheme" in result
-
-    def test_render_collapsible_sections(self, sample_extensions_data):
+    def test_render_collapsible_sections(self, rendered_html):
         """Test sections are collapsible."""
-        renderer = HTMLRenderer()
-        result = renderer.render(sample_extensions_data)
-
-        assert "collapsible" in result
-        assert "aria-expanded" in result
+        assert_all_in(rendered_html, ("collapsible", "aria-expanded"))
 
 
 class TestMarkdownRenderer:
     """Tests for MarkdownRenderer class."""
 
-    def test_render_returns_markdown(self, sample_extensions_data):
+    def test_render_returns_markdown(self, rendered_markdown):
         """Test render returns valid markdown."""
-        renderer = MarkdownRenderer()
-        result = renderer.render(sample_extensions_data)
-
         # Should start with header
-        assert result.startswith("# Claude Code Extensions")
-
-    def test_render_includes_sections(self, sample_extensions_data):
-        """Test render includes all sections."""
-        renderer = MarkdownRenderer()
-        result = renderer.render(sample_extensions_data)
+        assert rendered_markdown.startswith("# Claude Code Extensions")
 
-        assert "## Skills" in result
-        assert "## Commands" in result
-        assert "## Hooks" in result
-
-    def test_render_includes_tables(self, sample_extensions_data):
+    def test_render_includes_tables(self, rendered_markdown):
         """Test render includes markdown tables."""
-        renderer = MarkdownRenderer()
-        result = renderer.render(sample_extensions_data)
-
         # Table header separators
-        assert "|---" in result
+        assert "|---" in rendered_markdown
 
-    def test_render_empty_data(self):
+    def test_render_empty_data(self, markdown_renderer):
         """Test render with empty data."""
-        renderer = MarkdownRenderer()
         empty_data = ExtensionsData(skills=[], commands=[], hooks=[])
-        result = renderer.render(empty_data)
+        result = markdown_renderer.render(empty_data)
 
-        assert "*No skills found.*" in result
-        assert "*No commands found.*" in result
-        assert "*No hooks found.*" in result
+        assert_all_in(result, ("*No skills found.*", "*No commands found.*", "*No hooks found.*"))
 
-    def test_render_escapes_markdown_pipes(self, tmp_path):
+    def test_render_escapes_markdown_pipes(self, markdown_renderer, scratch_dir):
         """Test that pipe characters are escaped in tables."""
         skill = SkillInfo(
             name="test|skill",
             description="desc|with|pipes",
             triggers=["a|b"],
-            path=tmp_path / "skill.md"
+            path=scratch_dir / "skill.md"
         )
-        renderer = MarkdownRenderer()
         data = ExtensionsData(skills=[skill], commands=[], hooks=[])
-        result = renderer.render(data)
+        result = markdown_renderer.render(data)
 
         # Pipes should be escaped
         assert "\\|" in result
 
-    def test_render_hook_status_emoji(self, tmp_path):
+    def test_render_hook_status_emoji(self, markdown_renderer):
         """Test enabled/disabled hooks have status emoji."""
         enabled_hook = HookInfo(
             name="enabled", event="PostToolUse", enabled=True,
@@ -308,27 +298,22 @@ class TestMarkdownRenderer:
             name="disabled", event="PostToolUse", enabled=False,
             matcher="*", commands=[], raw={}
         )
-        renderer = MarkdownRenderer()
         data = ExtensionsData(skills=[], commands=[], hooks=[enabled_hook, disabled_hook])
-        result = renderer.render(data)
+        result = markdown_renderer.render(data)
 
-        assert "✅" in result  # Enabled
-        assert "⚠️" in result  # Disabled
+        # Enabled, then disabled
+        assert_all_in(result, ("✅", "⚠️"))
 
-    def test_render_command_slash_prefix(self, sample_command_info):
+    def test_render_command_slash_prefix(self, markdown_renderer, sample_command_info):
         """Test commands are prefixed with /."""
-        renderer = MarkdownRenderer()
         data = ExtensionsData(skills=[], commands=[sample_command_info], hooks=[])
-        result = renderer.render(data)
+        result = markdown_renderer.render(data)
 
         assert f"`/{sample_command_info.name}`" in result
 
-    def test_render_total_count(self, sample_extensions_data):
+    def test_render_total_count(self, rendered_markdown):
         """Test total extensions count is shown."""
-        renderer = MarkdownRenderer()
-        result = renderer.render(sample_extensions_data)
-
-        assert "**Total Extensions:**" in result
+        assert "**Total Extensions:**" in rendered_markdown
 
 
 class TestTUIRenderer:
@@ -370,6 +355,35 @@ class TestTUIRenderer:
         sections = renderer._get_sections()
         assert sections == []
 
+    def test_get_sections_rebuilt_only_when_data_changes(self, sample_extensions_data):
+        """Test _get_sections reuses its list until data is replaced."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        renderer.data = sample_extensions_data
+        sections = renderer._get_sections()
+
+        assert renderer._get_sections() is sections
+
+        renderer.data = ExtensionsData(skills=[], commands=[], hooks=[])
+        assert renderer._get_sections() is not sections
+
+    def test_item_caches_cleared_when_data_replaced(self, sample_extensions_data, sample_hook_info):
+        """Test rows and details cached for old items are dropped with the old data."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        renderer.data = sample_extensions_data
+        renderer._get_sections()
+        renderer._item_line(sample_hook_info, 80)
+        renderer._detail_cache[id(sample_hook_info)] = ["stale"]
+
+        renderer.data = ExtensionsData(skills=[], commands=[], hooks=[])
+        renderer._get_sections()
+
+        assert renderer._item_line_cache == {}
+        assert renderer._detail_cache == {}
+
     def test_format_skill_detail(self, sample_skill_info):
         """Test _format_skill_detail returns correct lines."""
         from renderers import TUIRenderer
@@ -377,10 +391,7 @@ class TestTUIRenderer:
         renderer = TUIRenderer()
         lines = renderer._format_skill_detail(sample_skill_info, 80)
 
-        assert any("Name:" in line for line in lines)
-        assert any("Description:" in line for line in lines)
-        assert any("Triggers:" in line for line in lines)
-        assert any("Path:" in line for line in lines)
+        assert_all_in("\n".join(lines), ("Name:", "Description:", "Triggers:", "Path:"))
 
     def test_format_command_detail(self, sample_command_info):
         """Test _format_command_detail returns correct lines."""
@@ -389,9 +400,7 @@ class TestTUIRenderer:
         renderer = TUIRenderer()
         lines = renderer._format_command_detail(sample_command_info, 80)
 
-        assert any("Command:" in line for line in lines)
-        assert any("Description:" in line for line in lines)
-        assert any("Path:" in line for line in lines)
+        assert_all_in("\n".join(lines), ("Command:", "Description:", "Path:"))
 
     def test_format_hook_detail(self, sample_hook_info):
         """Test _format_hook_detail returns correct lines."""
@@ -400,92 +409,204 @@ class TestTUIRenderer:
         renderer = TUIRenderer()
         lines = renderer._format_hook_detail(sample_hook_info, 80)
 
-        assert any("Name:" in line for line in lines)
-        assert any("Status:" in line for line in lines)
-        assert any("Event:" in line for line in lines)
-        assert any("Matcher:" in line for line in lines)
-        assert any("Commands" in line for line in lines)
+        assert_all_in("\n".join(lines), ("Name:", "Status:", "Event:", "Matcher:", "Commands"))
 
-    def test_render_returns_empty_string_on_error(self, sample_extensions_data):
+    def test_render_returns_empty_string_on_error(self, curses_wrapper_error, sample_extensions_data):
         """Test render returns empty string when curses fails."""
         from renderers import TUIRenderer
 
         renderer = TUIRenderer()
+        result = renderer.render(sample_extensions_data)
 
-        # Mock curses.wrapper to simulate curses.error
-        import curses
-        with patch('renderers.tui.curses.wrapper', side_effect=curses.error("curses error")):
-            result = renderer.render(sample_extensions_data)
-
+        assert curses_wrapper_error.called
         # Should handle error gracefully
         assert result == "" or "error" in result.lower()
 
+    def test_render_again_redraws_first_frame(self, sample_extensions_data):
+        """Test a second render() starts from a full repaint with the cursor clamped."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        renderer._last_state = (0, 0, 0, False, False, (24, 80))
+        renderer._pad_key = (0, 80)
+        renderer._list_view = (3, 0, 18, 79)
+        renderer.current_item = renderer.scroll_offset = 5
+        seen = []
+
+        with patch('renderers.tui.curses.wrapper',
+                   side_effect=lambda run: seen.append((renderer._last_state, renderer._pad_key))):
+            assert renderer.render(sample_extensions_data) == ""
+
+        assert seen == [(None, None)]
+        assert renderer._list_view is None
+        assert renderer.current_item == renderer.scroll_offset == 0
+
+    def test_draw_repaints_only_changed_rows(self, sample_extensions_data):
+        """Test _draw skips unchanged frames and redraws two pad rows on a selection move."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        second = SkillInfo(name="second", description="", triggers=[], path=Path("/tmp/second"))
+        renderer.data = ExtensionsData(skills=sample_extensions_data.skills + [second],
+                                       commands=sample_extensions_data.commands,
+                                       hooks=sample_extensions_data.hooks)
+        renderer.stdscr = MagicMock()
+        renderer.stdscr.getmaxyx.return_value = (24, 80)
+
+        with patch('renderers.tui.curses.doupdate') as doupdate, \
+                patch('renderers.tui.curses.newpad') as newpad, \
+                patch('renderers.tui.curses.color_pair', return_value=0):
+            renderer._draw()
+            assert renderer.stdscr.erase.call_count == 1
+            newpad.assert_called_once_with(3, 80)
+
+            renderer._draw()
+            assert doupdate.call_count == 1
+
+            renderer.current_item = 1
+            with patch.object(renderer, '_draw_item') as draw_item:
+                renderer._draw()
+
+        pad = newpad.return_value
+        assert renderer.stdscr.erase.call_count == 1
+        assert [(c.args[2], c.args[4]) for c in draw_item.call_args_list] == [(0, False), (1, True)]
+        assert pad.noutrefresh.call_args.args == (0, 0, 3, 0, 18, 79)
+        assert doupdate.call_count == 2
+
+    def test_scroll_only_moves_pad_viewport(self, sample_extensions_data):
+        """Test scrolling copies a different pad region without redrawing rows."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        renderer.data = sample_extensions_data
+        renderer.stdscr = MagicMock()
+        renderer.stdscr.getmaxyx.return_value = (24, 80)
+
+        with patch('renderers.tui.curses.doupdate'), \
+                patch('renderers.tui.curses.newpad') as newpad, \
+                patch('renderers.tui.curses.color_pair', return_value=0):
+            renderer._draw()
+            renderer.scroll_offset = 1
+            with patch.object(renderer, '_draw_item') as draw_item:
+                renderer._draw()
+
+        draw_item.assert_not_called()
+        assert newpad.return_value.noutrefresh.call_args.args[0] == 1
+        assert renderer.stdscr.noutrefresh.call_count == 1
+
+    def test_item_line_cached_per_width(self, sample_hook_info):
+        """Test _item_line reuses the fitted line until the width changes."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        line = renderer._item_line(sample_hook_info, 40)
+        text, color = line
+
+        assert len(text) == 38
+        assert "[ON]" in text
+        assert color == renderer.COLOR_ENABLED
+        assert renderer._item_line(sample_hook_info, 40) is line
+        assert len(renderer._item_line(sample_hook_info, 60)[0]) == 58
+
+    def test_item_line_default_color_for_skills(self, sample_skill_info):
+        """Test skills and commands use the default color pair."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        assert renderer._item_line(sample_skill_info, 80)[1] == 0
+
+    def test_fit_bar_centers_and_caches(self):
+        """Test header/footer bars are centered once per text."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        bar = renderer._fit_bar(" Help ", 41)
+
+        assert bar == " Help ".center(40)
+        assert renderer._fit_bar(" Help ", 41) is bar
+
+    def test_item_line_dispatches_by_type(self, sample_command_info):
+        """Test rows are formatted by the handler registered for the item type."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+
+        assert renderer._item_line(sample_command_info, 80)[0].startswith(
+            f"  /{sample_command_info.name}")
+        assert renderer._item_line("other", 80)[0].rstrip() == "  other"
+
+    def test_detail_lines_formatted_once(self, sample_extensions_data):
+        """Test _draw_detail formats an item's lines once and reuses them."""
+        from renderers import TUIRenderer
+
+        renderer = TUIRenderer()
+        renderer.data = sample_extensions_data
+        renderer.stdscr = MagicMock()
+        renderer.stdscr.getmaxyx.return_value = (24, 80)
+
+        with patch('renderers.tui.curses.color_pair', return_value=0), \
+                patch.object(renderer, '_format_skill_detail',
+                             wraps=renderer._format_skill_detail) as fmt:
+            renderer._draw_detail()
+            renderer._draw_detail()
+
+        assert fmt.call_count == 1
+
 
 class TestRendererIntegration:
     """Integration tests across renderers."""
 
-    def test_all_renderers_handle_empty_data(self):
+    @pytest.mark.parametrize("renderer_name", RENDERERS)
+    def test_all_renderers_handle_empty_data(self, request, renderer_name):
         """Test all renderers handle empty data gracefully."""
-        empty_data = ExtensionsData(skills=[], commands=[], hooks=[])
-
-        renderers = [
-            TerminalRenderer(use_color=False),
-            HTMLRenderer(),
-            MarkdownRenderer(),
-        ]
+        renderer = request.getfixturevalue(renderer_name)
+        result = renderer.render(ExtensionsData(skills=[], commands=[], hooks=[]))
 
-        for renderer in renderers:
-            result = renderer.render(empty_data)
-            assert isinstance(result, str)
-            assert len(result) > 0
+        assert isinstance(result, str)
+        assert len(result) > 0
 
-    def test_all_renderers_handle_large_data(self, tmp_path):
+    @pytest.mark.parametrize("renderer_name", RENDERERS)
+    def test_all_renderers_handle_large_data(self, request, renderer_name, large_extensions_data):
         """Test all renderers handle large amounts of data."""
-        # Create large dataset
-        skills = [
-            SkillInfo(name=f"skill-{i}", description=f"Description {i}",
-                      triggers=[f"trigger-{i}"], path=tmp_path / f"skill-{i}.md")
-            for i in range(50)
-        ]
-        commands = [
-            CommandInfo(name=f"cmd-{i}", description=f"Command {i}",
-                        path=tmp_path / f"cmd-{i}.md")
-            for i in range(50)
-        ]
-        hooks = [
-            HookInfo(name=f"hook-{i}", event="PostToolUse", enabled=i % 2 == 0,
-                     matcher="*", commands=[], raw={})
-            for i in range(50)
-        ]
-
-        data = ExtensionsData(skills=skills, commands=commands, hooks=hooks)
-
-        renderers = [
-            TerminalRenderer(use_color=False),
-            HTMLRenderer(),
-            MarkdownRenderer(),
-        ]
-
-        for renderer in renderers:
-            result = renderer.render(data)
-            assert isinstance(result, str)
-            # Should contain some of the items
-            assert "skill-0" in result
-            assert "cmd-0" in result
-            assert "hook-0" in result
-
-    def test_render_to_file_all_formats(self, tmp_path, sample_extensions_data):
+        renderer = request.getfixturevalue(renderer_name)
+        result = renderer.render(large_extensions_data)
+
+        assert isinstance(result, str)
+        # Should contain some of the items
+        assert_all_in(result, ("skill-0", "cmd-0", "hook-0"))
+
+    @pytest.mark.parametrize("renderer_name", RENDERERS)
+    def test_render_to_file_all_formats(self, request, renderer_name, tmp_path, sample_extensions_data):
         """Test render_to_file works for all renderers."""
-        renderers_and_files = [
-            (TerminalRenderer(use_color=False), "output.txt"),
-            (HTMLRenderer(), "output.html"),
-            (MarkdownRenderer(), "output.md"),
-        ]
-
-        for renderer, filename in renderers_and_files:
-            output_file = tmp_path / filename
-            renderer.render_to_file(sample_extensions_data, output_file)
-
-            assert output_file.exists()
-            content = output_file.read_text()
-            assert len(content) > 0
+        renderer = request.getfixturevalue(renderer_name)
+        output_file = tmp_path / "output"
+        renderer.render_to_file(sample_extensions_data, output_file)
+
+        assert output_file.exists()
+        content = output_file.read_text()
+        assert len(content) > 0
+
+    @pytest.mark.parametrize("rendered_name,heading", [
+        pytest.param("rendered_terminal", "", id="terminal"),
+        pytest.param("rendered_html", "", id="html"),
+        pytest.param("rendered_markdown", "## ", id="markdown"),
+    ])
+    def test_render_includes_sections(self, request, rendered_name, heading):
+        """Test render includes all sections."""
+        result = request.getfixturevalue(rendered_name)
+
+        assert_all_in(result, (f"{heading}Skills", f"{heading}Commands", f"{heading}Hooks"))
+
+    @pytest.mark.parametrize("renderer_cls", [TerminalRenderer, HTMLRenderer, MarkdownRenderer])
+    @pytest.mark.parametrize("empty", [False, True])
+    def test_render_stream_matches_render(self, renderer_cls, empty, tmp_path, sample_extensions_data):
+        """Test streamed output and file output are identical to render()."""
+        data = ExtensionsData() if empty else sample_extensions_data
+        renderer = renderer_cls(use_color=False)
+        expected = renderer.render(data)
+
+        assert "".join(renderer.render_stream(data)) == expected
+
+        output_file = tmp_path / "output"
+        renderer.render_to_file(data, output_file)
+        assert output_file.read_text(encoding="utf-8") == expected